@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from pptx import Presentation
+from pptx.util import Pt
+
+from mipptx.text import Color, FontModel, ParagraphModel, RunModel, TextFrameModel
+
+# Time and Python allocations per paragraph on the text write path:
+#
+#   round trip  `ParagraphModel(**para.model_dump())`, which `to_pptx` used to run
+#               for every paragraph before writing it; the cost it no longer pays
+#   to_pptx     `TextFrameModel.to_pptx` into a fresh python-pptx text box
+#   to_xml      `TextFrameModel.to_xml`, the text body string `TextBoxModel` parses
+#
+# Each step runs twice: untraced for the time, then under tracemalloc with its
+# result kept alive, for the blocks and bytes it allocates and holds (lxml's own
+# allocations are not traced) and the peak of its transient allocations.
+#
+#   PYTHONPATH=. python benchmarks/text_write.py [--paragraphs N] [--runs R]
+
+
+def _frame(paragraphs: int, runs: int) -> TextFrameModel:
+    fonts = [
+        None,
+        FontModel(name="Calibri", size_pt=10, bold=True),
+        FontModel(italic=True, color=Color(hex="#1f4e79")),
+    ]
+    return TextFrameModel(
+        paragraphs=[
+            ParagraphModel(
+                runs=[
+                    RunModel(text=f"clause {i}.{j} ", font=fonts[(i + j) % 3])
+                    for j in range(runs)
+                ],
+                space_after_pt=4,
+            )
+            for i in range(paragraphs)
+        ]
+    )
+
+
+def _text_frame():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return slide.shapes.add_textbox(0, 0, Pt(400), Pt(400)).text_frame
+
+
+def _measure(label: str, n: int, step) -> None:
+    t0 = time.perf_counter()
+    step()
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = step()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    stats = after.compare_to(before, "filename")
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+    print(
+        f"{label:<12} {elapsed / n * 1e6:8.1f} us/para"
+        f" {blocks / n:7.1f} blocks/para {size / n:8.0f} B/para"
+        f" peak {peak / 1024:8.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=3, help="runs per paragraph")
+    args = parser.parse_args()
+
+    tfm = _frame(args.paragraphs, args.runs)
+    n = len(tfm.paragraphs)
+    print(f"{n} paragraphs x {args.runs} runs")
+    # python-pptx imports and caches lazily; keep that out of the numbers
+    _frame(1, 1).to_pptx(_text_frame())
+
+    def round_trip():
+        return [ParagraphModel(**p.model_dump()) for p in tfm.paragraphs]
+
+    def to_pptx():
+        tf = _text_frame()
+        tfm.to_pptx(tf)
+        return tf
+
+    _measure("round trip", n, round_trip)
+    _measure("to_pptx", n, to_pptx)
+    _measure("to_xml", n, tfm.to_xml)
+
+
+if __name__ == "__main__":
+    main()
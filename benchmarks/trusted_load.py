@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+
+from mipptx.charts import ChartModel, XyChartDataModel, XyPoint, XySeriesModel
+from mipptx.presentation import PresentationModel
+from mipptx.shapes import TextBoxModel
+from mipptx.slide import SlideModel
+from mipptx.text import Color, FontModel, ParagraphModel, RunModel, TextFrameModel
+
+# Validated vs trusted loads of the same payloads, with the interpreter's GC
+# left on as an application would have it:
+#
+#   text   a deck of text boxes, one run model per run (`--runs` in total)
+#   points one XY series of `--points` point models
+#
+# for each, `model_validate_json` against `from_json(trusted=True)`, and
+# `from_bytes` validated against trusted. Each load runs `--repeat` times and
+# the best time is shown, with the speedup of the trusted load.
+#
+#   PYTHONPATH=. python benchmarks/trusted_load.py [--runs N] [--points N]
+
+
+def _text_deck(runs: int) -> PresentationModel:
+    fonts = [
+        None,
+        FontModel(name="Calibri", size_pt=10, bold=True),
+        FontModel(italic=True, color=Color(hex="#1f4e79")),
+    ]
+    per_box = 100
+    boxes = [
+        TextBoxModel(
+            left_pt=0,
+            top_pt=0,
+            width_pt=400,
+            height_pt=300,
+            text_frame=TextFrameModel(
+                paragraphs=[
+                    ParagraphModel(
+                        runs=[
+                            RunModel(text=f"run {b}.{i}", font=fonts[i % 3])
+                            for i in range(j, min(j + 4, per_box))
+                        ]
+                    )
+                    for j in range(0, per_box, 4)
+                ]
+            ),
+        )
+        for b in range(max(1, runs // per_box))
+    ]
+    return PresentationModel(
+        slides=[SlideModel(shapes=boxes[i : i + 10]) for i in range(0, len(boxes), 10)]
+    )
+
+
+def _points_deck(points: int) -> PresentationModel:
+    rng = random.Random(1)
+    series = XySeriesModel(
+        name="s",
+        points=[XyPoint(x=float(i), y=rng.random()) for i in range(points)],
+    )
+    chart = ChartModel(
+        left_pt=0,
+        top_pt=0,
+        width_pt=400,
+        height_pt=300,
+        chart_type="xy_scatter",
+        xy_data=XyChartDataModel(series=[series]),
+    )
+    return PresentationModel(slides=[SlideModel(shapes=[chart])])
+
+
+def _best(load, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _compare(label: str, validated, trusted, repeat: int) -> None:
+    v = _best(validated, repeat)
+    t = _best(trusted, repeat)
+    print(
+        f"{label:<8} validated {v * 1e3:8.1f} ms  trusted {t * 1e3:8.1f} ms"
+        f"  x{v / t:5.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if not gc.isenabled():
+        gc.enable()
+
+    for name, model in (
+        (f"text {args.runs}", _text_deck(args.runs)),
+        (f"points {args.points}", _points_deck(args.points)),
+    ):
+        js = model.to_json()
+        raw = model.to_bytes()
+        print(f"{name}: {len(js) / 1e6:.1f} MB JSON, {len(raw) / 1e6:.1f} MB binary")
+        _compare(
+            "  json",
+            lambda: PresentationModel.model_validate_json(js),
+            lambda: PresentationModel.from_json(js, trusted=True),
+            args.repeat,
+        )
+        _compare(
+            "  bytes",
+            lambda: PresentationModel.from_bytes(raw),
+            lambda: PresentationModel.from_bytes(raw, trusted=True),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
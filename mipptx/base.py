@@ -1,13 +1,43 @@
 from __future__ import annotations
 
-from pydantic import BaseModel as _PydanticBaseModel, ConfigDict
+import contextlib
+import gc
+import types
+from enum import Enum
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import pydantic_core
+from pydantic import (
+    AfterValidator,
+    BaseModel as _PydanticBaseModel,
+    BeforeValidator,
+    ConfigDict,
+    PlainValidator,
+    TypeAdapter,
+    WrapValidator,
+)
+from pydantic.fields import FieldInfo
+
+from . import binary
 
 
 class JsonModel(_PydanticBaseModel):
     """Base model with JSON helpers.
 
     Provides `to_json()` and `from_json()` thin wrappers around Pydantic v2
-    `model_dump_json` and `model_validate_json`.
+    `model_dump_json` and `model_validate_json`, and `to_bytes()`/`from_bytes()`
+    for the compact encoding in `mipptx.binary`.
     """
 
     model_config = ConfigDict()
@@ -16,6 +46,255 @@ class JsonModel(_PydanticBaseModel):
         return self.model_dump_json(**kwargs)
 
     @classmethod
-    def from_json(cls, data: str):
-        return cls.model_validate_json(data)
+    def from_json(
+        cls,
+        data: str | bytes,
+        trusted: bool = False,
+        validate_every: int | None = None,
+    ):
+        """Parse `data` into a model.
+
+        With `trusted=True` the tree is built `model_construct`-style, skipping
+        validators and constraints; only enums, float fields and the shape
+        discriminator are coerced. Use it only for payloads that were validated
+        upstream. `validate_every=N` fully validates every Nth model node of a
+        trusted load (with its subtree), as a spot check of the source.
+
+        Models with no nested models or Python validators (chart points, for
+        one) are validated by pydantic-core even so, which is faster than
+        building them. A trusted load pauses the cyclic GC while it runs (see
+        `_gc_paused`).
+        """
+        if not trusted:
+            return cls.model_validate_json(data)
+        if validate_every is not None and validate_every < 1:
+            raise ValueError("validate_every must be >= 1")
+        with _gc_paused():
+            return _trusted_load(cls, pydantic_core.from_json(data), validate_every)
+
+    def to_bytes(self) -> bytes:
+        return binary.encode(self.model_dump(mode="json"))
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        trusted: bool = False,
+        validate_every: int | None = None,
+    ):
+        """Decode `to_bytes()` output; `trusted`/`validate_every` work as in `from_json`.
+
+        XY and bubble series written with `points` are read into `columns`
+        (same data, no object per point).
+        """
+        if not trusted:
+            return cls.model_validate(binary.decode(data, columns=True))
+        if validate_every is not None and validate_every < 1:
+            raise ValueError("validate_every must be >= 1")
+        with _gc_paused():
+            return _trusted_load(cls, binary.decode(data, columns=True), validate_every)
+
+
+class _Sampler:
+    __slots__ = ("every", "count")
+
+    def __init__(self, every: int | None):
+        self.every = every
+        self.count = 0
+
+    def hit(self) -> bool:
+        self.count += 1
+        return self.count % self.every == 0
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Disable the cyclic GC for the block, restoring its previous state.
+
+    A trusted load allocates hundreds of thousands of acyclic objects in one go;
+    the collections that triggers free nothing yet cost more than the load
+    itself on big trees. The objects are still tracked, so the next collection
+    after the block covers them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _trusted_load(cls, data, validate_every: int | None):
+    return _construct(cls, data, _Sampler(validate_every))
+
+
+# model class -> ({field name: converter or None}, {field name: default maker},
+# its "before" model validators), built on first trusted load
+_SPECS: Dict[
+    type,
+    Tuple[Dict[str, Optional[Callable]], Dict[str, Callable], Tuple[Callable, ...]],
+] = {}
+_PYTHON_VALIDATORS = (AfterValidator, BeforeValidator, PlainValidator, WrapValidator)
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def _construct(cls, data: dict, sampler: _Sampler):
+    """`cls.model_construct(**data)` for trusted data, converting nested values.
+
+    Each field's converter is worked out once per class from its annotation, so
+    building a node costs a dict lookup and at most one call per field present.
+    Models here have no aliases, private attributes, extras or post-init hooks,
+    which is what lets it fill `__dict__` directly instead of going through
+    `model_construct`. Model validators in "before" mode, which only reshape
+    the input, still run.
+    """
+    if sampler.every and sampler.hit():
+        return cls.model_validate(data)
+    spec = _SPECS.get(cls)
+    if spec is None:
+        spec = _SPECS[cls] = _spec(cls)
+    converters, defaults, before = spec
+    for prepare in before:
+        data = prepare(data)
+    values = {}
+    for name, v in data.items():
+        if name in converters:
+            convert = converters[name]
+            values[name] = v if convert is None else convert(v, sampler)
+    fields_set = set(values)
+    if len(values) != len(converters):
+        # fill in defaults, keeping fields in declaration order
+        values = {
+            name: values[name] if name in values else make()
+            for name, make in defaults.items()
+        }
+    obj = _new(cls)
+    _setattr(obj, "__dict__", values)
+    _setattr(obj, "__pydantic_fields_set__", fields_set)
+    _setattr(obj, "__pydantic_extra__", None)
+    _setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _spec(cls):
+    converters = {
+        name: _converter(_field_type(field)) for name, field in cls.model_fields.items()
+    }
+    defaults = {name: _default(field) for name, field in cls.model_fields.items()}
+    before = tuple(
+        getattr(cls, d.cls_var_name)
+        for d in cls.__pydantic_decorators__.model_validators.values()
+        if d.info.mode == "before"
+    )
+    return converters, defaults, before
+
+
+def _default(field: FieldInfo) -> Callable[[], Any]:
+    # `get_default` inspects a default factory's signature on every call
+    factory = field.default_factory
+    if factory is not None and not field.default_factory_takes_validated_data:
+        return factory
+    return lambda: field.get_default(call_default_factory=True)
+
+
+def _field_type(field: FieldInfo):
+    if field.metadata:
+        # pydantic moves `Annotated[...]` extras of the field itself here
+        return Annotated[(field.annotation, *field.metadata)]
+    return field.annotation
+
+
+def _converter(tp) -> Optional[Callable[[Any, _Sampler], Any]]:
+    """Function turning trusted JSON for annotation `tp` into field data.
+
+    Returns None when the JSON value can be used as-is.
+    """
+    origin = get_origin(tp)
+    if origin is Annotated:
+        inner, *meta = get_args(tp)
+        for m in meta:
+            if isinstance(m, PlainValidator):
+                func = m.func
+                return lambda v, s: func(v)
+            if isinstance(m, FieldInfo) and isinstance(m.discriminator, str):
+                key = m.discriminator
+                by_tag = {}
+                for member in get_args(inner):
+                    (tag,) = get_args(member.model_fields[key].annotation)
+                    by_tag[tag.value if isinstance(tag, Enum) else tag] = member
+                return lambda v, s: _construct(by_tag[v[key]], v, s)
+        return _converter(inner)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            convert = _converter(args[0])
+        else:
+            # plain unions (e.g. `TextFrameModel | str`): models come from dicts
+            models = [a for a in args if _is_model(a)]
+            if models:
+                model = models[0]
+
+                def convert(v, s):
+                    return _construct(model, v, s) if type(v) is dict else v
+
+            elif float in args:
+                convert = _converter(float)
+            else:
+                convert = None
+        if convert is None:
+            return None
+        return lambda v, s: None if v is None else convert(v, s)
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        if _is_leaf(item):
+            # one call into pydantic-core for the whole list
+            return lambda v, s, validate=TypeAdapter(tp).validate_python: validate(v)
+        convert = _converter(item)
+        if convert is None:
+            return None
+        return lambda v, s: [convert(i, s) for i in v]
+    if origin is Literal:
+        values = get_args(tp)
+        if values and isinstance(values[0], Enum):
+            return _converter(type(values[0]))
+        return None
+    if _is_leaf(tp):
+        validate = tp.__pydantic_validator__.validate_python
+        return lambda v, s: validate(v)
+    if _is_model(tp):
+        return lambda v, s: _construct(tp, v, s)
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        members = tp._value2member_map_
+        return lambda v, s: (
+            v if type(v) is tp else members[v] if v in members else tp(v)
+        )
+    if tp is float:
+        return lambda v, s: float(v) if type(v) is int else v
+    return None
+
+
+def _is_model(tp) -> bool:
+    return isinstance(tp, type) and issubclass(tp, _PydanticBaseModel)
+
+
+def _is_leaf(tp) -> bool:
+    """Whether `tp` is a model pydantic-core validates without calling Python.
+
+    Such models (e.g. chart points) hold no other models and have no Python
+    validators; validating them in pydantic-core is faster than building them
+    here.
+    """
+    if not _is_model(tp):
+        return False
+    d = tp.__pydantic_decorators__
+    if d.validators or d.field_validators or d.root_validators or d.model_validators:
+        return False
+    return not any(_calls_python(_field_type(f)) for f in tp.model_fields.values())
+
 
+def _calls_python(tp) -> bool:
+    if _is_model(tp) or isinstance(tp, _PYTHON_VALIDATORS):
+        return True
+    return any(_calls_python(a) for a in get_args(tp))
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import itertools
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pptx.api import _default_pptx_path
+from pydantic import ConfigDict, Field
+
+from .base import JsonModel
+from .cache import template_cache
+from .presentation import PresentationModel
+
+
+class RenderResult(JsonModel):
+    model_config = ConfigDict(extra="forbid")
+
+    index: int = Field(..., ge=0, description="Position of the model in the batch")
+    path: Optional[str] = Field(None, description="Written deck, None on failure")
+    seconds: float = Field(0.0, ge=0, description="Build + save wall time")
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _warm_template(template: str | None) -> None:
+    # parse the template once per process; every render then gets a cheap copy.
+    # A broken template must not kill the pool: each render reports it instead.
+    try:
+        template_cache.get(template or _default_pptx_path())
+    except Exception:
+        pass
+
+
+def _render_one(
+    index: int, model: PresentationModel, template: str | None, path: str
+) -> RenderResult:
+    start = time.perf_counter()
+    try:
+        model.save(path, template=template)
+    except Exception as exc:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return RenderResult(
+            index=index,
+            seconds=time.perf_counter() - start,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return RenderResult(index=index, path=path, seconds=time.perf_counter() - start)
+
+
+def render_many(
+    models: Iterable[PresentationModel],
+    template: str | None,
+    out_dir: str,
+    workers: int | None = None,
+    filename: str = "deck_{index:05d}.pptx",
+) -> List[RenderResult]:
+    """Render many models against one template and save each deck to `out_dir`.
+
+    Each worker process warms `template` once and then builds and saves decks
+    as they are handed out; `models` is consumed as workers free up (a few jobs
+    per worker in flight), so finished files appear on disk while the batch is
+    still running. A failing deck is recorded in its `RenderResult` and does not
+    stop the batch. If a worker process dies, the decks that were in flight are
+    rerun one at a time in a fresh process, so only the one that kills its worker
+    is reported failed, and the rest of the batch continues on a new pool.
+    Results come back in input order, with per-deck timings.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if template is not None:
+        template = os.path.abspath(os.fspath(template))
+    jobs = (
+        (i, model, template, os.path.join(out_dir, filename.format(index=i)))
+        for i, model in enumerate(models)
+    )
+
+    if not workers or workers <= 1:
+        _warm_template(template)
+        return [_render_one(*job) for job in jobs]
+
+    results: List[RenderResult] = []
+    while True:
+        suspects = _render_pool(jobs, template, workers, results)
+        if not suspects:
+            break
+        for job in sorted(suspects):
+            results.append(_render_isolated(job, template))
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+def _failed(index: int, exc: BaseException) -> RenderResult:
+    return RenderResult(index=index, error=f"{type(exc).__name__}: {exc}")
+
+
+def _render_pool(
+    jobs: Iterator[tuple], template: str | None, workers: int, results: list
+) -> List[tuple]:
+    """Render `jobs` on one pool, appending to `results`.
+
+    At most two jobs per worker are submitted ahead. If a worker dies the pool is
+    unusable: the jobs that were in flight are returned, unrendered, and the rest
+    of `jobs` is left unconsumed.
+    """
+    inflight: Dict[Future, tuple] = {}
+    carry: List[tuple] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_warm_template, initargs=(template,)
+    ) as pool:
+        try:
+            for job in itertools.islice(jobs, 2 * workers):
+                carry = [job]
+                inflight[pool.submit(_render_one, *job)] = job
+                carry = []
+            while inflight:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    try:
+                        result = fut.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as exc:
+                        # e.g. the model or its result did not pickle
+                        result = _failed(inflight[fut][0], exc)
+                    del inflight[fut]
+                    results.append(result)
+                    job = next(jobs, None)
+                    if job is not None:
+                        carry = [job]
+                        inflight[pool.submit(_render_one, *job)] = job
+                        carry = []
+        except BrokenProcessPool:
+            return list(inflight.values()) + carry
+    return []
+
+
+def _render_isolated(job: tuple, template: str | None) -> RenderResult:
+    # one job in its own process: if that process dies, this job killed it
+    with ProcessPoolExecutor(
+        max_workers=1, initializer=_warm_template, initargs=(template,)
+    ) as pool:
+        try:
+            return pool.submit(_render_one, *job).result()
+        except Exception as exc:
+            try:
+                os.remove(job[3])
+            except OSError:
+                pass
+            return _failed(job[0], exc)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterator
+
+import pydantic_core
+
+# Framed binary encoding of JSON-compatible data (what `model_dump(mode="json")`
+# returns). Numeric series are lifted out of the tree into binary frames of raw
+# little-endian doubles; what remains (text, flags, structure) is stored as one
+# compact JSON frame, which pydantic-core parses far faster than any pure-Python
+# decoder could. Each series frame records the path where it is put back.
+#
+#   payload  := MAGIC version:u8 count:varint frame* skeleton
+#   frame    := path kind:u8 body
+#   path     := count:varint (index:varint<<1 | (len:varint<<1|1) utf-8)*  (empty: root)
+#   body     := FLOATS n:varint f64*n
+#             | FLOATS_NULL n:varint null-bitmap f64*n      (0.0 where null)
+#             | RECORDS n:varint width:varint key* column*  (column := FLOATS.. body)
+#   skeleton := len:varint JSON, with null where a frame goes
+#
+# Lists of floats become FLOATS frames; lists of records whose values are all
+# floats (e.g. XY or bubble points) become RECORDS frames stored column by column.
+# `decode(..., columns=True)` hands those back as `Columns` instead of rebuilding
+# one dict per record.
+
+MAGIC = b"MPX"
+VERSION = 1
+
+_FLOATS = 0x01
+_FLOATS_NULL = 0x02
+_RECORDS = 0x03
+
+# shorter lists stay in the JSON frame; a frame's path costs more than it saves
+_MIN_FRAME_LEN = 8
+_SWAP = sys.byteorder != "little"
+
+
+class BinaryFormatError(ValueError):
+    pass
+
+
+class Columns(dict):
+    """A RECORDS frame decoded column-wise: key -> `array('d')`, NaN where null.
+
+    Stands for the list of records it was encoded from; `records()` rebuilds it.
+    """
+
+    __slots__ = ()
+
+    def records(self) -> list:
+        keys = list(self)
+        return [
+            dict(zip(keys, [None if v != v else v for v in row]))
+            for row in zip(*self.values())
+        ]
+
+
+def encode(value: Any) -> bytes:
+    """Encode JSON-compatible `value` into the framed binary format."""
+    frames: list[tuple[tuple, bytes]] = []
+    lifted: list[tuple[Any, Any, list]] = []
+    body = _series_body(value) if type(value) is list else None
+    if body is not None:
+        frames.append(((), body))
+        value = None
+    elif type(value) is dict or type(value) is list:
+        _lift(value, (), frames, lifted)
+    try:
+        skeleton = pydantic_core.to_json(value)
+    finally:
+        # `value` belongs to the caller: put every lifted series back
+        for node, key, series in lifted:
+            node[key] = series
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    _varint(out, len(frames))
+    for path, body in frames:
+        _varint(out, len(path))
+        for key in path:
+            if type(key) is int:
+                _varint(out, key << 1)
+            else:
+                raw = key.encode("utf-8")
+                _varint(out, (len(raw) << 1) | 1)
+                out += raw
+        out += body
+    _varint(out, len(skeleton))
+    out += skeleton
+    return bytes(out)
+
+
+def decode(data: bytes | bytearray | memoryview, columns: bool = False) -> Any:
+    """Decode bytes produced by `encode`.
+
+    With `columns`, lists of records come back as `Columns` (see
+    `PointColumns`) rather than as lists of dicts.
+    """
+    buf = memoryview(data).cast("B")
+    if bytes(buf[:3]) != MAGIC:
+        raise BinaryFormatError("not an mipptx binary payload")
+    if len(buf) < 4 or buf[3] != VERSION:
+        raise BinaryFormatError("unsupported mipptx binary version")
+    dec = _Decoder(buf, 4)
+    try:
+        frames = [(dec.path(), dec.body(columns)) for _ in range(dec.varint())]
+        n = dec.varint()
+        skeleton = bytes(dec.take(n))
+    except IndexError as exc:
+        raise BinaryFormatError("truncated mipptx binary payload") from exc
+    if dec.pos != len(buf):
+        raise BinaryFormatError("trailing bytes after mipptx binary payload")
+    try:
+        value = pydantic_core.from_json(skeleton)
+        for path, series in frames:
+            if not path:
+                value = series
+                continue
+            node = value
+            for key in path[:-1]:
+                node = node[key]
+            node[path[-1]] = series
+    except (ValueError, LookupError, TypeError) as exc:
+        raise BinaryFormatError("corrupt mipptx binary payload") from exc
+    return value
+
+
+def _varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _lift(node, path: tuple, frames: list, lifted: list) -> None:
+    items = node.items() if type(node) is dict else enumerate(node)
+    for key, child in items:
+        t = type(child)
+        if t is list:
+            body = _series_body(child)
+            if body is None:
+                _lift(child, path + (key,), frames, lifted)
+            else:
+                frames.append((path + (key,), body))
+                lifted.append((node, key, child))
+                node[key] = None
+        elif t is dict:
+            _lift(child, path + (key,), frames, lifted)
+
+
+def _series_body(values: list) -> bytes | None:
+    if len(values) < _MIN_FRAME_LEN:
+        return None
+    first = values[0]
+    if type(first) is float or first is None:
+        if all(v is None or type(v) is float for v in values):
+            return _floats_body(values)
+        return None
+    if type(first) is dict and first:
+        keys = list(first)
+        width = len(keys)
+        for rec in values:
+            if type(rec) is not dict or len(rec) != width:
+                return None
+            for k in keys:
+                v = rec.get(k, first)  # `first` marks a missing key
+                if v is not None and type(v) is not float:
+                    return None
+        out = bytearray((_RECORDS,))
+        _varint(out, len(values))
+        _varint(out, width)
+        for k in keys:
+            raw = k.encode("utf-8")
+            _varint(out, len(raw))
+            out += raw
+        for k in keys:
+            out += _floats_body([rec[k] for rec in values])
+        return bytes(out)
+    return None
+
+
+def _floats_body(values: list) -> bytes:
+    n = len(values)
+    if None in values:
+        out = bytearray((_FLOATS_NULL,))
+        _varint(out, n)
+        mask = bytearray((n + 7) // 8)
+        for i, v in enumerate(values):
+            if v is None:
+                mask[i >> 3] |= 1 << (i & 7)
+        out += mask
+        arr = array("d", [0.0 if v is None else v for v in values])
+    else:
+        out = bytearray((_FLOATS,))
+        _varint(out, n)
+        arr = array("d", values)
+    if _SWAP:
+        arr.byteswap()
+    out += arr.tobytes()
+    return bytes(out)
+
+
+def _set_bits(mask) -> Iterator[int]:
+    # indices of the set bits of a null bitmap, skipping all-zero bytes
+    for byte_index, byte in enumerate(mask):
+        if byte:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+
+class _Decoder:
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: memoryview, pos: int):
+        self.buf = buf
+        self.pos = pos
+
+    def varint(self) -> int:
+        buf = self.buf
+        pos = self.pos
+        shift = 0
+        n = 0
+        while True:
+            b = buf[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                self.pos = pos
+                return n
+            shift += 7
+
+    def take(self, n: int) -> memoryview:
+        end = self.pos + n
+        if end > len(self.buf):
+            raise IndexError
+        view = self.buf[self.pos : end]
+        self.pos = end
+        return view
+
+    def path(self) -> list:
+        path = []
+        for _ in range(self.varint()):
+            n = self.varint()
+            path.append(str(self.take(n >> 1), "utf-8") if n & 1 else n >> 1)
+        return path
+
+    def floats(self, kind: int) -> list:
+        arr, mask = self._doubles(kind)
+        values = arr.tolist()
+        if mask is not None:
+            for i in _set_bits(mask):
+                values[i] = None
+        return values
+
+    def column(self, kind: int) -> array:
+        arr, mask = self._doubles(kind)
+        if mask is not None:
+            nan = float("nan")
+            for i in _set_bits(mask):
+                arr[i] = nan
+        return arr
+
+    def _doubles(self, kind: int) -> tuple:
+        n = self.varint()
+        mask = self.take((n + 7) // 8) if kind == _FLOATS_NULL else None
+        arr = array("d")
+        arr.frombytes(self.take(8 * n))
+        if _SWAP:
+            arr.byteswap()
+        return arr, mask
+
+    def body(self, columns: bool = False) -> list | Columns:
+        kind = self.take(1)[0]
+        if kind == _FLOATS or kind == _FLOATS_NULL:
+            return self.floats(kind)
+        if kind != _RECORDS:
+            raise BinaryFormatError(f"unknown frame kind 0x{kind:02x}")
+        n = self.varint()
+        keys = [str(self.take(self.varint()), "utf-8") for _ in range(self.varint())]
+        read = self.column if columns else self.floats
+        values = []
+        for _ in keys:
+            kind = self.take(1)[0]
+            if kind != _FLOATS and kind != _FLOATS_NULL:
+                raise BinaryFormatError(f"unknown column kind 0x{kind:02x}")
+            values.append(read(kind))
+        if any(len(col) != n for col in values):
+            raise BinaryFormatError("ragged record columns in mipptx binary payload")
+        if columns:
+            return Columns(zip(keys, values))
+        return [dict(zip(keys, row)) for row in zip(*values)]
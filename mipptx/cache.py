@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import NamedTuple
+
+from pptx import Presentation as _Presentation
+
+DEFAULT_TEMPLATE_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class _Entry(NamedTuple):
+    mtime_ns: int
+    size: int
+    package: object
+    cost: int
+
+
+class TemplateCache:
+    """Process-wide LRU cache of parsed template packages.
+
+    Entries are keyed by absolute path and validated against the file's mtime and
+    size, so an edited template is re-read on next use. Each entry keeps one pristine
+    python-pptx package that is never handed out; `get()` returns a deep copy of it,
+    which is far cheaper than unzipping and re-parsing every part. An entry costs
+    the uncompressed size of its package; least recently used entries are evicted
+    once the total exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TEMPLATE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path) -> bool:
+        return os.path.abspath(os.fspath(path)) in self._entries
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, path):
+        """Return a fresh `pptx.Presentation` for the template at `path`."""
+        path = os.path.abspath(os.fspath(path))
+        st = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and (entry.mtime_ns, entry.size) == (
+                st.st_mtime_ns,
+                st.st_size,
+            ):
+                self._entries.move_to_end(path)
+            else:
+                entry = None
+        if entry is None:
+            entry = self._load(path, st)
+        return copy.deepcopy(entry.package).presentation_part.presentation
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _load(self, path: str, st: os.stat_result) -> _Entry:
+        with zipfile.ZipFile(path) as zf:
+            cost = sum(info.file_size for info in zf.infolist())
+        package = _Presentation(path).part.package
+        entry = _Entry(st.st_mtime_ns, st.st_size, package, cost)
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= old.cost
+            if cost <= self.max_bytes:
+                self._entries[path] = entry
+                self._bytes += cost
+                self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= old.cost
+
+
+# shared by `PresentationModel.build_presentation`
+template_cache = TemplateCache()
@@ -1,17 +1,56 @@
 from __future__ import annotations
 
-from io import BytesIO
-from typing import List, Literal, Optional
-
-import openpyxl
-from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
+import hashlib
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Annotated, Any, Dict, List, Literal, Optional
+
+import pydantic_core
+from pptx.chart.data import (
+    BubbleChartData,
+    BubbleDataPoint,
+    BubbleSeriesData,
+    CategoryChartData,
+    CategoryDataPoint,
+    CategorySeriesData,
+    XyChartData,
+    XyDataPoint,
+    XySeriesData,
+)
 from pptx.enum.chart import XL_CHART_TYPE as XL
-from pydantic import ConfigDict, Field
-
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+from pptx.util import lazyproperty
+from pydantic import (
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    model_validator,
+)
+
+from . import binary, frames, xlsx
 from .base import JsonModel
+from .downsample import Downsample, select as select_points, take as take_points
 from .enums import ShapeKind
+from .package import mark_dirty
 from .utils import emu_to_pt, pt_to_emu
 
+_C_PT = qn("c:pt")
+_C_PTCOUNT = qn("c:ptCount")
+_C_V = qn("c:v")
+_C_XVAL = qn("c:xVal")
+_C_YVAL = qn("c:yVal")
+_C_BUBBLESIZE = qn("c:bubbleSize")
+
 
 class ChartType(str):
     # Values match python-pptx XL_CHART_TYPE member names (lowercased)
@@ -63,12 +102,113 @@ def _from_chart_type(chart_type: str):
     return reverse.get(chart_type)
 
 
+# python-pptx chart data whose embedded workbook is written by `mipptx.xlsx`
+class _CategoryChartData(CategoryChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return xlsx.CategoryWorkbookWriter(self)
+
+
+class _XyChartData(XyChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return xlsx.XyWorkbookWriter(self)
+
+
+class _BubbleChartData(BubbleChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return xlsx.BubbleWorkbookWriter(self)
+
+
+def _as_column(v):
+    # array('d') and 1-D NumPy float arrays are kept as-is, so building a series
+    # from an existing buffer never copies it; anything else becomes array('d')
+    if isinstance(v, array):
+        return v if v.typecode == "d" else array("d", v)
+    if getattr(v, "ndim", None) == 1 and hasattr(v, "dtype"):
+        return v if v.dtype.kind == "f" else v.astype("float64")
+    return array("d", (math.nan if x is None else float(x) for x in v))
+
+
+def _column_to_list(col) -> list:
+    return [None if x != x else x for x in col.tolist()]
+
+
+# A float column; NaN marks a missing value and serializes as null
+FloatColumn = Annotated[
+    Any,
+    PlainValidator(_as_column),
+    PlainSerializer(_column_to_list, return_type=List[Optional[float]]),
+]
+
+
+class _NullableColumn(Sequence):
+    """Read-only view of a float column that reports NaN as None, without copying."""
+
+    __slots__ = ("_col",)
+
+    def __init__(self, col):
+        self._col = col
+
+    def __len__(self) -> int:
+        return len(self._col)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [None if x != x else float(x) for x in self._col[idx]]
+        x = self._col[idx]
+        return None if x != x else float(x)
+
+    def __iter__(self):
+        for x in self._col:
+            yield None if x != x else float(x)
+
+
 class CategorySeriesModel(JsonModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
     name: str = ""
-    values: List[float] = Field(default_factory=list)
+    values: List[Optional[float]] = Field(default_factory=list)
     number_format: Optional[str] = None
+    column: Optional[FloatColumn] = Field(
+        None,
+        description="Columnar alternative to `values` for long series (NaN is null)",
+    )
+
+    @model_validator(mode="after")
+    def _values_or_column(self):
+        if self.column is not None and self.values:
+            raise ValueError("set either `values` or `column`, not both")
+        return self
+
+    @classmethod
+    def from_column(cls, values, name: str = "", number_format: str | None = None):
+        return cls(name=name, number_format=number_format, column=values)
+
+    def point_values(self) -> Sequence:
+        """The values, None for missing ones, from `column` or `values`."""
+        if self.column is not None:
+            return _NullableColumn(self.column)
+        return self.values
+
+
+class _ColumnarCategorySeriesData(CategorySeriesData):
+    # python-pptx and `CategoryWorkbookWriter` read series data through len()
+    # and values only
+    def __init__(self, chart_data, name, number_format, column):
+        super().__init__(chart_data, name, number_format)
+        self._column = column
+
+    def __len__(self) -> int:
+        return len(self._column)
+
+    def __getitem__(self, idx):
+        return CategoryDataPoint(self, self.values[idx], None)
+
+    @property
+    def values(self):
+        return _NullableColumn(self._column)
 
 
 class CategoryChartDataModel(JsonModel):
@@ -76,6 +216,9 @@ class CategoryChartDataModel(JsonModel):
 
     categories: List[str] = Field(default_factory=list)
     series: List[CategorySeriesModel] = Field(default_factory=list)
+    downsample: Optional[Downsample] = Field(
+        None, description="Reduce long series before they are written"
+    )
 
     @classmethod
     def from_chart(cls, chart) -> "CategoryChartDataModel":
@@ -98,14 +241,224 @@ class CategoryChartDataModel(JsonModel):
 
         return cls(categories=cats, series=series)
 
+    @classmethod
+    def from_arrow(
+        cls,
+        table,
+        categories: str | None = None,
+        series: str | List[str] | None = None,
+    ) -> "CategoryChartDataModel":
+        """Build from an Arrow table with a `categories` column (default: the first)
+        and one float column per series (default: all others), named after it."""
+        return cls._from_frame(frames.arrow_frame(table), categories, series)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df,
+        categories: str | None = None,
+        series: str | List[str] | None = None,
+    ) -> "CategoryChartDataModel":
+        """As `from_arrow`, for a DataFrame; categories default to its index."""
+        return cls._from_frame(frames.dataframe_frame(df), categories, series)
+
+    @classmethod
+    def _from_frame(cls, frame, categories, series) -> "CategoryChartDataModel":
+        label_col = frame.label_column(categories)
+        out = [
+            # each series keeps the float64 buffer it was read into
+            CategorySeriesModel.from_column(
+                frame.floats(col), name=str(col), number_format=frame.number_format(col)
+            )
+            for col in frames.value_columns(frame, [label_col], series)
+        ]
+        return cls(categories=frame.labels(label_col), series=out)
+
+    def to_arrow(self):
+        """A `pyarrow.Table` with a `category` column and one float column per series."""
+        return frames.category_table(
+            list(self.categories),
+            [
+                (s.name, s.number_format, s.values if s.column is None else s.column)
+                for s in self.series
+            ],
+        )
+
+    def downsampled(self) -> "CategoryChartDataModel":
+        """This data as written: `downsample` applied, or `self` if not set.
+
+        The series share the category axis, so all of them keep the union of
+        the points picked for each one.
+        """
+        spec = self.downsample
+        if spec is None:
+            return self
+        keep = set()
+        for s in self.series:
+            y = s.values if s.column is None else s.column
+            keep.update(select_points(spec.method, None, y, spec.points))
+        keep = sorted(keep)
+        series = []
+        for s in self.series:
+            if s.column is not None:
+                n = len(s.column)
+                update = {"column": take_points(s.column, [i for i in keep if i < n])}
+            else:
+                update = {"values": [s.values[i] for i in keep if i < len(s.values)]}
+            series.append(s.model_copy(update=update))
+        return self.model_copy(
+            update={
+                "downsample": None,
+                "categories": [
+                    self.categories[i] for i in keep if i < len(self.categories)
+                ],
+                "series": series,
+            }
+        )
+
     def to_chart_data(self):
-        cd = CategoryChartData()
+        if self.downsample is not None:
+            return self.downsampled().to_chart_data()
+        cd = _CategoryChartData()
         if self.categories:
             cd.categories = list(self.categories)
         for s in self.series:
+            if s.column is not None:
+                cd.append(
+                    _ColumnarCategorySeriesData(cd, s.name, s.number_format, s.column)
+                )
+                continue
             cd.add_series(s.name, values=s.values, number_format=s.number_format)
         return cd
 
+    def data_digest(self) -> str:
+        """Digest of the data as written to a chart's caches; see `ChartModel.matches_chart`."""
+        if self.downsample is not None:
+            return self.downsampled().data_digest()
+        return _digest(
+            "category",
+            self.categories,
+            [
+                [s.name, s.number_format or "General", list(s.point_values())]
+                for s in self.series
+            ],
+        )
+
+
+class PointColumns(JsonModel):
+    """Columnar point data for XY and bubble series.
+
+    Columns are `array('d')` or 1-D NumPy float arrays and are handed to
+    python-pptx without copying. NaN is the null mask: a NaN entry is a missing
+    value, serialized as null.
+    """
+
+    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
+
+    x: FloatColumn
+    y: FloatColumn
+    size: Optional[FloatColumn] = None
+
+    @model_validator(mode="after")
+    def _check_lengths(self) -> "PointColumns":
+        n = len(self.x)
+        if len(self.y) != n or (self.size is not None and len(self.size) != n):
+            raise ValueError("point columns must have the same length")
+        return self
+
+
+def _columnar_points(data):
+    # a `points` list that `binary.decode(..., columns=True)` handed over
+    # column-wise becomes `columns`, without a dict or model per point
+    if type(data) is dict:
+        points = data.get("points")
+        if type(points) is binary.Columns:
+            data = dict(data)
+            if "x" in points and "y" in points and points.keys() <= {"x", "y", "size"}:
+                del data["points"]
+                data["columns"] = points
+            else:
+                data["points"] = points.records()
+    return data
+
+
+class _ColumnarXySeriesData(XySeriesData):
+    # python-pptx reads series data through len(), x_values and y_values only
+    def __init__(self, chart_data, name, number_format, columns: PointColumns):
+        super().__init__(chart_data, name, number_format)
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns.x)
+
+    def __getitem__(self, idx):
+        return XyDataPoint(self, self.x_values[idx], self.y_values[idx], None)
+
+    @property
+    def x_values(self):
+        return _NullableColumn(self._columns.x)
+
+    @property
+    def y_values(self):
+        return _NullableColumn(self._columns.y)
+
+
+class _ColumnarBubbleSeriesData(_ColumnarXySeriesData, BubbleSeriesData):
+    def __getitem__(self, idx):
+        x, y, size = self.x_values[idx], self.y_values[idx], self.bubble_sizes[idx]
+        return BubbleDataPoint(self, x, y, size, None)
+
+    @property
+    def bubble_sizes(self):
+        size = self._columns.size
+        return [None] * len(self) if size is None else _NullableColumn(size)
+
+
+def _pt_cache(el) -> tuple[int, Dict[int, float]]:
+    # one pass over a c:xVal / c:yVal / c:bubbleSize point cache:
+    # (ptCount, idx -> value); the first c:pt wins for a repeated idx, as in pt_v()
+    count = None
+    values: Dict[int, float] = {}
+    for child in el.iter(_C_PTCOUNT, _C_PT):
+        if child.tag == _C_PT:
+            idx = int(child.get("idx"))
+            if idx not in values:
+                values[idx] = float(child.find(_C_V).text)
+        elif count is None:
+            count = int(child.get("val"))
+    return count or 0, values
+
+
+def _series_point_columns(ser, with_size: bool) -> Optional[List[list]]:
+    """Read the x, y (and bubble size) columns of a `c:ser`, or None if it has none.
+
+    Each point cache is walked once into an idx -> value map, so extraction is
+    linear in the number of points; missing indices come back as None.
+    """
+    caches = [ser.find(_C_XVAL), ser.find(_C_YVAL)]
+    if with_size:
+        caches.append(ser.find(_C_BUBBLESIZE))
+    if any(el is None for el in caches):
+        return None
+    parsed = [_pt_cache(el) for el in caches]
+    count = min(c for c, _ in parsed)
+    return [[values.get(i) for i in range(count)] for _, values in parsed]
+
+
+def _export_columns(s, names) -> list:
+    # a columnar series hands its buffers over as they are; points become lists
+    if s.columns is not None:
+        n = len(s.columns.x)
+        return [
+            [None] * n if getattr(s.columns, c) is None else getattr(s.columns, c)
+            for c in names
+        ]
+    return [[getattr(p, c) for p in s.points] for c in names]
+
+
+def _digest(*payload) -> str:
+    return hashlib.blake2b(pydantic_core.to_json(payload), digest_size=16).hexdigest()
+
 
 class XyPoint(JsonModel):
     x: float | None = None
@@ -117,52 +470,186 @@ class XySeriesModel(JsonModel):
     name: str = ""
     points: list[XyPoint] = Field(default_factory=list)
     number_format: Optional[str] = None
+    columns: Optional[PointColumns] = Field(
+        None, description="Columnar alternative to `points` for large series"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _columnar_input(cls, data):
+        return _columnar_points(data)
+
+    @model_validator(mode="after")
+    def _points_or_columns(self):
+        if self.columns is not None and self.points:
+            raise ValueError("set either `points` or `columns`, not both")
+        return self
+
+    @classmethod
+    def from_columns(cls, x, y, name: str = "", number_format: str | None = None):
+        return cls(
+            name=name, number_format=number_format, columns=PointColumns(x=x, y=y)
+        )
+
+    def x_values(self) -> Sequence:
+        if self.columns is not None:
+            return _NullableColumn(self.columns.x)
+        return [p.x for p in self.points]
+
+    def y_values(self) -> Sequence:
+        if self.columns is not None:
+            return _NullableColumn(self.columns.y)
+        return [p.y for p in self.points]
 
 
 class XyChartDataModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
     series: list[XySeriesModel] = Field(default_factory=list)
+    downsample: Optional[Downsample] = Field(
+        None, description="Reduce long series before they are written"
+    )
 
     @classmethod
-    def from_chart(cls, chart) -> "XyChartDataModel":
+    def from_chart(cls, chart, columnar: bool = False) -> "XyChartDataModel":
+        """Read series from a python-pptx chart; `columnar` fills `columns` instead of `points`."""
         out_series: list[XySeriesModel] = []
         try:
             for s in chart.series:
                 name = s.name or ""
-                pts: list[XyPoint] = []
+                xs: list = []
+                ys: list = []
                 try:
-                    ser = getattr(s, "_ser", None) or getattr(s, "_element", None)
-                    if (
-                        ser is not None
-                        and getattr(ser, "xVal", None) is not None
-                        and getattr(ser, "yVal", None) is not None
-                    ):
-                        count = min(ser.xVal.ptCount_val, ser.yVal.ptCount_val)
-                        for i in range(count):
-                            x = ser.xVal.pt_v(i)
-                            y = ser.yVal.pt_v(i)
-                            pts.append(XyPoint(x=x, y=y))
+                    ser = getattr(s, "_ser", None)
+                    if ser is None:
+                        ser = getattr(s, "_element", None)
+                    cols = None if ser is None else _series_point_columns(ser, False)
+                    if cols is not None:
+                        xs, ys = cols
                     else:
-                        ys = list(getattr(s, "values", []) or [])
-                        pts = [
-                            XyPoint(x=float(i), y=float(v) if v is not None else None)
-                            for i, v in enumerate(ys)
+                        ys = [
+                            float(v) if v is not None else None
+                            for v in (getattr(s, "values", []) or [])
                         ]
+                        xs = [float(i) for i in range(len(ys))]
                 except Exception:
-                    pass
-                out_series.append(XySeriesModel(name=name, points=pts))
+                    xs, ys = [], []
+                if columnar:
+                    out_series.append(XySeriesModel.from_columns(xs, ys, name=name))
+                else:
+                    pts = [XyPoint.model_construct(x=x, y=y) for x, y in zip(xs, ys)]
+                    out_series.append(XySeriesModel(name=name, points=pts))
         except Exception:
             pass
         return cls(series=out_series)
 
+    @classmethod
+    def from_arrow(
+        cls,
+        table,
+        x: str = "x",
+        y: str | List[str] | None = None,
+        series: str | None = None,
+    ) -> "XyChartDataModel":
+        """Build columnar series from an Arrow table.
+
+        Without `series`, each `y` column (default: all but `x`) is a series over
+        the shared `x` column. With it, rows are split into one series per value
+        of the `series` column, each with its `x` and `y` (default "y") columns;
+        this is the layout `to_arrow` writes.
+        """
+        return cls._from_frame(frames.arrow_frame(table), x, y, series)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df,
+        x: str = "x",
+        y: str | List[str] | None = None,
+        series: str | None = None,
+    ) -> "XyChartDataModel":
+        """As `from_arrow`, for a DataFrame."""
+        return cls._from_frame(frames.dataframe_frame(df), x, y, series)
+
+    @classmethod
+    def _from_frame(cls, frame, x, y, series) -> "XyChartDataModel":
+        if series is not None:
+            parts = frames.long_series(frame, series, [x, y or "y"])
+        else:
+            xs = frame.floats(x)
+            parts = [
+                (str(col), frame.number_format(col), [xs, frame.floats(col)])
+                for col in frames.value_columns(frame, [x], y)
+            ]
+        return cls(
+            series=[
+                XySeriesModel.from_columns(*cols, name=name, number_format=fmt)
+                for name, fmt, cols in parts
+            ]
+        )
+
+    def to_arrow(self):
+        """A long-format `pyarrow.Table` with `series`, `x` and `y` columns."""
+        return frames.series_table(
+            ["x", "y"],
+            [
+                (s.name, s.number_format, _export_columns(s, ("x", "y")))
+                for s in self.series
+            ],
+        )
+
+    def downsampled(self) -> "XyChartDataModel":
+        """This data as written: `downsample` applied to each series, or `self` if not set."""
+        spec = self.downsample
+        if spec is None:
+            return self
+        series = []
+        for s in self.series:
+            cols = s.columns
+            if cols is not None:
+                keep = select_points(spec.method, cols.x, cols.y, spec.points)
+                if len(keep) < len(cols.x):
+                    cols = PointColumns(
+                        x=take_points(cols.x, keep), y=take_points(cols.y, keep)
+                    )
+                    s = s.model_copy(update={"columns": cols})
+            else:
+                keep = select_points(
+                    spec.method, s.x_values(), s.y_values(), spec.points
+                )
+                if len(keep) < len(s.points):
+                    s = s.model_copy(update={"points": [s.points[i] for i in keep]})
+            series.append(s)
+        return self.model_copy(update={"downsample": None, "series": series})
+
     def to_chart_data(self):
-        cd = XyChartData()
+        if self.downsample is not None:
+            return self.downsampled().to_chart_data()
+        cd = _XyChartData()
         for s in self.series:
+            if s.columns is not None:
+                cd.append(_ColumnarXySeriesData(cd, s.name, s.number_format, s.columns))
+                continue
             xs = cd.add_series(s.name, number_format=s.number_format)
             for p in s.points:
                 xs.add_data_point(p.x, p.y)
         return cd
 
+    def data_digest(self) -> str:
+        if self.downsample is not None:
+            return self.downsampled().data_digest()
+        return _digest(
+            "xy",
+            [
+                [
+                    s.name,
+                    s.number_format or "General",
+                    list(s.x_values()),
+                    list(s.y_values()),
+                ]
+                for s in self.series
+            ],
+        )
+
 
 class BubblePoint(JsonModel):
     x: float | None = None
@@ -175,66 +662,215 @@ class BubbleSeriesModel(JsonModel):
     name: str = ""
     points: list[BubblePoint] = Field(default_factory=list)
     number_format: Optional[str] = None
+    columns: Optional[PointColumns] = Field(
+        None, description="Columnar alternative to `points` for large series"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _columnar_input(cls, data):
+        return _columnar_points(data)
+
+    @model_validator(mode="after")
+    def _points_or_columns(self):
+        if self.columns is not None and self.points:
+            raise ValueError("set either `points` or `columns`, not both")
+        return self
+
+    @classmethod
+    def from_columns(cls, x, y, size, name: str = "", number_format: str | None = None):
+        return cls(
+            name=name,
+            number_format=number_format,
+            columns=PointColumns(x=x, y=y, size=size),
+        )
+
+    def x_values(self) -> Sequence:
+        if self.columns is not None:
+            return _NullableColumn(self.columns.x)
+        return [p.x for p in self.points]
+
+    def y_values(self) -> Sequence:
+        if self.columns is not None:
+            return _NullableColumn(self.columns.y)
+        return [p.y for p in self.points]
+
+    def sizes(self) -> Sequence:
+        if self.columns is not None:
+            if self.columns.size is None:
+                return [None] * len(self.columns.x)
+            return _NullableColumn(self.columns.size)
+        return [p.size for p in self.points]
 
 
 class BubbleChartDataModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
     series: list[BubbleSeriesModel] = Field(default_factory=list)
+    downsample: Optional[Downsample] = Field(
+        None, description="Reduce long series before they are written"
+    )
 
     @classmethod
-    def from_chart(cls, chart) -> "BubbleChartDataModel":
+    def from_chart(cls, chart, columnar: bool = False) -> "BubbleChartDataModel":
+        """Read series from a python-pptx chart; `columnar` fills `columns` instead of `points`."""
         out_series: list[BubbleSeriesModel] = []
         try:
             for s in chart.series:
                 name = s.name or ""
-                pts: list[BubblePoint] = []
+                xs: list = []
+                ys: list = []
+                sizes: list = []
                 try:
-                    ser = getattr(s, "_ser", None) or getattr(s, "_element", None)
-                    if (
-                        ser is not None
-                        and getattr(ser, "xVal", None) is not None
-                        and getattr(ser, "yVal", None) is not None
-                        and getattr(ser, "bubbleSize", None) is not None
-                    ):
-                        count = min(
-                            ser.xVal.ptCount_val,
-                            ser.yVal.ptCount_val,
-                            ser.bubbleSize_ptCount_val,
-                        )
-                        for i in range(count):
-                            x = ser.xVal.pt_v(i)
-                            y = ser.yVal.pt_v(i)
-                            try:
-                                matches = ser.xpath("./c:bubbleSize//c:pt[@idx=%d]" % i)
-                                size = matches[0].value if matches else None
-                            except Exception:
-                                size = None
-                            pts.append(BubblePoint(x=x, y=y, size=size))
+                    ser = getattr(s, "_ser", None)
+                    if ser is None:
+                        ser = getattr(s, "_element", None)
+                    cols = None if ser is None else _series_point_columns(ser, True)
+                    if cols is not None:
+                        xs, ys, sizes = cols
                     else:
-                        ys = list(getattr(s, "values", []) or [])
-                        pts = [
-                            BubblePoint(
-                                x=float(i),
-                                y=float(v) if v is not None else None,
-                                size=None,
-                            )
-                            for i, v in enumerate(ys)
+                        ys = [
+                            float(v) if v is not None else None
+                            for v in (getattr(s, "values", []) or [])
                         ]
+                        xs = [float(i) for i in range(len(ys))]
+                        sizes = [None] * len(ys)
                 except Exception:
-                    pass
-                out_series.append(BubbleSeriesModel(name=name, points=pts))
+                    xs, ys, sizes = [], [], []
+                if columnar:
+                    out_series.append(
+                        BubbleSeriesModel.from_columns(xs, ys, sizes, name=name)
+                    )
+                else:
+                    pts = [
+                        BubblePoint.model_construct(x=x, y=y, size=size)
+                        for x, y, size in zip(xs, ys, sizes)
+                    ]
+                    out_series.append(BubbleSeriesModel(name=name, points=pts))
         except Exception:
             pass
         return cls(series=out_series)
 
+    @classmethod
+    def from_arrow(
+        cls,
+        table,
+        x: str = "x",
+        y: str = "y",
+        size: str = "size",
+        series: str | None = None,
+    ) -> "BubbleChartDataModel":
+        """Build columnar series from an Arrow table.
+
+        With `series`, rows are split into one series per value of that column,
+        the layout `to_arrow` writes; without it the table is a single series
+        named after the `y` column.
+        """
+        return cls._from_frame(frames.arrow_frame(table), x, y, size, series)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df,
+        x: str = "x",
+        y: str = "y",
+        size: str = "size",
+        series: str | None = None,
+    ) -> "BubbleChartDataModel":
+        """As `from_arrow`, for a DataFrame."""
+        return cls._from_frame(frames.dataframe_frame(df), x, y, size, series)
+
+    @classmethod
+    def _from_frame(cls, frame, x, y, size, series) -> "BubbleChartDataModel":
+        if series is not None:
+            parts = frames.long_series(frame, series, [x, y, size])
+        else:
+            parts = [
+                (
+                    str(y),
+                    frame.number_format(y),
+                    [frame.floats(x), frame.floats(y), frame.floats(size)],
+                )
+            ]
+        return cls(
+            series=[
+                BubbleSeriesModel.from_columns(*cols, name=name, number_format=fmt)
+                for name, fmt, cols in parts
+            ]
+        )
+
+    def to_arrow(self):
+        """A long-format `pyarrow.Table` with `series`, `x`, `y` and `size` columns."""
+        return frames.series_table(
+            ["x", "y", "size"],
+            [
+                (s.name, s.number_format, _export_columns(s, ("x", "y", "size")))
+                for s in self.series
+            ],
+        )
+
+    def downsampled(self) -> "BubbleChartDataModel":
+        """This data as written: `downsample` applied to each series, or `self` if not set.
+
+        Points are picked on (x, y); the bubble sizes of the kept points go along.
+        """
+        spec = self.downsample
+        if spec is None:
+            return self
+        series = []
+        for s in self.series:
+            cols = s.columns
+            if cols is not None:
+                keep = select_points(spec.method, cols.x, cols.y, spec.points)
+                if len(keep) < len(cols.x):
+                    cols = PointColumns(
+                        x=take_points(cols.x, keep),
+                        y=take_points(cols.y, keep),
+                        size=None
+                        if cols.size is None
+                        else take_points(cols.size, keep),
+                    )
+                    s = s.model_copy(update={"columns": cols})
+            else:
+                keep = select_points(
+                    spec.method, s.x_values(), s.y_values(), spec.points
+                )
+                if len(keep) < len(s.points):
+                    s = s.model_copy(update={"points": [s.points[i] for i in keep]})
+            series.append(s)
+        return self.model_copy(update={"downsample": None, "series": series})
+
     def to_chart_data(self):
-        cd = BubbleChartData()
+        if self.downsample is not None:
+            return self.downsampled().to_chart_data()
+        cd = _BubbleChartData()
         for s in self.series:
+            if s.columns is not None:
+                cd.append(
+                    _ColumnarBubbleSeriesData(cd, s.name, s.number_format, s.columns)
+                )
+                continue
             bs = cd.add_series(s.name, number_format=s.number_format)
             for p in s.points:
                 bs.add_data_point(p.x, p.y, p.size)
         return cd
 
+    def data_digest(self) -> str:
+        if self.downsample is not None:
+            return self.downsampled().data_digest()
+        return _digest(
+            "bubble",
+            [
+                [
+                    s.name,
+                    s.number_format or "General",
+                    list(s.x_values()),
+                    list(s.y_values()),
+                    list(s.sizes()),
+                ]
+                for s in self.series
+            ],
+        )
+
 
 class ChartModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
@@ -258,13 +894,14 @@ class ChartModel(JsonModel):
     bubble_data: Optional[BubbleChartDataModel] = None
 
     @classmethod
-    def from_pptx(cls, gframe) -> "ChartModel":
+    def from_pptx(cls, gframe, columnar: bool = False) -> "ChartModel":
         ch = gframe.chart
         chart_type = _to_chart_type(ch.chart_type)
         title = None
         try:
-            ct = getattr(ch, "chart_title", None)
-            if getattr(ch, "has_title", False) and ct is not None:
+            # check first: reading `chart_title` adds a title element to the chart
+            ct = getattr(ch, "chart_title", None) if ch.has_title else None
+            if ct is not None:
                 tf = getattr(ct, "text_frame", None)
                 if tf is not None:
                     title = getattr(tf, "text", None)
@@ -283,9 +920,9 @@ class ChartModel(JsonModel):
         bubble_data = None
         try:
             if chart_type == ChartType.SCATTER:
-                xy_data = XyChartDataModel.from_chart(ch)
+                xy_data = XyChartDataModel.from_chart(ch, columnar=columnar)
             elif chart_type == ChartType.BUBBLE:
-                bubble_data = BubbleChartDataModel.from_chart(ch)
+                bubble_data = BubbleChartDataModel.from_chart(ch, columnar=columnar)
             else:
                 cat_data = CategoryChartDataModel.from_chart(ch)
         except Exception:
@@ -307,6 +944,50 @@ class ChartModel(JsonModel):
             bubble_data=bubble_data,
         )
 
+    def data_digest(self) -> Optional[str]:
+        """Digest of the data block, or None when the model carries no data."""
+        data = self._data_block()
+        return None if data is None else data.data_digest()
+
+    def matches_chart(self, chart) -> bool:
+        """True if applying this model to `chart` would leave it as it is.
+
+        The data block is compared by digest with the chart's point caches (not
+        its embedded workbook), together with the title, legend and style the
+        model sets. Anything that cannot be read counts as a difference.
+        """
+        data = self._data_block()
+        if data is None:
+            return False
+        try:
+            if self.title is not None and not (
+                chart.has_title and chart.chart_title.text_frame.text == self.title
+            ):
+                return False
+            if self.has_legend is not None and chart.has_legend != self.has_legend:
+                return False
+            if self.style is not None and chart.chart_style != self.style:
+                return False
+            if isinstance(data, CategoryChartDataModel):
+                current, val = CategoryChartDataModel.from_chart(chart), "c:val"
+            elif isinstance(data, XyChartDataModel):
+                current, val = XyChartDataModel.from_chart(chart, True), "c:yVal"
+            else:
+                current, val = BubbleChartDataModel.from_chart(chart, True), "c:yVal"
+            for sm, s in zip(current.series, chart.series):
+                codes = s._element.xpath(f"./{val}/c:numRef/c:numCache/c:formatCode")
+                sm.number_format = codes[0].text if codes else None
+            return current.data_digest() == data.data_digest()
+        except Exception:
+            return False
+
+    def _data_block(self):
+        if self.category_data is not None:
+            return self.category_data
+        if self.xy_data is not None:
+            return self.xy_data
+        return self.bubble_data
+
     def apply_to_slide(self, slide) -> None:
         # Build a new chart from whichever data block is present
         xl_type = _from_chart_type(self.chart_type)
@@ -326,6 +1007,7 @@ class ChartModel(JsonModel):
         top = pt_to_emu(self.top_pt)
         width = pt_to_emu(self.width_pt)
         height = pt_to_emu(self.height_pt)
+        mark_dirty(slide.part)
         gframe = slide.shapes.add_chart(xl_type, left, top, width, height, cd)
         # gframe is a GraphicFrame; access chart
         ch = gframe.chart
@@ -350,6 +1032,8 @@ class ChartModel(JsonModel):
 
     # Update data and selected properties on an existing chart, with formatting snapshot/restore
     def apply_to_existing_chart(self, chart) -> None:
+        _mark_chart_dirty(chart)
+
         # snapshot series-level data label settings to preserve formatting across data replacement
         def _snapshot_dlbls(ch):
             out = []
@@ -571,63 +1255,16 @@ class ChartModel(JsonModel):
     # Workbook-only updates: edit the embedded workbook cells referenced by the chart
     # without touching chart XML. Returns True if updated, False on fallback.
     def update_workbook_only(self, chart) -> bool:
-        # helper: parse a formula like Sheet1!$B$2:$B$5 into (sheet, cells[]) in row-major order
-        def col_to_idx(col: str) -> int:
-            n = 0
-            for ch in col:
-                if ch == "$":
-                    continue
-                n = n * 26 + (ord(ch.upper()) - ord("A") + 1)
-            return n
-
-        def idx_to_col(n: int) -> str:
-            s = ""
-            while n > 0:
-                n, r = divmod(n - 1, 26)
-                s = chr(65 + r) + s
-            return s
-
-        def parse_formula(f: str):
-            if not f:
-                return None
-            txt = f.strip()
-            if "!" not in txt:
-                return None
-            sheet, rng = txt.split("!", 1)
-            if sheet.startswith("'") and sheet.endswith("'"):
-                sheet = sheet[1:-1]
-            parts = rng.split(":")
-
-            def parse_cell(c: str):
-                c = c.replace("$", "")
-                i = 0
-                while i < len(c) and c[i].isalpha():
-                    i += 1
-                col = c[:i]
-                row = int(c[i:]) if i < len(c) else 0
-                return col, row
-
-            if len(parts) == 1:
-                col, row = parse_cell(parts[0])
-                return sheet, [f"{col}{row}"]
-            (c1, r1) = parse_cell(parts[0])
-            (c2, r2) = parse_cell(parts[1])
-            c1i, c2i = col_to_idx(c1), col_to_idx(c2)
-            cells = []
-            for r in range(min(r1, r2), max(r1, r2) + 1):
-                for ci in range(min(c1i, c2i), max(c1i, c2i) + 1):
-                    cells.append(f"{idx_to_col(ci)}{r}")
-            return sheet, cells
-
-        # load workbook blob
         try:
             xlsx_part = chart.part.chart_workbook.xlsx_part
             if xlsx_part is None:
                 return False
-            wb = openpyxl.load_workbook(BytesIO(xlsx_part.blob))
         except Exception:
             return False
 
+        # cell writes are batched per sheet and applied in one pass at the end
+        updates: xlsx.CellUpdates = {}
+
         ser_list = list(chart.series)
 
         # category, scatter, or bubble
@@ -640,19 +1277,27 @@ class ChartModel(JsonModel):
             except Exception:
                 return None
 
-        # write helpers
         def write_range(f: str, values: list):
-            pf = parse_formula(f)
+            pf = xlsx.parse_range(f)
             if pf is None:
                 return
             sheet, cells = pf
-            if sheet not in wb.sheetnames:
-                return
-            ws = wb[sheet]
+            target = updates.setdefault(sheet, {})
+            # cells past the new values are blanked, not left with stale data
+            n = len(values)
             for i, cell in enumerate(cells):
-                if i >= len(values):
-                    break
-                ws[cell].value = values[i]
+                target[cell] = values[i] if i < n else None
+
+        # write what the chart would show: downsampled, if the model asks for it
+        cat_data = self.category_data
+        if cat_data is not None:
+            cat_data = cat_data.downsampled()
+        xy_data = self.xy_data
+        if xy_data is not None:
+            xy_data = xy_data.downsampled()
+        bubble_data = self.bubble_data
+        if bubble_data is not None:
+            bubble_data = bubble_data.downsampled()
 
         try:
             if self.category_data is not None:
@@ -661,8 +1306,8 @@ class ChartModel(JsonModel):
                     f_cat = get_formula(
                         ser_list[0], "./c:cat/c:strRef/c:f"
                     ) or get_formula(ser_list[0], "./c:cat/c:numRef/c:f")
-                    if f_cat and self.category_data.categories:
-                        write_range(f_cat, list(self.category_data.categories))
+                    if f_cat and cat_data.categories:
+                        write_range(f_cat, list(cat_data.categories))
                 # series values
                 for idx, s in enumerate(ser_list):
                     f_val = get_formula(s, "./c:val/c:numRef/c:f")
@@ -670,7 +1315,7 @@ class ChartModel(JsonModel):
                         continue
                     vals = []
                     try:
-                        vals = list(self.category_data.series[idx].values)
+                        vals = list(cat_data.series[idx].point_values())
                     except Exception:
                         vals = []
                     write_range(f_val, vals)
@@ -678,47 +1323,46 @@ class ChartModel(JsonModel):
                 for idx, s in enumerate(ser_list):
                     f_x = get_formula(s, "./c:xVal/c:numRef/c:f")
                     f_y = get_formula(s, "./c:yVal/c:numRef/c:f")
-                    pts = []
-                    try:
-                        pts = list(self.xy_data.series[idx].points)
-                    except Exception:
-                        pts = []
+                    xs, ys = [], []
+                    if idx < len(xy_data.series):
+                        sm = xy_data.series[idx]
+                        xs, ys = sm.x_values(), sm.y_values()
                     if f_x:
-                        write_range(f_x, [p.x for p in pts])
+                        write_range(f_x, xs)
                     if f_y:
-                        write_range(f_y, [p.y for p in pts])
+                        write_range(f_y, ys)
             elif self.bubble_data is not None:
                 for idx, s in enumerate(ser_list):
                     f_x = get_formula(s, "./c:xVal/c:numRef/c:f")
                     f_y = get_formula(s, "./c:yVal/c:numRef/c:f")
                     f_b = get_formula(s, "./c:bubbleSize/c:numRef/c:f")
-                    pts = []
-                    try:
-                        pts = list(self.bubble_data.series[idx].points)
-                    except Exception:
-                        pts = []
+                    xs, ys, sizes = [], [], []
+                    if idx < len(bubble_data.series):
+                        sm = bubble_data.series[idx]
+                        xs, ys, sizes = sm.x_values(), sm.y_values(), sm.sizes()
                     if f_x:
-                        write_range(f_x, [p.x for p in pts])
+                        write_range(f_x, xs)
                     if f_y:
-                        write_range(f_y, [p.y for p in pts])
+                        write_range(f_y, ys)
                     if f_b:
-                        write_range(f_b, [p.size for p in pts])
+                        write_range(f_b, sizes)
             else:
                 return False
         except Exception:
             return False
 
-        # save back to blob
         try:
-            bio = BytesIO()
-            wb.save(bio)
-            chart.part.chart_workbook.update_from_xlsx_blob(bio.getvalue())
+            blob = xlsx.patch_cells(xlsx_part.blob, updates)
+            chart.part.chart_workbook.update_from_xlsx_blob(blob)
+            _mark_chart_dirty(chart)
             return True
         except Exception:
             return False
 
     # Update data and selected properties on an existing chart (no geometry changes)
     def apply_to_existing_chart(self, chart) -> None:
+        _mark_chart_dirty(chart)
+
         # snapshot series-level data label settings to preserve formatting across data replacement
         def _snapshot_dlbls(ch):
             out = []
@@ -934,3 +1578,46 @@ class ChartModel(JsonModel):
                 chart.chart_title.text_frame.text = self.title
             except Exception:
                 pass
+
+
+# Charts refreshed in worker processes travel as blobs: the chart XML and its
+# workbook are rebuilt there into a part that belongs to no package, and the
+# refreshed blobs are swapped back into the real parts on the main thread.
+_DETACHED_CHART = PackURI("/ppt/charts/chart1.xml")
+_DETACHED_XLSX = PackURI("/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx")
+
+
+def _mark_chart_dirty(chart) -> None:
+    # a chart update rewrites the chart XML and its embedded workbook
+    part = chart.part
+    mark_dirty(part)
+    xlsx_part = part.chart_workbook.xlsx_part
+    if xlsx_part is not None:
+        mark_dirty(xlsx_part)
+
+
+def _detached_chart_part(chart_xml: bytes, xlsx_blob: bytes) -> ChartPart:
+    part = ChartPart.load(_DETACHED_CHART, CT.DML_CHART, None, chart_xml)
+    rId = part._element.xlsx_part_rId
+    if rId is not None:
+        xlsx_part = EmbeddedXlsxPart(_DETACHED_XLSX, CT.SML_SHEET, None, xlsx_blob)
+        part.rels._rels[rId] = _Relationship(
+            part.partname.baseURI, rId, RT.PACKAGE, RTM.INTERNAL, xlsx_part
+        )
+    return part
+
+
+def _swap_chart_part(chart_part, chart_xml: bytes, xlsx_blob: bytes) -> None:
+    # in place, so `Chart` objects already handed out stay attached to the part
+    new = parse_xml(chart_xml)
+    old = chart_part._element
+    old.attrib.clear()
+    old.attrib.update(new.attrib)
+    old[:] = list(new)
+    # the part's `Chart` caches objects bound to the replaced children (its
+    # lazy `plots`, `series` and `font`); drop them to be rebuilt from the new XML
+    chart = vars(chart_part).get("chart")
+    if chart is not None:
+        for name in ("plots", "series", "font"):
+            vars(chart).pop(name, None)
+    chart_part.chart_workbook.xlsx_part.blob = xlsx_blob
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+from array import array
+from typing import List, Literal, Sequence
+
+from pydantic import ConfigDict, Field
+
+from .base import JsonModel
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback below
+    np = None
+
+# Point reduction for long series. Both methods return sorted indices into the
+# series, always including its first and last point:
+#
+#   lttb    Largest-Triangle-Three-Buckets (Steinarsson, 2013): one point per
+#           bucket, the one spanning the largest triangle with the point kept
+#           in the previous bucket and the mean of the next. Keeps the shape.
+#   minmax  the lowest and highest point of each bucket. Keeps every extreme,
+#           which matters for spiky data.
+#
+# Missing values (None/NaN) are never picked by lttb; minmax keeps the first
+# point of a bucket that has no values, so gaps stay visible. With NumPy the
+# per-bucket work is vectorized; without it the same algorithms run in Python.
+
+
+class Downsample(JsonModel):
+    """Reduce each series to about `points` points before it is written.
+
+    Both methods are vectorized with NumPy, which mipptx does not require:
+    install it with the `fast` extra (`pip install mipptx[fast]`). Without it
+    they run in pure Python, fine for thousands of points but not millions.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    method: Literal["lttb", "minmax"] = "lttb"
+    points: int = Field(..., ge=3, description="Target point count per series")
+
+
+def select(method: str, x: Sequence | None, y: Sequence, points: int) -> List[int]:
+    """Indices of the points of (`x`, `y`) kept by `method`; `x` None means 0..n-1."""
+    n = len(y)
+    if n <= points:
+        return list(range(n))
+    if method == "minmax":
+        return _minmax(y, points)
+    if method == "lttb":
+        return _lttb(x, y, points)
+    raise ValueError(f"unknown downsample method {method!r}")
+
+
+def take(values, indices: List[int]):
+    """`values` at `indices`, keeping list, array('d') and NumPy columns as they are."""
+    if isinstance(values, array):
+        return array(values.typecode, [values[i] for i in indices])
+    if getattr(values, "dtype", None) is not None:
+        return values[indices]
+    return [values[i] for i in indices]
+
+
+def _floats(values):
+    if np is not None:
+        if isinstance(values, array) or getattr(values, "dtype", None) is not None:
+            return np.asarray(values, dtype=float)
+        return np.array([math.nan if v is None else v for v in values], dtype=float)
+    return [math.nan if v is None else float(v) for v in values]
+
+
+def _minmax(y, points: int) -> List[int]:
+    y = _floats(y)
+    n = len(y)
+    n_buckets = max(1, (points - 2) // 2)
+    size = math.ceil((n - 2) / n_buckets)
+    if np is not None:
+        inner = y[1 : n - 1]
+        pad = n_buckets * size - len(inner)
+        grid = np.concatenate([inner, np.full(pad, np.nan)]).reshape(n_buckets, size)
+        empty = np.isnan(grid).all(axis=1)
+        lo = np.where(np.isnan(grid), np.inf, grid).argmin(axis=1)
+        hi = np.where(np.isnan(grid), -np.inf, grid).argmax(axis=1)
+        lo[empty] = 0
+        hi[empty] = 0
+        base = np.arange(n_buckets) * size + 1
+        picked = np.concatenate([[0], base + lo, base + hi, [n - 1]])
+        return np.unique(picked[picked < n]).tolist()
+    picked = {0, n - 1}
+    for start in range(1, n - 1, size):
+        stop = min(start + size, n - 1)
+        valid = [i for i in range(start, stop) if y[i] == y[i]]
+        if not valid:
+            picked.add(start)
+            continue
+        picked.add(min(valid, key=y.__getitem__))
+        picked.add(max(valid, key=y.__getitem__))
+    return sorted(picked)
+
+
+def _lttb(x, y, points: int) -> List[int]:
+    y = _floats(y)
+    n = len(y)
+    if np is not None:
+        x = np.arange(n, dtype=float) if x is None else _floats(x)
+        valid = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+        if len(valid) <= points:
+            return valid.tolist()
+        return valid[_lttb_numpy(x[valid], y[valid], points)].tolist()
+    x = [float(i) for i in range(n)] if x is None else _floats(x)
+    valid = [i for i in range(n) if x[i] == x[i] and y[i] == y[i]]
+    if len(valid) <= points:
+        return valid
+    xs = [x[i] for i in valid]
+    ys = [y[i] for i in valid]
+    return [valid[i] for i in _lttb_python(xs, ys, points)]
+
+
+def _bucket_edges(n: int, points: int) -> List[int]:
+    # the first and last point are their own buckets; n - 2 points share the rest
+    step = (n - 2) / (points - 2)
+    return [int(1 + i * step) for i in range(points - 2)] + [n - 1]
+
+
+def _lttb_numpy(x, y, points: int):
+    n = len(x)
+    edges = _bucket_edges(n, points)
+    # mean of every bucket at once; bucket i is compared against the mean of i + 1
+    sums_x = np.add.reduceat(x[:-1], edges[:-1])
+    sums_y = np.add.reduceat(y[:-1], edges[:-1])
+    counts = np.diff(edges)
+    mean_x = np.append(sums_x / counts, x[-1])
+    mean_y = np.append(sums_y / counts, y[-1])
+    out = np.empty(points, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        # twice the triangle area; the constant factor does not change the argmax
+        area = np.abs(
+            (ax - mean_x[i + 1]) * (y[lo:hi] - ay)
+            - (ax - x[lo:hi]) * (mean_y[i + 1] - ay)
+        )
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def _lttb_python(x: list, y: list, points: int) -> List[int]:
+    n = len(x)
+    edges = _bucket_edges(n, points)
+    out = [0]
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx = sum(x[nlo:nhi]) / (nhi - nlo)
+        cy = sum(y[nlo:nhi]) / (nhi - nlo)
+        ax, ay = x[a], y[a]
+        best = lo
+        best_area = -1.0
+        for j in range(lo, hi):
+            area = abs((ax - cx) * (y[j] - ay) - (ax - x[j]) * (cy - ay))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(best)
+        a = best
+    out.append(n - 1)
+    return out
@@ -106,3 +106,57 @@ def from_auto_size(auto_size: AutoSize | None):
         AutoSize.shape_to_fit_text: AS.SHAPE_TO_FIT_TEXT,
     }
     return reverse[auto_size]
+
+
+# -- helpers to map raw OOXML attribute values (used by the lxml reader)
+_XML_ALIGNMENT = {
+    "l": ParagraphAlignment.left,
+    "ctr": ParagraphAlignment.center,
+    "r": ParagraphAlignment.right,
+    "just": ParagraphAlignment.justify,
+    "dist": ParagraphAlignment.distributed,
+}
+
+_XML_VERTICAL_ANCHOR = {
+    "t": VerticalAnchor.top,
+    "ctr": VerticalAnchor.middle,
+    "b": VerticalAnchor.bottom,
+}
+
+_XML_AUTO_SIZE = {
+    "noAutofit": AutoSize.none,
+    "normAutofit": AutoSize.text_to_fit_shape,
+    "spAutoFit": AutoSize.shape_to_fit_text,
+}
+
+
+def xml_to_alignment(algn: str | None) -> ParagraphAlignment | None:
+    return _XML_ALIGNMENT.get(algn)
+
+
+def xml_to_vertical_anchor(anchor: str | None) -> VerticalAnchor | None:
+    return _XML_VERTICAL_ANCHOR.get(anchor)
+
+
+def xml_to_auto_size(autofit_local_name: str | None) -> AutoSize:
+    # absence of an autofit element maps like python-pptx's `None`
+    return _XML_AUTO_SIZE.get(autofit_local_name, AutoSize.none)
+
+
+# -- and back, for the XML writers
+_ALIGNMENT_XML = {v: k for k, v in _XML_ALIGNMENT.items()}
+_VERTICAL_ANCHOR_XML = {v: k for k, v in _XML_VERTICAL_ANCHOR.items()}
+_AUTO_SIZE_XML = {v: k for k, v in _XML_AUTO_SIZE.items()}
+
+
+def alignment_to_xml(alignment: ParagraphAlignment | None) -> str | None:
+    return _ALIGNMENT_XML.get(alignment)
+
+
+def vertical_anchor_to_xml(anchor: VerticalAnchor | None) -> str | None:
+    return _VERTICAL_ANCHOR_XML.get(anchor)
+
+
+def auto_size_to_xml(auto_size: AutoSize | None) -> str | None:
+    # local name of the autofit element; None writes none, as python-pptx does
+    return _AUTO_SIZE_XML.get(auto_size)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Columnar interop for the data models: Arrow tables (anything `pyarrow.table()`
+# accepts, e.g. polars frames via the Arrow C stream) and pandas DataFrames in,
+# Arrow tables out. Float columns come out as NumPy float64 buffers with NaN for
+# nulls, which `PointColumns` and `CategorySeriesModel.column` take without
+# copying; neither side builds one Python object per value except where a model
+# field is a Python list.
+# pyarrow and pandas are optional and only imported by these helpers; install
+# them with the `arrow` / `pandas` extras (`pip install mipptx[arrow]`).
+
+# schema metadata key of `{series name: number format}` in exported tables
+NUMBER_FORMATS_KEY = b"mipptx.number_formats"
+# field metadata key of a series column's number format
+NUMBER_FORMAT_KEY = b"number_format"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow interop needs pyarrow: pip install mipptx[arrow]"
+        ) from e
+    return pyarrow
+
+
+class _ArrowFrame:
+    """Column access over a `pyarrow.Table`."""
+
+    def __init__(self, table):
+        pa = _pyarrow()
+        if not isinstance(table, pa.Table):
+            table = pa.table(table)
+        self.table = table
+
+    def names(self) -> List[str]:
+        return self.table.column_names
+
+    def floats(self, name):
+        import pyarrow.compute as pc
+
+        pa = _pyarrow()
+        col = self.table.column(name)
+        if col.type != pa.float64():
+            col = pc.cast(col, pa.float64())
+        if col.null_count:
+            col = col.fill_null(math.nan)
+        # zero-copy for a single null-free chunk; otherwise one C-level copy
+        return col.to_numpy()
+
+    def strings(self, name) -> List[str]:
+        import pyarrow.compute as pc
+
+        pa = _pyarrow()
+        col = self.table.column(name)
+        if pa.types.is_floating(col.type):
+            # Arrow's cast writes 1.0 as "1"; format as the pandas adapter does
+            return [
+                "" if v is None or v != v else _float_text(v) for v in col.to_pylist()
+            ]
+        if not pa.types.is_string(col.type) and not pa.types.is_large_string(col.type):
+            col = pc.cast(col, pa.string())
+        return col.fill_null("").to_pylist()
+
+    def label_column(self, name):
+        # categories default to the first column
+        return self.names()[0] if name is None else name
+
+    def labels(self, name) -> List[str]:
+        return self.strings(name)
+
+    def groups(self, name) -> Iterator[Tuple[object, "_ArrowFrame"]]:
+        import pyarrow.compute as pc
+
+        col = self.table.column(name)
+        for key in pc.unique(col).to_pylist():
+            mask = pc.is_null(col) if key is None else pc.equal(col, key)
+            yield key, _ArrowFrame(self.table.filter(mask))
+
+    def number_format(self, name) -> Optional[str]:
+        meta = self.table.schema.field(name).metadata or {}
+        fmt = meta.get(NUMBER_FORMAT_KEY)
+        return fmt.decode() if fmt else None
+
+    def number_formats(self) -> Dict[str, str]:
+        meta = self.table.schema.metadata or {}
+        raw = meta.get(NUMBER_FORMATS_KEY)
+        return json.loads(raw) if raw else {}
+
+
+class _PandasFrame:
+    """Column access over a pandas DataFrame; its index stands in for a label column."""
+
+    def __init__(self, df):
+        self.df = df
+
+    def names(self) -> list:
+        return list(self.df.columns)
+
+    def floats(self, name):
+        import numpy as np
+
+        return self.df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def strings(self, name) -> List[str]:
+        return _pandas_strings(self.df[name])
+
+    def label_column(self, name):
+        # categories default to the index, which is not a column
+        return name
+
+    def labels(self, name) -> List[str]:
+        if name is None:
+            return _pandas_strings(self.df.index)
+        return self.strings(name)
+
+    def groups(self, name) -> Iterator[Tuple[object, "_PandasFrame"]]:
+        for key, sub in self.df.groupby(name, sort=False, dropna=False):
+            yield key, _PandasFrame(sub)
+
+    def number_format(self, name) -> Optional[str]:
+        return None
+
+    def number_formats(self) -> Dict[str, str]:
+        return {}
+
+
+def _float_text(value: float) -> str:
+    # the text of a float cell for every adapter: Python's shortest round-trip
+    # form ("1.0", "0.1", "1e+20"); null and NaN cells are blank
+    return repr(value)
+
+
+def _pandas_strings(values) -> List[str]:
+    missing = values.isna().tolist()
+    return [
+        "" if m else _float_text(v) if type(v) is float else str(v)
+        for v, m in zip(values.tolist(), missing)
+    ]
+
+
+def arrow_frame(table) -> _ArrowFrame:
+    """Adapter for a `pyarrow.Table`, or anything `pyarrow.table()` accepts."""
+    return _ArrowFrame(table)
+
+
+def dataframe_frame(df):
+    """Adapter for a pandas DataFrame, or for any other frame via Arrow."""
+    if hasattr(df, "iloc") and hasattr(df, "columns"):
+        return _PandasFrame(df)
+    if hasattr(df, "to_arrow"):
+        return _ArrowFrame(df.to_arrow())
+    return _ArrowFrame(df)
+
+
+def value_columns(frame, exclude, names) -> list:
+    """Columns named in `names` (one name or a list), or all but `exclude`."""
+    if names is None:
+        skip = {n for n in exclude if n is not None}
+        return [n for n in frame.names() if n not in skip]
+    return [names] if isinstance(names, str) else list(names)
+
+
+def long_series(
+    frame, series, columns: List[str]
+) -> List[Tuple[str, Optional[str], list]]:
+    """(name, number format, float columns) for each value of the `series` column.
+
+    Series keep the order in which their names first appear.
+    """
+    formats = frame.number_formats()
+    out = []
+    for key, part in frame.groups(series):
+        name = "" if key is None or key != key else str(key)
+        out.append((name, formats.get(name), [part.floats(c) for c in columns]))
+    return out
+
+
+def float_array(values):
+    """A `pyarrow.Array` of float64 from a list, array('d') or NumPy column; NaN/None -> null."""
+    pa = _pyarrow()
+    if isinstance(values, array) or getattr(values, "dtype", None) is not None:
+        import numpy as np
+
+        # np.asarray views array('d') through the buffer protocol, no copy
+        return pa.array(np.asarray(values, dtype=np.float64), from_pandas=True)
+    return pa.array(values, type=pa.float64(), from_pandas=True)
+
+
+def category_table(
+    categories: List[str], series: Sequence[Tuple[str, Optional[str], list]]
+):
+    """Wide table: a `category` column, then one float64 column per series.
+
+    Each entry of `series` is (name, number format, values); the number format
+    is kept in the column's field metadata.
+    """
+    pa = _pyarrow()
+    fields = [pa.field("category", pa.string())]
+    arrays = [pa.array(categories, type=pa.string())]
+    for name, fmt, values in series:
+        meta = {NUMBER_FORMAT_KEY: fmt} if fmt else None
+        fields.append(pa.field(name, pa.float64(), metadata=meta))
+        arrays.append(float_array(values))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def series_table(
+    columns: List[str],
+    series: Sequence[Tuple[str, Optional[str], list]],
+):
+    """Long-format table: a `series` name column, then `columns`, one chunk per series.
+
+    Each entry of `series` is (name, number format, [column values...]). Number
+    formats go to the schema metadata, where `from_arrow` picks them up again.
+    """
+    pa = _pyarrow()
+    fields = [pa.field("series", pa.string())] + [
+        pa.field(c, pa.float64()) for c in columns
+    ]
+    formats = {name: fmt for name, fmt, _ in series if fmt}
+    schema = pa.schema(
+        fields,
+        metadata={NUMBER_FORMATS_KEY: json.dumps(formats)} if formats else None,
+    )
+    batches = []
+    for name, _, cols in series:
+        arrays = [float_array(c) for c in cols]
+        n = len(arrays[0]) if arrays else 0
+        names = pa.repeat(pa.scalar(name, pa.string()), n)
+        batches.append(pa.RecordBatch.from_arrays([names, *arrays], schema=schema))
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def text_table(names: List[str], rows: List[List[str]]):
+    """String table with columns `names` from row-major cell text; short rows are padded."""
+    pa = _pyarrow()
+    width = len(names)
+    columns = [[] for _ in range(width)]
+    for row in rows:
+        for i in range(width):
+            columns[i].append(row[i] if i < len(row) else "")
+    arrays = [pa.array(col, type=pa.string()) for col in columns]
+    return pa.Table.from_arrays(arrays, names=names)
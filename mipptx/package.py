@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import struct
+import sys
+import tempfile
+import time
+import weakref
+import zipfile
+from typing import IO, Callable, Dict, List, Optional, Union
+
+from pptx import Presentation as _Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+from pydantic import ConfigDict, Field
+
+from .base import JsonModel
+
+_LOCAL_HEADER_SIG = b"PK\x03\x04"
+_LOCAL_HEADER_SIZE = 30
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_COPY_CHUNK = 1024 * 1024
+# `_PackageZip.copy_raw` appends members through these `zipfile.ZipFile`
+# internals, unchanged across the CPython versions below; elsewhere it falls
+# back to decompressing and writing the member like any other part
+_ZIP_INTERNALS = ("_lock", "_writecheck", "_didModify", "_seekable", "start_dir")
+_RAW_COPY = sys.implementation.name == "cpython" and (
+    (3, 8) <= sys.version_info[:2] <= (3, 14)
+)
+
+
+class _Tracking:
+    """Where a package came from and which of its parts mipptx has touched."""
+
+    __slots__ = ("source", "stamp", "members", "dirty")
+
+    def __init__(self, source: str, parts):
+        self.source = source
+        st = os.stat(source)
+        self.stamp = (st.st_mtime_ns, st.st_size)
+        # part -> member name in `source`; survives python-pptx renaming slide parts
+        self.members = weakref.WeakKeyDictionary(
+            (part, part.partname.membername) for part in parts
+        )
+        self.dirty = weakref.WeakSet()
+
+
+# package -> _Tracking, for presentations opened via `open_presentation`
+_tracked: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def open_presentation(path: str):
+    """Open `path` as a `pptx.Presentation` that `save_incremental` can write."""
+    path = os.path.abspath(os.fspath(path))
+    prs = _Presentation(path)
+    package = prs.part.package
+    _tracked[package] = _Tracking(path, package.iter_parts())
+    return prs
+
+
+def mark_dirty(part) -> None:
+    """Record that `part` was modified and must be re-serialized on save.
+
+    mipptx operations mark the parts they change; code that edits a tracked
+    presentation through python-pptx directly must mark those parts itself.
+    Parts of untracked packages, or of none (such as the detached chart parts
+    `refresh_charts` works on in its workers), are ignored.
+    """
+    package = part.package
+    if package is None:
+        return
+    state = _tracked.get(package)
+    if state is not None:
+        state.dirty.add(part)
+
+
+def _mark_owner_dirty(obj) -> None:
+    # `mark_dirty` the part holding python-pptx object `obj` (slide, shape, text
+    # frame, paragraph); anything without a part is ignored
+    part = getattr(obj, "part", None)
+    if part is not None:
+        mark_dirty(part)
+
+
+class _PartnameAllocator:
+    """Stand-in for `OpcPackage.next_partname` that scans the package once per template."""
+
+    def __init__(self, package):
+        self._package = package
+        self._scan = package.next_partname
+        self._used: Dict[str, set] = {}
+
+    def __call__(self, tmpl: str) -> PackURI:
+        prefix = tmpl.split("%d", 1)[0]
+        if prefix == _SLIDE_PREFIX:
+            # python-pptx renumbers slide parts behind our back; keep its scan
+            return self._scan(tmpl)
+        used = self._used.get(tmpl)
+        if used is None:
+            used = self._used[tmpl] = {
+                p.partname
+                for p in self._package.iter_parts()
+                if p.partname.startswith(prefix)
+            }
+        # python-pptx takes the lowest free number; counting down from one past
+        # the used count finds a free one at once when the numbers have no gaps
+        # (the usual case), at the cost of not always picking the lowest one
+        for n in range(len(used) + 1, 0, -1):
+            candidate = tmpl % n
+            if candidate not in used:
+                used.add(candidate)
+                return PackURI(candidate)
+        raise RuntimeError(f"no free partname for {tmpl!r}")
+
+
+_SLIDE_PREFIX = "/ppt/slides/slide"
+
+
+@contextlib.contextmanager
+def fast_partnames(package):
+    """Hand out new partnames for `package` without rescanning it for every part.
+
+    python-pptx walks the whole relationship graph each time it adds a part
+    (chart, workbook, notes slide...), which makes building a deck quadratic in
+    its part count. Within this block each partname template is scanned once
+    and names are tracked as they are handed out. Parts must be added through
+    python-pptx, as usual, while it is active.
+    """
+    package.next_partname = _PartnameAllocator(package)
+    try:
+        yield package
+    finally:
+        del package.next_partname
+
+
+_CT_CONTENT_TYPES = "application/vnd.openxmlformats-package.content-types+xml"
+# payloads that are compressed already; deflating them again costs CPU for ~0 bytes
+_PRECOMPRESSED_PREFIXES = ("audio/", "video/")
+_PRECOMPRESSED_TYPES = frozenset(
+    {"image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"}
+)
+_PRECOMPRESSED_SUFFIXES = (
+    "spreadsheetml.sheet",
+    "wordprocessingml.document",
+    "presentationml.presentation",
+)
+
+
+class CompressionPolicy(JsonModel):
+    """Per-part deflate levels used when writing a package; `None` stores a part."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    xml_level: Optional[int] = Field(6, ge=0, le=9, description="XML parts and rels")
+    media_level: Optional[int] = Field(
+        None, ge=0, le=9, description="Already-compressed media and embedded packages"
+    )
+    binary_level: Optional[int] = Field(6, ge=0, le=9, description="Other binary parts")
+
+    @classmethod
+    def resolve(cls, compression: Compression) -> "CompressionPolicy":
+        """Accept a policy, a preset name, or a deflate level for XML/binary parts."""
+        if isinstance(compression, CompressionPolicy):
+            return compression
+        if isinstance(compression, bool):
+            raise TypeError("compression must be a preset name, level or policy")
+        if isinstance(compression, int):
+            return cls(xml_level=compression, binary_level=compression)
+        try:
+            return _PRESETS[compression]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"unknown compression {compression!r}; expected one of "
+                f"{sorted(_PRESETS)}, a level 0-9 or a CompressionPolicy"
+            ) from None
+
+    def level_for(self, content_type: str) -> Optional[int]:
+        if content_type.endswith("xml"):
+            return self.xml_level
+        if (
+            content_type in _PRECOMPRESSED_TYPES
+            or content_type.startswith(_PRECOMPRESSED_PREFIXES)
+            or content_type.endswith(_PRECOMPRESSED_SUFFIXES)
+        ):
+            return self.media_level
+        return self.binary_level
+
+
+Compression = Union[str, int, CompressionPolicy]
+
+_PRESETS = {
+    # what python-pptx writes: everything deflated at zlib's default level
+    "default": CompressionPolicy(xml_level=6, media_level=6, binary_level=6),
+    # deflate what shrinks, store media that is compressed already
+    "balanced": CompressionPolicy(),
+    # cheapest deflate; for previews and intermediate artifacts
+    "fast": CompressionPolicy(xml_level=1, media_level=None, binary_level=1),
+    "stored": CompressionPolicy(xml_level=None, media_level=None, binary_level=None),
+}
+
+
+class PartTypeStats(JsonModel):
+    model_config = ConfigDict(extra="forbid")
+
+    content_type: str
+    parts: int = 0
+    bytes_in: int = Field(0, description="Uncompressed bytes")
+    bytes_out: int = Field(0, description="Bytes stored in the archive")
+    seconds: float = Field(0.0, description="Serialization + compression time")
+
+
+class SaveReport(JsonModel):
+    model_config = ConfigDict(extra="forbid")
+
+    bytes_written: int = 0
+    seconds: float = 0.0
+    types: List[PartTypeStats] = Field(
+        default_factory=list, description="Per content type, largest output first"
+    )
+
+
+class _PackageZip:
+    """Zip writer applying a `CompressionPolicy`, with per-content-type accounting.
+
+    It can also copy members from another archive without recompressing them.
+    """
+
+    def __init__(self, file: str | IO[bytes], policy: CompressionPolicy):
+        self._file = file
+        self._start = 0 if isinstance(file, (str, os.PathLike)) else file.tell()
+        self._zf = zipfile.ZipFile(
+            file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+        )
+        self._policy = policy
+        self._raw_copy = _RAW_COPY and all(
+            hasattr(self._zf, name) for name in _ZIP_INTERNALS
+        )
+        self._stats: Dict[str, PartTypeStats] = {}
+        self._t0 = time.perf_counter()
+        self.report: SaveReport | None = None
+
+    def __enter__(self) -> "_PackageZip":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._zf.close()
+        if isinstance(self._file, (str, os.PathLike)):
+            written = os.path.getsize(self._file)
+        else:
+            written = self._file.tell() - self._start
+        self.report = SaveReport(
+            bytes_written=written,
+            seconds=time.perf_counter() - self._t0,
+            types=sorted(self._stats.values(), key=lambda s: -s.bytes_out),
+        )
+
+    def _account(self, content_type: str, zinfo: zipfile.ZipInfo, t0: float) -> None:
+        stats = self._stats.get(content_type)
+        if stats is None:
+            stats = self._stats[content_type] = PartTypeStats(content_type=content_type)
+        stats.parts += 1
+        stats.bytes_in += zinfo.file_size
+        stats.bytes_out += zinfo.compress_size
+        stats.seconds += time.perf_counter() - t0
+
+    def write(
+        self, arcname: str, content_type: str, get_blob: Callable[[], bytes]
+    ) -> None:
+        """Serialize via `get_blob` and store under `arcname`; both are timed."""
+        t0 = time.perf_counter()
+        blob = get_blob()
+        level = self._policy.level_for(content_type)
+        if level is None:
+            self._zf.writestr(arcname, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zf.writestr(
+                arcname, blob, compress_type=zipfile.ZIP_DEFLATED, compresslevel=level
+            )
+        self._account(content_type, self._zf.NameToInfo[arcname], t0)
+
+    def copy_raw(
+        self,
+        src: zipfile.ZipFile,
+        src_fp,
+        name: str,
+        arcname: str,
+        content_type: str,
+    ) -> None:
+        """Copy member `name` of `src` as `arcname`, moving its compressed bytes as-is.
+
+        Where that is not supported (see `_RAW_COPY`) the member is decompressed
+        and written with the policy's compression instead.
+        """
+        t0 = time.perf_counter()
+        info = src.getinfo(name)
+        if info.flag_bits & _FLAG_ENCRYPTED:
+            raise ValueError(f"cannot copy encrypted zip member {name!r}")
+        if not self._raw_copy:
+            self.write(arcname, content_type, lambda: src.read(name))
+            return
+        src_fp.seek(info.header_offset)
+        header = src_fp.read(_LOCAL_HEADER_SIZE)
+        if header[:4] != _LOCAL_HEADER_SIG:
+            raise zipfile.BadZipFile(f"bad local file header for {name!r}")
+        name_len, extra_len = struct.unpack_from("<HH", header, 26)
+        src_fp.seek(name_len + extra_len, os.SEEK_CUR)
+
+        zinfo = zipfile.ZipInfo(arcname, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.CRC = info.CRC
+        zinfo.compress_size = info.compress_size
+        zinfo.file_size = info.file_size
+        zinfo.create_system = info.create_system
+        zinfo.external_attr = info.external_attr
+        # sizes go in the local header, so no trailing data descriptor is written
+        zinfo.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+        zf = self._zf
+        with zf._lock:
+            zf._writecheck(zinfo)
+            zf._didModify = True
+            if zf._seekable:
+                zf.fp.seek(zf.start_dir)
+            zinfo.header_offset = zf.fp.tell()
+            zf.fp.write(zinfo.FileHeader(zip64))
+            remaining = info.compress_size
+            while remaining:
+                chunk = src_fp.read(min(remaining, _COPY_CHUNK))
+                if not chunk:
+                    raise zipfile.BadZipFile(f"truncated zip member {name!r}")
+                zf.fp.write(chunk)
+                remaining -= len(chunk)
+            zf.start_dir = zf.fp.tell()
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[arcname] = zinfo
+        self._account(content_type, zinfo, t0)
+
+
+def _write_package(dst: _PackageZip, package, parts, state=None, src=None, src_fp=None):
+    dst.write(
+        CONTENT_TYPES_URI.membername,
+        _CT_CONTENT_TYPES,
+        lambda: serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+    )
+    dst.write(
+        PACKAGE_URI.rels_uri.membername, CT.OPC_RELATIONSHIPS, lambda: package._rels.xml
+    )
+    for part in parts:
+        member = state.members.get(part) if state is not None else None
+        if member is not None and part not in state.dirty:
+            dst.copy_raw(
+                src, src_fp, member, part.partname.membername, part.content_type
+            )
+        else:
+            dst.write(part.partname.membername, part.content_type, lambda: part.blob)
+        if part._rels:
+            dst.write(
+                part.partname.rels_uri.membername,
+                CT.OPC_RELATIONSHIPS,
+                lambda: part.rels.xml,
+            )
+
+
+def save_presentation(
+    prs, file: str | IO[bytes], compression: Compression = "balanced"
+) -> SaveReport:
+    """Save `prs` like `prs.save`, with per-part compression; returns a `SaveReport`.
+
+    `compression` is a preset name ("default", "balanced", "fast", "stored"), a
+    deflate level applied to XML and binary parts, or a `CompressionPolicy`.
+    """
+    policy = CompressionPolicy.resolve(compression)
+    package = prs.part.package
+    with _PackageZip(file, policy) as dst:
+        _write_package(dst, package, list(package.iter_parts()))
+    return dst.report
+
+
+def save_incremental(
+    prs, file: str | IO[bytes], compression: Compression = "default"
+) -> SaveReport:
+    """Save a presentation from `open_presentation`, re-serializing only dirty parts.
+
+    Parts that were not marked dirty are copied byte-for-byte from the source
+    file, compressed stream included. New and dirty parts, every `.rels` item,
+    and `[Content_Types].xml` are serialized as `save_presentation` would with
+    `compression`. `file` may be the source path itself. After saving to a path,
+    that file becomes the source for the next incremental save.
+    """
+    policy = CompressionPolicy.resolve(compression)
+    package = prs.part.package
+    state = _tracked.get(package)
+    if state is None:
+        raise ValueError(
+            "presentation is not tracked; open it with open_presentation() or use prs.save()"
+        )
+    st = os.stat(state.source)
+    if (st.st_mtime_ns, st.st_size) != state.stamp:
+        raise ValueError(f"source file changed since it was opened: {state.source}")
+
+    parts = list(package.iter_parts())
+    target = None
+    out: str | IO[bytes] = file
+    if isinstance(file, (str, os.PathLike)):
+        target = os.path.abspath(os.fspath(file))
+        if os.path.exists(target) and os.path.samefile(target, state.source):
+            fd, out = tempfile.mkstemp(
+                suffix=".pptx", dir=os.path.dirname(target) or None
+            )
+            os.close(fd)
+
+    try:
+        with (
+            zipfile.ZipFile(state.source) as src,
+            open(state.source, "rb") as src_fp,
+            _PackageZip(out, policy) as dst,
+        ):
+            _write_package(dst, package, parts, state, src, src_fp)
+    except BaseException:
+        if out is not file:
+            os.remove(out)
+        raise
+    if out is not file:
+        os.replace(out, target)
+
+    if target is not None:
+        _tracked[package] = _Tracking(target, parts)
+    return dst.report
@@ -1,16 +1,104 @@
 from __future__ import annotations
 
+import itertools
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
-from typing import List, Optional
+from typing import Container, Dict, Iterable, Iterator, List, Literal, Optional
 
+import pydantic_core
 from pptx import Presentation as _Presentation
-from pydantic import ConfigDict, Field
+from pptx.api import _default_pptx_path
+from pydantic import ConfigDict, Field, model_validator
 
+from . import binary
 from .base import JsonModel
-from .charts import ChartModel
+from .cache import template_cache
+from .charts import ChartModel, _detached_chart_part, _swap_chart_part
+from .enums import ShapeKind
+from .package import (
+    Compression,
+    SaveReport,
+    fast_partnames,
+    mark_dirty,
+    save_presentation,
+)
+from .reader import PackageReader, iter_slides
 from .slide import SlideModel
+from .text import FontModel, RunModel, RunNormalizationReport
 from .utils import emu_to_inches, inches_to_emu
 
+# per-process state for `from_file(..., workers=N)`; each worker opens the package once
+_worker_source = None
+
+
+_worker_kinds = None
+_worker_normalize = False
+
+
+def _init_extract_worker(path: str, engine: str, kinds, normalize_runs: bool) -> None:
+    global _worker_source, _worker_kinds, _worker_normalize
+    if engine == "lxml":
+        _worker_source = PackageReader(path)
+    else:
+        _worker_source = _Presentation(path).slides
+    _worker_kinds = kinds
+    _worker_normalize = normalize_runs
+
+
+def _extract_slides(indices: List[int]) -> List[SlideModel]:
+    if isinstance(_worker_source, PackageReader):
+        out = [_worker_source.read_slide(i, _worker_kinds) for i in indices]
+    else:
+        out = [SlideModel.from_pptx(_worker_source[i], _worker_kinds) for i in indices]
+    if _worker_normalize:
+        # in the worker, so the merged (smaller) slides are what gets pickled back
+        for slide_model in out:
+            slide_model.normalize_runs()
+    return out
+
+
+class ChartRefreshReport(JsonModel):
+    model_config = ConfigDict(extra="forbid")
+
+    updated: int = Field(0, description="Charts whose data or properties were written")
+    skipped: int = Field(0, description="Charts that already matched their model")
+    failed: int = Field(0, description="Charts whose update raised")
+
+
+# every run's `font`, for dumps that write runs by `style_id`; follows the
+# runs `iter_runs` visits (text boxes and rich table cells)
+_TEXT_FRAME_FONTS = {"paragraphs": {"__all__": {"runs": {"__all__": {"font"}}}}}
+_RUN_FONTS = {
+    "slides": {
+        "__all__": {
+            "shapes": {
+                "__all__": {
+                    "text_frame": _TEXT_FRAME_FONTS,
+                    "rows": {"__all__": {"__all__": _TEXT_FRAME_FONTS}},
+                }
+            }
+        }
+    }
+}
+
+
+def _dumped_runs(data: dict) -> Iterator[dict]:
+    # the run dicts of a `PresentationModel` dump, in `iter_runs` order
+    for slide_data in data["slides"]:
+        for shape_data in slide_data["shapes"]:
+            frame = shape_data.get("text_frame")
+            if frame is not None:
+                for para in frame["paragraphs"]:
+                    yield from para["runs"]
+            for row in shape_data.get("rows") or ():
+                for cell in row:
+                    if isinstance(cell, dict):
+                        for para in cell["paragraphs"]:
+                            yield from para["runs"]
+
 
 class PresentationModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
@@ -22,24 +110,247 @@ class PresentationModel(JsonModel):
         None, gt=0, description="Slide height in inches"
     )
     slides: List[SlideModel] = Field(default_factory=list)
+    styles: List[FontModel] = Field(
+        default_factory=list,
+        description="Distinct run fonts, referenced by `RunModel.style_id`",
+    )
+
+    @model_validator(mode="after")
+    def _validate_styles(self) -> "PresentationModel":
+        self._link_styles()
+        return self
+
+    def _link_styles(self) -> None:
+        # point runs loaded with a `style_id` and no font at the shared style; a
+        # run that also carries its own font keeps it
+        styles = self.styles
+        if not styles:
+            return
+        for run in self.iter_runs():
+            i = run.style_id
+            if i is None:
+                continue
+            if i >= len(styles):
+                raise ValueError(f"style_id {i} out of range for {len(styles)} styles")
+            if run.font is None:
+                run.font = styles[i]
+
+    def _style_table(self) -> tuple[List[FontModel], List[Optional[int]]]:
+        # (distinct run fonts, each run's index into them) in `iter_runs` order
+        index: Dict[FontModel, int] = {}
+        styles: List[FontModel] = []
+        ids: List[Optional[int]] = []
+        for run in self.iter_runs():
+            font = run.font
+            if font is None:
+                ids.append(None)
+                continue
+            i = index.get(font)
+            if i is None:
+                i = index[font] = len(styles)
+                styles.append(font)
+            ids.append(i)
+        return styles, ids
+
+    def _styled_dump(self, **kwargs) -> dict:
+        # `model_dump(mode="json")` with runs written by `style_id` against a
+        # style table built from the fonts as they are now; the model is left as is
+        styles, ids = self._style_table()
+        kwargs.setdefault("exclude", _RUN_FONTS)
+        data = self.model_dump(mode="json", **kwargs)
+        for run, i in zip(_dumped_runs(data), ids, strict=True):
+            run["style_id"] = i
+        data["styles"] = [font.model_dump(mode="json") for font in styles]
+        return data
+
+    # ---------- JSON/binary with the style table ----------
+    def to_json(self, **kwargs) -> str:
+        """`JsonModel.to_json`; with a style table, runs store a `style_id` for their font.
+
+        The table written is rebuilt from the current run fonts (as
+        `intern_styles` would), so fonts edited since are written correctly;
+        the model itself is not changed.
+        """
+        if not self.styles:
+            return super().to_json(**kwargs)
+        indent = kwargs.pop("indent", None)
+        return pydantic_core.to_json(
+            self._styled_dump(**kwargs), indent=indent
+        ).decode()
+
+    def to_bytes(self) -> bytes:
+        if not self.styles:
+            return super().to_bytes()
+        return binary.encode(self._styled_dump())
+
+    @classmethod
+    def from_json(
+        cls,
+        data: str | bytes,
+        trusted: bool = False,
+        validate_every: int | None = None,
+    ) -> "PresentationModel":
+        model = super().from_json(data, trusted, validate_every)
+        if trusted:
+            # trusted loads skip validators, `_validate_styles` included
+            model._link_styles()
+        return model
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        trusted: bool = False,
+        validate_every: int | None = None,
+    ) -> "PresentationModel":
+        model = super().from_bytes(data, trusted, validate_every)
+        if trusted:
+            model._link_styles()
+        return model
+
+    def iter_runs(self) -> Iterator[RunModel]:
+        """Runs of every slide, in slide and shape order."""
+        for slide_model in self.slides:
+            yield from slide_model.iter_runs()
+
+    def intern_styles(self) -> List[FontModel]:
+        """Collect the distinct run fonts into `styles` and share them, in place.
+
+        Equal fonts become one (frozen) instance and each run with a font gets
+        its `style_id`. From then on `to_json`/`to_bytes` write every style once
+        and runs by id, and loading validates each style once instead of per run.
+        Returns `styles`.
+        """
+        styles, ids = self._style_table()
+        for run, i in zip(self.iter_runs(), ids):
+            run.style_id = i
+            if i is not None:
+                run.font = styles[i]
+        self.styles = styles
+        return styles
 
     # ---------- Construction from python-pptx ----------
     @classmethod
-    def from_presentation(cls, prs) -> "PresentationModel":
-        """Build a model from a `pptx.Presentation` instance."""
+    def from_presentation(
+        cls,
+        prs,
+        slides: Iterable[int] | None = None,
+        kinds: Container[ShapeKind] | None = None,
+        normalize_runs: bool = False,
+    ) -> "PresentationModel":
+        """Build a model from a `pptx.Presentation` instance.
+
+        `slides` limits extraction to those 0-based slide indices (the model then
+        holds only those slides, in the given order) and `kinds` to shapes of those
+        `ShapeKind`s; everything else is skipped before conversion.
+        `normalize_runs` merges same-format runs as they are read (see
+        `PresentationModel.normalize_runs`).
+        """
         sw = emu_to_inches(getattr(prs, "slide_width", None))
         sh = emu_to_inches(getattr(prs, "slide_height", None))
-        slides = [SlideModel.from_pptx(s) for s in prs.slides]
-        return cls(slide_width_in=sw, slide_height_in=sh, slides=slides)
+        pptx_slides = prs.slides
+        if slides is not None:
+            pptx_slides = [pptx_slides[i] for i in slides]
+        slide_models = [SlideModel.from_pptx(s, kinds) for s in pptx_slides]
+        if normalize_runs:
+            for slide_model in slide_models:
+                slide_model.normalize_runs()
+        return cls(slide_width_in=sw, slide_height_in=sh, slides=slide_models)
+
+    @classmethod
+    def from_file(
+        cls,
+        path,
+        workers: int | None = None,
+        engine: Literal["pptx", "lxml"] = "pptx",
+        slides: Iterable[int] | None = None,
+        kinds: Container[ShapeKind] | None = None,
+        normalize_runs: bool = False,
+    ) -> "PresentationModel":
+        """Build a model from a `.pptx` file.
+
+        `engine="pptx"` goes through python-pptx (`from_presentation`);
+        `engine="lxml"` reads the slide XML directly with `PackageReader`, skipping
+        the python-pptx proxies. Both produce the same model.
+
+        With `workers` > 1 the slides are split into shards extracted by a process
+        pool; each worker opens the package once and results are merged back in
+        slide order, matching the serial path exactly.
+
+        `slides` and `kinds` filter as in `from_presentation`; with the lxml engine
+        skipped slides are never parsed at all. `normalize_runs` is as in
+        `from_presentation`; with workers the runs are merged in the workers.
+        """
+        path = os.fspath(path)
+        with PackageReader(path) as reader:
+            sw = emu_to_inches(reader.slide_width)
+            sh = emu_to_inches(reader.slide_height)
+            indices = list(range(len(reader)) if slides is None else slides)
+            if not workers or workers <= 1 or len(indices) <= 1:
+                if engine == "lxml":
+                    slide_models = list(
+                        reader.iter_slides(indices, kinds, normalize_runs)
+                    )
+                    return cls(
+                        slide_width_in=sw, slide_height_in=sh, slides=slide_models
+                    )
+                # `slides` may be a one-shot iterable, already consumed above
+                return cls.from_presentation(
+                    _Presentation(path), indices, kinds, normalize_runs
+                )
+
+        workers = min(workers, len(indices))
+        # a few shards per worker keeps the pool balanced when slides differ in cost
+        size = max(1, math.ceil(len(indices) / (workers * 4)))
+        shards = [indices[i : i + size] for i in range(0, len(indices), size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_extract_worker,
+            initargs=(path, engine, kinds, normalize_runs),
+        ) as pool:
+            slide_models = [
+                s for part in pool.map(_extract_slides, shards) for s in part
+            ]
+        return cls(slide_width_in=sw, slide_height_in=sh, slides=slide_models)
+
+    @staticmethod
+    def iter_slides(
+        path,
+        slides: Iterable[int] | None = None,
+        kinds: Container[ShapeKind] | None = None,
+        normalize_runs: bool = False,
+    ) -> Iterator[SlideModel]:
+        """Stream the slides of a `.pptx` one `SlideModel` at a time.
+
+        Uses the lxml engine; see `mipptx.reader.iter_slides`.
+        """
+        return iter_slides(path, slides, kinds, normalize_runs)
+
+    def normalize_runs(self) -> RunNormalizationReport:
+        """Merge adjacent runs with equal font and hyperlink and drop empty ones, in place.
+
+        Run before `build_presentation` (or after extraction without the
+        `normalize_runs` flag) to shrink stored models and later builds; the
+        report has the run counts and `ratio`. See `ParagraphModel.normalize_runs`.
+        """
+        report = RunNormalizationReport()
+        for slide_model in self.slides:
+            slide_model.normalize_runs(report)
+        return report
 
     # ---------- Apply/Build with python-pptx ----------
-    def build_presentation(self, template: str | None = None):
+    def build_presentation(self, template: str | None = None, cache: bool = True):
         """Create a new `pptx.Presentation` from this model.
 
         If `template` is provided, it is used as the base presentation; otherwise
-        python-pptx's default template is used.
+        python-pptx's default template is used. Unless `cache=False`, the template
+        comes from the process-wide `mipptx.cache.template_cache`, which parses each
+        template file once and hands every build its own copy.
         """
-        prs = _Presentation(template) if template else _Presentation()
+        if cache and isinstance(template, (str, os.PathLike, type(None))):
+            prs = template_cache.get(template or _default_pptx_path())
+        else:
+            prs = _Presentation(template) if template else _Presentation()
         # size
         if self.slide_width_in is not None:
             prs.slide_width = inches_to_emu(self.slide_width_in)
@@ -47,24 +358,74 @@ class PresentationModel(JsonModel):
             prs.slide_height = inches_to_emu(self.slide_height_in)
 
         # add slides
-        for slide_model in self.slides:
-            idx = getattr(slide_model, "layout_index", None) or 0
-            try:
-                layout = prs.slide_layouts[idx]
-            except Exception:
-                layout = prs.slide_layouts[0]
-            slide = prs.slides.add_slide(layout)
-            slide_model.apply_to_pptx(slide)
+        with fast_partnames(prs.part.package):
+            for slide_model in self.slides:
+                idx = getattr(slide_model, "layout_index", None) or 0
+                try:
+                    layout = prs.slide_layouts[idx]
+                except Exception:
+                    layout = prs.slide_layouts[0]
+                slide = prs.slides.add_slide(layout)
+                slide_model.apply_to_pptx(slide)
         return prs
 
-    def save(self, path: str, template: str | None = None) -> None:
+    def save(
+        self,
+        path: str,
+        template: str | None = None,
+        compression: Compression | None = None,
+    ) -> Optional[SaveReport]:
+        """Build and save the deck.
+
+        With `compression` (a preset such as "fast" or "stored", a deflate level,
+        or a `CompressionPolicy`), parts are written by `mipptx.package` and a
+        `SaveReport` with bytes and time per part type is returned.
+        """
         prs = self.build_presentation(template=template)
-        prs.save(path)
+        if compression is None:
+            prs.save(path)
+            return None
+        return save_presentation(prs, path, compression)
 
     # Update only chart data and simple chart properties on an existing Presentation
     # This preserves layouts, themes, and non-chart content. Slides count and order must match or
     # extras are ignored. Returns the same `prs` object for chaining.
-    def update_charts_in_presentation(self, prs, *, strict: bool = False):
+    def update_charts_in_presentation(
+        self,
+        prs,
+        *,
+        strict: bool = False,
+        skip_unchanged: bool = True,
+        workers: int | None = None,
+    ):
+        self.refresh_charts(
+            prs, strict=strict, skip_unchanged=skip_unchanged, workers=workers
+        )
+        return prs
+
+    def refresh_charts(
+        self,
+        prs,
+        *,
+        strict: bool = False,
+        skip_unchanged: bool = True,
+        workers: int | None = None,
+    ) -> ChartRefreshReport:
+        """Like `update_charts_in_presentation`, returning updated/skipped/failed counts.
+
+        With `skip_unchanged`, charts whose cached data, title, legend and style
+        already match the model (`ChartModel.matches_chart`) are left untouched,
+        so neither their XML nor their workbook is rewritten.
+
+        With `workers` > 1 each slide's charts are refreshed in a process pool
+        from copies of their chart XML and workbook; the results are swapped into
+        the package here. A chart that fails there is counted as failed and left
+        exactly as it was; if a worker dies, the slides it may have been running
+        are retried one per process and only the slide that kills its process
+        fails.
+        """
+        report = ChartRefreshReport()
+        per_slide: list[list[tuple[ChartModel, object]]] = []
         # iterate slides in parallel up to min length
         max_idx = min(len(self.slides), len(prs.slides))
         for i in range(max_idx):
@@ -108,15 +469,168 @@ class PresentationModel(JsonModel):
                         continue
                 filled.append((cm, g))
 
+            per_slide.append(filled)
+
+        if workers and workers > 1:
+            per_slide = _refresh_in_pool(
+                per_slide, report, strict, skip_unchanged, workers
+            )
+        for filled in per_slide:
             for cm, gframe in filled:
+                chart = gframe.chart
                 try:
-                    if strict:
-                        ok = cm.update_workbook_only(gframe.chart)
-                        if not ok:
-                            cm.apply_to_existing_chart(gframe.chart)
-                    else:
-                        cm.apply_to_existing_chart(gframe.chart)
+                    status = _refresh_chart(cm, chart, strict, skip_unchanged)
                 except Exception:
-                    pass
+                    status = "failed"
+                setattr(report, status, getattr(report, status) + 1)
 
-        return prs
+        return report
+
+
+def _refresh_chart(cm: ChartModel, chart, strict: bool, skip_unchanged: bool) -> str:
+    if skip_unchanged and cm.matches_chart(chart):
+        return "skipped"
+    if not strict or not cm.update_workbook_only(chart):
+        cm.apply_to_existing_chart(chart)
+    return "updated"
+
+
+def _refresh_detached(
+    jobs: List[tuple[ChartModel, bytes, bytes]], strict: bool, skip_unchanged: bool
+) -> List[tuple[str, Optional[bytes], Optional[bytes]]]:
+    # runs in a worker: (status, chart XML, workbook) per chart, blobs only if updated
+    results = []
+    for cm, chart_xml, xlsx_blob in jobs:
+        try:
+            part = _detached_chart_part(chart_xml, xlsx_blob)
+            status = _refresh_chart(cm, part.chart, strict, skip_unchanged)
+        except Exception:
+            status = "failed"
+        if status == "updated":
+            results.append((status, part.blob, part.chart_workbook.xlsx_part.blob))
+        else:
+            results.append((status, None, None))
+    return results
+
+
+def _refresh_in_pool(
+    per_slide: list, report: ChartRefreshReport, strict, skip_unchanged, workers
+) -> list:
+    """Refresh charts slide by slide in a pool; return the pairs left for the caller.
+
+    Charts without an embedded workbook (linked or missing) need parts added to
+    the package, so those stay on the main thread.
+    """
+    local = []
+    jobs = []
+    for filled in per_slide:
+        remote = []
+        for cm, gframe in filled:
+            chart_part = gframe.chart_part
+            xlsx_part = chart_part.chart_workbook.xlsx_part
+            if xlsx_part is None:
+                local.append((cm, gframe))
+            else:
+                remote.append((cm, chart_part, xlsx_part))
+        if remote:
+            jobs.append(remote)
+    if not jobs:
+        return [local]
+
+    workers = min(workers, len(jobs))
+    pending = iter(jobs)
+    while True:
+        suspects = _refresh_pool(pending, report, strict, skip_unchanged, workers)
+        if not suspects:
+            break
+        # a worker died: rerun the slides it could have been running one by one,
+        # so only the slide that kills its process fails
+        for remote in suspects:
+            results = _refresh_isolated(remote, strict, skip_unchanged)
+            if results is None:
+                report.failed += len(remote)
+            else:
+                _swap_refreshed(remote, results, report)
+    return [local]
+
+
+def _detached_jobs(remote: list) -> list:
+    return [(cm, cp.blob, xp.blob) for cm, cp, xp in remote]
+
+
+def _refresh_pool(
+    jobs: Iterator[list], report: ChartRefreshReport, strict, skip_unchanged, workers
+) -> list:
+    """Refresh the slides of `jobs` on one pool, swapping results into the package.
+
+    As `batch._render_pool`: at most two slides per worker are submitted ahead,
+    and if a worker dies the slides in flight are returned, untouched, with the
+    rest of `jobs` left unconsumed.
+    """
+    inflight: Dict[Future, list] = {}
+    carry: list = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for remote in itertools.islice(jobs, 2 * workers):
+                carry = [remote]
+                inflight[
+                    pool.submit(
+                        _refresh_detached,
+                        _detached_jobs(remote),
+                        strict,
+                        skip_unchanged,
+                    )
+                ] = remote
+                carry = []
+            while inflight:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    remote = inflight[fut]
+                    try:
+                        results = fut.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception:
+                        # e.g. a model did not pickle; this slide's charts are untouched
+                        report.failed += len(remote)
+                    else:
+                        _swap_refreshed(remote, results, report)
+                    del inflight[fut]
+                    remote = next(jobs, None)
+                    if remote is not None:
+                        carry = [remote]
+                        inflight[
+                            pool.submit(
+                                _refresh_detached,
+                                _detached_jobs(remote),
+                                strict,
+                                skip_unchanged,
+                            )
+                        ] = remote
+                        carry = []
+        except BrokenProcessPool:
+            return list(inflight.values()) + carry
+    return []
+
+
+def _refresh_isolated(remote: list, strict, skip_unchanged) -> Optional[list]:
+    # one slide in its own process: None if it fails there, process death included
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(
+                _refresh_detached, _detached_jobs(remote), strict, skip_unchanged
+            ).result()
+        except Exception:
+            return None
+
+
+def _swap_refreshed(remote: list, results: list, report: ChartRefreshReport) -> None:
+    # put a worker's refreshed chart XML and workbooks into the package
+    for (_, chart_part, xlsx_part), (status, chart_xml, xlsx_blob) in zip(
+        remote, results
+    ):
+        if chart_xml is not None:
+            _swap_chart_part(chart_part, chart_xml, xlsx_blob)
+            mark_dirty(chart_part)
+            mark_dirty(xlsx_part)
+        setattr(report, status, getattr(report, status) + 1)
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import posixpath
+import zipfile
+from typing import Container, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+from pptx.chart.chart import Chart
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.simpletypes import ST_Angle
+
+from .charts import ChartModel
+from .enums import ShapeKind
+from .shapes import BaseShapeModel, PictureModel, TableModel, TextBoxModel
+from .slide import SlideModel
+from .text import TextFrameModel
+from .utils import emu_to_pt
+
+_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_RT_OFFICE_DOCUMENT = _RT + "officeDocument"
+_RT_SLIDE_LAYOUT = _RT + "slideLayout"
+_RT_SLIDE_MASTER = _RT + "slideMaster"
+_PR_RELATIONSHIP = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+_NSMAP = {
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+}
+_parser = etree.XMLParser(resolve_entities=False)
+
+_R_ID = qn("r:id")
+_P_SP = qn("p:sp")
+_P_PIC = qn("p:pic")
+_P_GRAPHICFRAME = qn("p:graphicFrame")
+_P_GRPSP = qn("p:grpSp")
+_P_CXNSP = qn("p:cxnSp")
+_P_CONTENTPART = qn("p:contentPart")
+_P_SPTREE = qn("p:spTree")
+_P_TXBODY = qn("p:txBody")
+_P_XFRM = qn("p:xfrm")
+_P_SPPR = qn("p:spPr")
+_P_GRPSPPR = qn("p:grpSpPr")
+_P_NVPR = qn("p:nvPr")
+_P_PH = qn("p:ph")
+_P_CNVPR = qn("p:cNvPr")
+_A_XFRM = qn("a:xfrm")
+_A_OFF = qn("a:off")
+_A_EXT = qn("a:ext")
+_A_GRAPHIC = qn("a:graphic")
+_A_GRAPHICDATA = qn("a:graphicData")
+_A_TBL = qn("a:tbl")
+_C_CHART = qn("c:chart")
+_SHAPE_TAGS = (_P_SP, _P_GRPSP, _P_GRAPHICFRAME, _P_CXNSP, _P_PIC, _P_CONTENTPART)
+
+# layout placeholder type -> master placeholder type it inherits dimensions from
+_MASTER_PH_TYPE = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+_DIMS = ("x", "y", "cx", "cy")
+
+Geometry = Dict[str, Optional[int]]
+
+
+def _xfrm(el):
+    tag = el.tag
+    if tag == _P_GRAPHICFRAME:
+        return el.find(_P_XFRM)
+    props = el.find(_P_GRPSPPR if tag == _P_GRPSP else _P_SPPR)
+    return props.find(_A_XFRM) if props is not None else None
+
+
+def _geometry(el) -> Tuple[Geometry, float]:
+    """Return ({x, y, cx, cy} in EMU or None, rotation in degrees) like python-pptx."""
+    xfrm = _xfrm(el)
+    dims: Geometry = dict.fromkeys(_DIMS)
+    if xfrm is None:
+        return dims, 0.0
+    off = xfrm.find(_A_OFF)
+    if off is not None:
+        dims["x"], dims["y"] = int(off.get("x")), int(off.get("y"))
+    ext = xfrm.find(_A_EXT)
+    if ext is not None:
+        dims["cx"], dims["cy"] = int(ext.get("cx")), int(ext.get("cy"))
+    rot = xfrm.get("rot")
+    return dims, (ST_Angle.convert_from_xml(rot) if rot is not None else 0.0)
+
+
+def _ph(el):
+    # `p:ph` lives at `./p:nvXxPr/p:nvPr/p:ph`
+    nv = el[0] if len(el) else None
+    nvPr = nv.find(_P_NVPR) if nv is not None else None
+    return nvPr.find(_P_PH) if nvPr is not None else None
+
+
+def _shape_kind(el) -> ShapeKind:
+    # mirrors `mipptx.shapes.shape_kind` on the raw shape element
+    tag = el.tag
+    if tag == _P_SP:
+        return ShapeKind.text_box
+    if tag == _P_GRAPHICFRAME:
+        gd = el.find("a:graphic/a:graphicData", _NSMAP)
+        uri = gd.get("uri") if gd is not None else None
+        if uri == _URI_CHART:
+            return ShapeKind.chart
+        if uri == _URI_TABLE:
+            return ShapeKind.table
+    if (
+        tag == _P_PIC
+        and _ph(el) is None
+        and el.find("p:nvPicPr/p:nvPr/a:videoFile", _NSMAP) is None
+    ):
+        return ShapeKind.picture
+    return ShapeKind.unknown
+
+
+def _shape_name(el) -> Optional[str]:
+    nv = el[0] if len(el) else None
+    cNvPr = nv.find(_P_CNVPR) if nv is not None else None
+    return cNvPr.get("name") if cNvPr is not None else None
+
+
+class _ChartFrame:
+    """Just enough of a python-pptx GraphicFrame for `ChartModel.from_pptx`."""
+
+    def __init__(self, name, dims: Geometry, rotation: float, chart):
+        self.name = name
+        self.left, self.top = dims["x"], dims["y"]
+        self.width, self.height = dims["cx"], dims["cy"]
+        self.rotation = rotation
+        self.chart = chart
+
+
+class PackageReader:
+    """Read a `.pptx` package straight from its zip parts with lxml.
+
+    Produces the same `SlideModel`s as the python-pptx path (`SlideModel.from_pptx`)
+    without building the python-pptx object graph: slide XML is walked with
+    `iterparse` and text, run and font properties are read off the raw `p:sp`,
+    `a:p`, `a:r` and `a:rPr` elements. Chart parts are still handed to python-pptx's
+    chart proxies so their data extraction stays shared.
+    """
+
+    def __init__(self, file):
+        self._zip = zipfile.ZipFile(file)
+        self._rels: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._layout_geometry: Dict[str, List[Tuple[int, Geometry]]] = {}
+        self._master_geometry: Dict[str, List[Tuple[str, Geometry]]] = {}
+
+        main = next(
+            target
+            for reltype, target in self.rels("").values()
+            if reltype == _RT_OFFICE_DOCUMENT
+        )
+        root = self.parse(main)
+        prs_rels = self.rels(main)
+        sz = root.find(qn("p:sldSz"))
+        self.slide_width = int(sz.get("cx")) if sz is not None else None
+        self.slide_height = int(sz.get("cy")) if sz is not None else None
+        self.slide_partnames: List[str] = [
+            prs_rels[sldId.get(_R_ID)][1]
+            for sldId in root.iterfind("p:sldIdLst/p:sldId", _NSMAP)
+        ]
+        # `prs.slide_layouts` are the first master's layouts, in master order
+        self.layout_partnames: List[str] = []
+        sldMasterId = root.find("p:sldMasterIdLst/p:sldMasterId", _NSMAP)
+        if sldMasterId is not None:
+            master = prs_rels[sldMasterId.get(_R_ID)][1]
+            master_rels = self.rels(master)
+            master_root = self.parse(master)
+            self.layout_partnames = [
+                master_rels[el.get(_R_ID)][1]
+                for el in master_root.iterfind("p:sldLayoutIdLst/p:sldLayoutId", _NSMAP)
+            ]
+
+    # ---------- Package access ----------
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "PackageReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.slide_partnames)
+
+    def read(self, partname: str) -> bytes:
+        return self._zip.read(partname)
+
+    def parse(self, partname: str):
+        return etree.fromstring(self.read(partname), parser=_parser)
+
+    def rels(self, partname: str) -> Dict[str, Tuple[str, str]]:
+        """Map rId -> (reltype, target partname) for the internal rels of `partname`."""
+        cached = self._rels.get(partname)
+        if cached is not None:
+            return cached
+        base, fname = posixpath.split(partname)
+        rels_name = posixpath.join(base, "_rels", fname + ".rels")
+        out: Dict[str, Tuple[str, str]] = {}
+        if rels_name in self._zip.NameToInfo:
+            for rel in self.parse(rels_name).iter(_PR_RELATIONSHIP):
+                if rel.get("TargetMode") == "External":
+                    continue
+                target = rel.get("Target")
+                if target.startswith("/"):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(posixpath.join(base, target))
+                out[rel.get("Id")] = (rel.get("Type"), target)
+        self._rels[partname] = out
+        return out
+
+    def _related(self, partname: str, reltype: str) -> Optional[str]:
+        return next(
+            (t for rt, t in self.rels(partname).values() if rt == reltype), None
+        )
+
+    # ---------- Placeholder inheritance ----------
+    def _master_placeholders(self, master: str) -> List[Tuple[str, Geometry]]:
+        cached = self._master_geometry.get(master)
+        if cached is None:
+            cached = []
+            for el in self.parse(master).find("p:cSld/p:spTree", _NSMAP):
+                ph = _ph(el) if el.tag in _SHAPE_TAGS else None
+                if ph is not None:
+                    cached.append((ph.get("type", "obj"), _geometry(el)[0]))
+            self._master_geometry[master] = cached
+        return cached
+
+    def _layout_placeholders(self, layout: str) -> List[Tuple[int, Geometry]]:
+        cached = self._layout_geometry.get(layout)
+        if cached is not None:
+            return cached
+        cached = []
+        master = self._related(layout, _RT_SLIDE_MASTER)
+        for el in self.parse(layout).find("p:cSld/p:spTree", _NSMAP):
+            ph = _ph(el) if el.tag in _SHAPE_TAGS else None
+            if ph is None:
+                continue
+            dims = _geometry(el)[0]
+            base_type = _MASTER_PH_TYPE.get(ph.get("type", "obj"))
+            if el.tag == _P_SP and master is not None and base_type is not None:
+                base = next(
+                    (d for t, d in self._master_placeholders(master) if t == base_type),
+                    None,
+                )
+                if base is not None:
+                    dims = {k: base[k] if dims[k] is None else dims[k] for k in _DIMS}
+            cached.append((int(ph.get("idx", 0)), dims))
+        self._layout_geometry[layout] = cached
+        return cached
+
+    # ---------- Slides ----------
+    def read_slide(
+        self, index: int, kinds: Container[ShapeKind] | None = None
+    ) -> SlideModel:
+        """Convert slide `index`; with `kinds`, other shapes are skipped unconverted."""
+        partname = self.slide_partnames[index]
+        layout = self._related(partname, _RT_SLIDE_LAYOUT)
+        try:
+            layout_index = self.layout_partnames.index(layout)
+        except ValueError:
+            layout_index = None
+
+        shapes = []
+        with self._zip.open(partname) as f:
+            for _, el in etree.iterparse(
+                f, events=("end",), tag=_SHAPE_TAGS, resolve_entities=False
+            ):
+                parent = el.getparent()
+                if parent is None or parent.tag != _P_SPTREE:
+                    continue  # shapes nested in a group are not slide shapes
+                if kinds is None or _shape_kind(el) in kinds:
+                    shapes.append(self._shape_model(el, partname, layout))
+                # drop what has been converted so the tree never fills up
+                el.clear(keep_tail=True)
+                while el.getprevious() is not None:
+                    del parent[0]
+        # slide rels are only needed while the slide is read
+        self._rels.pop(partname, None)
+        return SlideModel(layout_index=layout_index, shapes=shapes)
+
+    def iter_slides(
+        self,
+        indices: Iterable[int] | None = None,
+        kinds: Container[ShapeKind] | None = None,
+        normalize_runs: bool = False,
+    ) -> Iterator[SlideModel]:
+        for i in range(len(self)) if indices is None else indices:
+            slide_model = self.read_slide(i, kinds)
+            if normalize_runs:
+                slide_model.normalize_runs()
+            yield slide_model
+
+    def _shape_model(self, el, partname: str, layout: Optional[str]):
+        tag = el.tag
+        dims, rotation = _geometry(el)
+        ph = _ph(el)
+        if ph is not None and tag in (_P_SP, _P_PIC) and layout is not None:
+            # slide placeholders inherit missing dimensions from the layout
+            idx = int(ph.get("idx", 0))
+            base = next(
+                (d for i, d in self._layout_placeholders(layout) if i == idx), None
+            )
+            if base is not None:
+                dims = {k: base[k] if dims[k] is None else dims[k] for k in _DIMS}
+        base_kwargs = dict(
+            name=_shape_name(el),
+            left_pt=emu_to_pt(dims["x"]) or 0.0,
+            top_pt=emu_to_pt(dims["y"]) or 0.0,
+            width_pt=emu_to_pt(dims["cx"]) or 0.0,
+            height_pt=emu_to_pt(dims["cy"]) or 0.0,
+            rotation=rotation or 0.0,
+        )
+
+        # text box
+        if tag == _P_SP:
+            tf = TextFrameModel.from_xml(el.find(_P_TXBODY))
+            return TextBoxModel(type=ShapeKind.text_box, text_frame=tf, **base_kwargs)
+
+        if tag == _P_GRAPHICFRAME:
+            graphic = el.find(_A_GRAPHIC)
+            gd = graphic.find(_A_GRAPHICDATA) if graphic is not None else None
+            uri = gd.get("uri") if gd is not None else None
+            # chart
+            if uri == _URI_CHART:
+                try:
+                    rId = gd.find(_C_CHART).get(_R_ID)
+                    chart_part = self.rels(partname)[rId][1]
+                    chart = Chart(parse_xml(self.read(chart_part)), None)
+                    return ChartModel.from_pptx(
+                        _ChartFrame(base_kwargs["name"], dims, rotation, chart)
+                    )
+                except Exception:
+                    pass
+            # table
+            tbl = gd.find(_A_TBL) if uri == _URI_TABLE else None
+            if tbl is not None:
+                tbl_model = TableModel.from_xml(tbl)
+                return TableModel(
+                    type=ShapeKind.table,
+                    **base_kwargs,
+                    rows=tbl_model.rows,
+                    col_widths_pt=tbl_model.col_widths_pt,
+                    first_row=tbl_model.first_row,
+                    last_row=tbl_model.last_row,
+                    first_col=tbl_model.first_col,
+                    last_col=tbl_model.last_col,
+                    horz_banding=tbl_model.horz_banding,
+                    vert_banding=tbl_model.vert_banding,
+                    row_heights_pt=tbl_model.row_heights_pt,
+                )  # type: ignore[arg-type]
+
+        # picture (placeholder pictures and movies stay unknown, as in from_pptx)
+        if (
+            tag == _P_PIC
+            and ph is None
+            and el.find("p:nvPicPr/p:nvPr/a:videoFile", _NSMAP) is None
+        ):
+            return PictureModel(type=ShapeKind.picture, image_path=None, **base_kwargs)
+
+        # fallback
+        return BaseShapeModel(**base_kwargs)
+
+
+def iter_slides(
+    file,
+    slides: Iterable[int] | None = None,
+    kinds: Container[ShapeKind] | None = None,
+    normalize_runs: bool = False,
+) -> Iterator[SlideModel]:
+    """Yield one `SlideModel` per slide of a `.pptx`, in slide order.
+
+    Only the slide being converted is ever parsed: its XML tree is cleared shape by
+    shape and dropped before the next slide is read, and media parts are never
+    loaded, so memory stays flat regardless of deck size. `slides` (0-based
+    indices) and `kinds` restrict what is read, as in `from_presentation`;
+    `normalize_runs` merges same-format runs of each slide before it is yielded.
+    """
+    with PackageReader(file) as reader:
+        yield from reader.iter_slides(slides, kinds, normalize_runs)
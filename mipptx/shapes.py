@@ -1,14 +1,54 @@
 from __future__ import annotations
 
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Dict, Iterator, List, Literal, Optional, Union
 
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.spec import GRAPHIC_DATA_URI_TABLE
 from pydantic import ConfigDict, Field, field_validator, model_validator
 
+from . import frames
 from .base import JsonModel
 from .charts import ChartModel
 from .enums import ShapeKind
-from .text import TextFrameModel
-from .utils import emu_to_pt, pt_to_emu
+from .package import mark_dirty
+from .text import RunModel, RunNormalizationReport, TextFrameModel, hyperlink_relater
+from .utils import emu_to_pt, pt_to_emu, xml_text
+
+_A_TR = qn("a:tr")
+_A_TC = qn("a:tc")
+_A_TXBODY = qn("a:txBody")
+_A_TBLPR = qn("a:tblPr")
+_A_TBLGRID = qn("a:tblGrid")
+_A_GRIDCOL = qn("a:gridCol")
+# TableModel flag -> `a:tblPr` attribute
+_TBL_FLAGS = {
+    "first_row": "firstRow",
+    "last_row": "lastRow",
+    "first_col": "firstCol",
+    "last_col": "lastCol",
+    "horz_banding": "bandRow",
+    "vert_banding": "bandCol",
+}
+# python-pptx's default for new tables ("Medium Style 2 - Accent 1")
+_DEFAULT_TABLE_STYLE = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+# a new cell as python-pptx creates it; text goes between the two halves
+_TC_OPEN = "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>"
+_TC_CLOSE = "</a:txBody><a:tcPr/></a:tc>"
+
+
+def shape_kind(shape) -> ShapeKind:
+    """Kind `BaseShapeModel.from_pptx` would convert `shape` to, without converting it."""
+    if getattr(shape, "has_text_frame", False):
+        return ShapeKind.text_box
+    if getattr(shape, "has_chart", False):
+        return ShapeKind.chart
+    if getattr(shape, "has_table", False):
+        return ShapeKind.table
+    if shape.__class__.__name__ == "Picture":
+        return ShapeKind.picture
+    return ShapeKind.unknown
 
 
 class BaseShapeModel(JsonModel):
@@ -94,7 +134,17 @@ class TextBoxModel(BaseShapeModel):
     type: Literal[ShapeKind.text_box] = ShapeKind.text_box
     text_frame: TextFrameModel = Field(default_factory=TextFrameModel)
 
+    def normalize_runs(
+        self, report: RunNormalizationReport | None = None
+    ) -> RunNormalizationReport:
+        """See `ParagraphModel.normalize_runs`."""
+        return self.text_frame.normalize_runs(report)
+
+    def iter_runs(self) -> Iterator[RunModel]:
+        return self.text_frame.iter_runs()
+
     def apply_to_slide(self, slide) -> None:
+        mark_dirty(slide.part)
         # add text box and apply content
         left = pt_to_emu(self.left_pt)
         top = pt_to_emu(self.top_pt)
@@ -103,7 +153,10 @@ class TextBoxModel(BaseShapeModel):
         tb = slide.shapes.add_textbox(left, top, width, height)
         if self.name:
             tb.name = self.name
-        self.text_frame.to_pptx(tb.text_frame)
+        # the whole text body in one parse, in place of python-pptx's empty one
+        sp = tb._element
+        xml = self.text_frame.to_xml(hyperlink_relater(slide.part))
+        sp.replace(sp.txBody, parse_xml(xml))
         if self.rotation:
             tb.rotation = float(self.rotation)
 
@@ -123,6 +176,7 @@ class PictureModel(BaseShapeModel):
         top = pt_to_emu(self.top_pt)
         width = pt_to_emu(self.width_pt)
         height = pt_to_emu(self.height_pt)
+        mark_dirty(slide.part)
         pic = slide.shapes.add_picture(
             self.image_path, left, top, width=width, height=height
         )
@@ -189,6 +243,100 @@ class TableModel(BaseShapeModel):
             height_pt=0,
         )
 
+    @classmethod
+    def from_xml(cls, tbl) -> "TableModel":
+        """Build from a raw `a:tbl` element, mirroring `from_pptx`."""
+        trs = list(tbl.iterchildren(_A_TR))
+        rows: List[List[TextFrameModel | str]] = [
+            [
+                TextFrameModel.from_xml(tc.find(_A_TXBODY))
+                for tc in tr.iterchildren(_A_TC)
+            ]
+            for tr in trs
+        ]
+        grid = tbl.find(_A_TBLGRID)
+        col_widths_pt = [
+            emu_to_pt(int(gc.get("w"))) or 0.0
+            for gc in (grid.iterchildren(_A_GRIDCOL) if grid is not None else ())
+        ]
+        tblPr = tbl.find(_A_TBLPR)
+        flags = {
+            attr: tblPr is not None and tblPr.get(xml_attr) in ("1", "true")
+            for attr, xml_attr in _TBL_FLAGS.items()
+        }
+        try:
+            row_heights_pt = [emu_to_pt(int(tr.get("h"))) or 0.0 for tr in trs]
+        except Exception:
+            row_heights_pt = None
+        return cls(
+            rows=rows,
+            col_widths_pt=col_widths_pt,
+            row_heights_pt=row_heights_pt,
+            left_pt=0,
+            top_pt=0,
+            width_pt=0,
+            height_pt=0,
+            **flags,
+        )
+
+    @classmethod
+    def from_arrow(cls, table, header: bool = True, **fields) -> "TableModel":
+        """Build from an Arrow table: a header row of column names if `header`,
+        then one text cell per value: floats in Python's shortest form (as
+        `from_dataframe` writes them, `1.0` rather than Arrow's `1`), other
+        types by Arrow's string cast, nulls and NaN blank.
+
+        `fields` are the other model fields (geometry, flags, widths).
+        """
+        return cls._from_frame(frames.arrow_frame(table), header, fields)
+
+    @classmethod
+    def from_dataframe(cls, df, header: bool = True, **fields) -> "TableModel":
+        """As `from_arrow`, for a DataFrame; its index is not included."""
+        return cls._from_frame(frames.dataframe_frame(df), header, fields)
+
+    @classmethod
+    def _from_frame(cls, frame, header: bool, fields: dict) -> "TableModel":
+        names = frame.names()
+        # one string conversion per column, then a transpose into rows
+        columns = [frame.strings(n) for n in names]
+        rows: List[List[TextFrameModel | str]] = [list(r) for r in zip(*columns)]
+        if header:
+            rows.insert(0, [str(n) for n in names])
+        return cls(rows=rows, **fields)
+
+    def to_arrow(self, header: bool = True):
+        """Cell text as a `pyarrow.Table` of string columns.
+
+        With `header` the first row names the columns; otherwise they are
+        named "0", "1", ...
+        """
+        text = [[c if isinstance(c, str) else c.text for c in row] for row in self.rows]
+        width = max((len(r) for r in text), default=0)
+        if header and text:
+            names = text[0] + [str(i) for i in range(len(text[0]), width)]
+            text = text[1:]
+        else:
+            names = [str(i) for i in range(width)]
+        return frames.text_table(names, text)
+
+    def normalize_runs(
+        self, report: RunNormalizationReport | None = None
+    ) -> RunNormalizationReport:
+        """See `ParagraphModel.normalize_runs`; plain `str` cells have no runs."""
+        report = report if report is not None else RunNormalizationReport()
+        for row in self.rows:
+            for cell in row:
+                if isinstance(cell, TextFrameModel):
+                    cell.normalize_runs(report)
+        return report
+
+    def iter_runs(self) -> Iterator[RunModel]:
+        for row in self.rows:
+            for cell in row:
+                if isinstance(cell, TextFrameModel):
+                    yield from cell.iter_runs()
+
     def apply_to_slide(self, slide) -> None:
         if not self.rows:
             return
@@ -198,51 +346,92 @@ class TableModel(BaseShapeModel):
         top = pt_to_emu(self.top_pt)
         width = pt_to_emu(self.width_pt)
         height = pt_to_emu(self.height_pt)
-        shape = slide.shapes.add_table(n_rows, n_cols, left, top, width, height)
-        if self.name:
-            shape.name = self.name
-        tbl = shape.table
-        # column widths
+        # same sizes as `add_table` followed by setting each column/row: even
+        # shares with the remainder on the last one, or the explicit list,
+        # in which case the frame takes the sum
         if self.col_widths_pt and len(self.col_widths_pt) == n_cols:
-            for idx, w in enumerate(self.col_widths_pt):
-                tbl.columns[idx].width = pt_to_emu(w)
-        # table flags
-        for attr in (
-            "first_row",
-            "last_row",
-            "first_col",
-            "last_col",
-            "horz_banding",
-            "vert_banding",
-        ):
-            val = getattr(self, attr, None)
-            if val is not None and hasattr(tbl, attr):
-                try:
-                    setattr(tbl, attr, bool(val))
-                except Exception:
-                    pass
-        # row heights
+            col_widths = [pt_to_emu(w) for w in self.col_widths_pt]
+            width = sum(col_widths)
+        else:
+            col_widths = _even_split(width, n_cols)
         if self.row_heights_pt and len(self.row_heights_pt) == n_rows:
-            try:
-                for ridx, hpt in enumerate(self.row_heights_pt):
-                    tbl.rows[ridx].height = pt_to_emu(hpt)
-            except Exception:
-                pass
-        # content
-        for r_idx, row in enumerate(self.rows):
-            for c_idx, cell_content in enumerate(row):
-                cell = tbl.cell(r_idx, c_idx)
-                tf = cell.text_frame
-                if isinstance(cell_content, str):
-                    tf.text = cell_content
-                elif isinstance(cell_content, TextFrameModel):
-                    cell_content.to_pptx(tf)
-                else:
-                    # If a plain dict sneaks in, coerce to model
-                    TextFrameModel.model_validate(cell_content).to_pptx(tf)
+            row_heights = [pt_to_emu(h) for h in self.row_heights_pt]
+            height = sum(row_heights)
+        else:
+            row_heights = _even_split(height, n_rows)
+
+        mark_dirty(slide.part)
+        shapes = slide.shapes
+        id_ = shapes._next_shape_id
+        graphicFrame = CT_GraphicalObjectFrame.new_graphicFrame(
+            id_, self.name or f"Table {id_ - 1}", left, top, width, height
+        )
+        graphicFrame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
+        relate = hyperlink_relater(slide.part)
+        tbl_xml = self._tbl_xml(col_widths, row_heights, relate)
+        graphicFrame.graphic.graphicData.append(parse_xml(tbl_xml))
+        shapes._spTree.insert_element_before(graphicFrame, "p:extLst")
+        shape = shapes._shape_factory(graphicFrame)
         if self.rotation:
             shape.rotation = float(self.rotation)
 
+    def _tbl_xml(self, col_widths: List[int], row_heights: List[int], relate) -> str:
+        """The whole `a:tbl` as one string; `relate` gives hyperlink rIds."""
+        # python-pptx's new-table defaults, then the model's flags on top
+        flags = {"firstRow": True, "bandRow": True}
+        for attr, xml_attr in _TBL_FLAGS.items():
+            val = getattr(self, attr)
+            if val is not None:
+                flags[xml_attr] = bool(val)
+        tbl_pr = "".join(f' {a}="1"' for a, on in flags.items() if on)
+        parts = [
+            f"<a:tbl {nsdecls('a', 'r')}><a:tblPr{tbl_pr}>",
+            f"<a:tableStyleId>{_DEFAULT_TABLE_STYLE}</a:tableStyleId></a:tblPr>",
+            "<a:tblGrid>",
+            *(f'<a:gridCol w="{w}"/>' for w in col_widths),
+            "</a:tblGrid>",
+        ]
+        n_cols = len(col_widths)
+        # financial tables repeat a lot of cell values ("-", "0.0%", ...)
+        cell_xml: Dict[str, str] = {}
+        for row, h in zip(self.rows, row_heights):
+            parts.append(f'<a:tr h="{h}">')
+            for c_idx in range(n_cols):
+                content = row[c_idx] if c_idx < len(row) else ""
+                if isinstance(content, str):
+                    xml = cell_xml.get(content)
+                    if xml is None:
+                        xml = cell_xml[content] = _str_tc_xml(content)
+                else:
+                    if not isinstance(content, TextFrameModel):
+                        # If a plain dict sneaks in, coerce to model
+                        content = TextFrameModel.model_validate(content)
+                    body = content.to_xml(relate, cell=True, nsdecls=False)
+                    xml = f"<a:tc>{body}<a:tcPr/></a:tc>"
+                parts.append(xml)
+            parts.append("</a:tr>")
+        parts.append("</a:tbl>")
+        return "".join(parts)
+
+
+def _even_split(total: int, n: int) -> List[int]:
+    # as `CT_Table.new_tbl`: equal parts, the last absorbing the rounding
+    share = total // n
+    return [share] * (n - 1) + [total - (n - 1) * share]
+
+
+def _str_tc_xml(text: str) -> str:
+    """`a:tc` holding what `TextFrame.text = text` writes: a paragraph per "\\n",
+    a line break per "\\v", no run for empty text."""
+    paras = []
+    for line in text.split("\n"):
+        body = "<a:br/>".join(
+            f"<a:r><a:t>{xml_text(part)}</a:t></a:r>" if part else ""
+            for part in line.split("\v")
+        )
+        paras.append(f"<a:p>{body}</a:p>" if body else "<a:p/>")
+    return f"{_TC_OPEN}{''.join(paras)}{_TC_CLOSE}"
+
 
 # Use a discriminated union for reliable JSON (de)serialization by `type`
 ShapeModel = Annotated[
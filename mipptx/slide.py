@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Container, Iterator, List, Optional
+
+from pydantic import ConfigDict, Field
+
+from .base import JsonModel
+from .enums import ShapeKind
+from .shapes import BaseShapeModel, ShapeModel, shape_kind
+from .text import RunModel, RunNormalizationReport
+
+
+class SlideModel(JsonModel):
+    model_config = ConfigDict(extra="forbid")
+
+    layout_index: Optional[int] = Field(
+        None, ge=0, description="Index into the presentation's slide layouts"
+    )
+    shapes: List[ShapeModel] = Field(default_factory=list)
+
+    @classmethod
+    def from_pptx(
+        cls, slide, kinds: Container[ShapeKind] | None = None
+    ) -> "SlideModel":
+        """Build from a python-pptx slide; with `kinds`, other shapes are skipped."""
+        layout_index = None
+        try:
+            prs = slide.part.package.presentation_part.presentation
+            layout_index = prs.slide_layouts.index(slide.slide_layout)
+        except Exception:
+            layout_index = None
+        shapes = [
+            BaseShapeModel.from_pptx(sh)
+            for sh in slide.shapes
+            if kinds is None or shape_kind(sh) in kinds
+        ]
+        return cls(layout_index=layout_index, shapes=shapes)
+
+    def normalize_runs(
+        self, report: RunNormalizationReport | None = None
+    ) -> RunNormalizationReport:
+        """Merge same-format runs in every text box and table cell, in place.
+
+        See `ParagraphModel.normalize_runs`; `report` accumulates the counts.
+        """
+        report = report if report is not None else RunNormalizationReport()
+        for shape_model in self.shapes:
+            normalize = getattr(shape_model, "normalize_runs", None)
+            if normalize is not None:
+                normalize(report)
+        return report
+
+    def iter_runs(self) -> Iterator[RunModel]:
+        """Runs of every text box and table cell, in shape order."""
+        for shape_model in self.shapes:
+            runs = getattr(shape_model, "iter_runs", None)
+            if runs is not None:
+                yield from runs()
+
+    def apply_to_pptx(self, slide) -> None:
+        for shape_model in self.shapes:
+            apply = getattr(shape_model, "apply_to_slide", None)
+            if apply is not None:
+                apply(slide)
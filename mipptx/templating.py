@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import os
+import re
+import zipfile
+from io import BytesIO
+from typing import IO, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from lxml import etree
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml.ns import qn
+
+from .package import Compression, CompressionPolicy, SaveReport, _PackageZip
+from .presentation import PresentationModel
+from .reader import PackageReader, _parser
+from .shapes import TableModel, TextBoxModel
+from .text import TextFrameModel
+
+# `{{ name }}` placeholders, compiled once per deck and rendered per set of values.
+#
+# Compiling walks the text once and records, for each run that holds part of a
+# token, the pieces its text is rebuilt from: literal strings and tokens. A token
+# split over several runs (as PowerPoint does after an edit or a spell check) is
+# rendered into the run where it starts, in that run's formatting; the runs it
+# spills into keep only their text outside the token. Rendering then touches
+# those runs and nothing else.
+
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][\w.]*)\s*\}\}")
+
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_CT = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+
+
+class _Token:
+    __slots__ = ("name", "raw")
+
+    def __init__(self, name: str, raw: str):
+        self.name = name
+        self.raw = raw
+
+
+# the text of one run: literal strings and tokens, in order
+_Pieces = List[Union[str, _Token]]
+
+
+def _compile_runs(texts: List[str]) -> Optional[List[Tuple[int, _Pieces]]]:
+    """(run index, pieces) for each run of `texts` that a placeholder touches.
+
+    `texts` are the runs of one paragraph; None when it has no placeholders.
+    """
+    joined = "".join(texts)
+    if "{{" not in joined:
+        return None
+    matches = list(PLACEHOLDER.finditer(joined))
+    if not matches:
+        return None
+    out = []
+    start = 0
+    k = 0
+    for i, text in enumerate(texts):
+        end = start + len(text)
+        while k < len(matches) and matches[k].end() <= start:
+            k += 1
+        if k == len(matches) or matches[k].start() >= end:
+            start = end
+            continue
+        pieces: _Pieces = []
+        cursor = start
+        j = k
+        while j < len(matches) and matches[j].start() < end:
+            m = matches[j]
+            if m.start() > cursor:
+                pieces.append(joined[cursor : m.start()])
+            if m.start() >= start:
+                pieces.append(_Token(m.group(1), m.group(0)))
+            cursor = min(m.end(), end)
+            j += 1
+        if cursor < end:
+            pieces.append(joined[cursor:end])
+        out.append((i, pieces))
+        start = end
+    return out
+
+
+def _render(pieces: _Pieces, values: Mapping[str, object], strict: bool) -> str:
+    parts = []
+    for piece in pieces:
+        if type(piece) is str:
+            parts.append(piece)
+        elif piece.name in values:
+            parts.append(str(values[piece.name]))
+        elif strict:
+            raise KeyError(f"no value for placeholder {piece.name!r}")
+        else:
+            parts.append(piece.raw)
+    return "".join(parts)
+
+
+def _names(runs: List[Tuple[int, _Pieces]]):
+    for _, pieces in runs:
+        for piece in pieces:
+            if type(piece) is not str:
+                yield piece.name
+
+
+# ---------- Over a PresentationModel ----------
+
+
+# paragraph index -> runs to rebuild, for one text frame
+_FrameIndex = Dict[int, List[Tuple[int, _Pieces]]]
+
+
+def _compile_frame(frame: TextFrameModel) -> _FrameIndex:
+    index = {}
+    for pi, para in enumerate(frame.paragraphs):
+        runs = _compile_runs([r.text for r in para.runs])
+        if runs:
+            index[pi] = runs
+    return index
+
+
+def _render_frame(
+    frame: TextFrameModel, index: _FrameIndex, values, strict: bool
+) -> TextFrameModel:
+    paragraphs = list(frame.paragraphs)
+    for pi, compiled in index.items():
+        para = paragraphs[pi]
+        runs = list(para.runs)
+        for ri, pieces in compiled:
+            run = runs[ri]
+            runs[ri] = run.model_copy(update={"text": _render(pieces, values, strict)})
+        paragraphs[pi] = para.model_copy(update={"runs": runs})
+    return frame.model_copy(update={"paragraphs": paragraphs})
+
+
+class ModelTemplate:
+    """A `PresentationModel` compiled into the locations of its placeholders.
+
+    Covers the runs of text boxes and table cells (rich and plain `str` cells).
+    `render` returns a new model that shares every untouched slide, shape,
+    paragraph and run with the compiled one, so treat both as read-only (or
+    `model_copy(deep=True)` a result before editing it).
+    """
+
+    def __init__(self, model: PresentationModel):
+        self.model = model
+        # slide index -> shape index -> frame index (text box) or
+        # {(row, col): frame index, or runs of a plain cell} (table)
+        self._index: Dict[int, Dict[int, object]] = {}
+        names = set()
+        for si, slide_model in enumerate(model.slides):
+            shapes = {}
+            for shi, shape_model in enumerate(slide_model.shapes):
+                if isinstance(shape_model, TextBoxModel):
+                    entry = _compile_frame(shape_model.text_frame)
+                    for runs in entry.values():
+                        names.update(_names(runs))
+                elif isinstance(shape_model, TableModel):
+                    entry = {}
+                    for r, row in enumerate(shape_model.rows):
+                        for c, cell in enumerate(row):
+                            if isinstance(cell, TextFrameModel):
+                                cell_index = _compile_frame(cell)
+                                for runs in cell_index.values():
+                                    names.update(_names(runs))
+                            else:
+                                cell_index = _compile_runs([cell])
+                                if cell_index:
+                                    names.update(_names(cell_index))
+                            if cell_index:
+                                entry[(r, c)] = cell_index
+                else:
+                    continue
+                if entry:
+                    shapes[shi] = entry
+            if shapes:
+                self._index[si] = shapes
+        self.names: FrozenSet[str] = frozenset(names)
+
+    def render(
+        self, values: Mapping[str, object], strict: bool = True
+    ) -> PresentationModel:
+        """Fill the placeholders from `values` (`str()` of each value).
+
+        With `strict`, a placeholder missing from `values` raises `KeyError`;
+        otherwise it is left as written.
+        """
+        slides = list(self.model.slides)
+        for si, shapes_index in self._index.items():
+            slide_model = slides[si]
+            shapes = list(slide_model.shapes)
+            for shi, entry in shapes_index.items():
+                shape_model = shapes[shi]
+                if isinstance(shape_model, TableModel):
+                    rows = list(shape_model.rows)
+                    copied = set()
+                    for (r, c), cell_index in entry.items():
+                        if r not in copied:
+                            rows[r] = list(rows[r])
+                            copied.add(r)
+                        cell = rows[r][c]
+                        if isinstance(cell, TextFrameModel):
+                            rows[r][c] = _render_frame(cell, cell_index, values, strict)
+                        else:
+                            ((_, pieces),) = cell_index
+                            rows[r][c] = _render(pieces, values, strict)
+                    shapes[shi] = shape_model.model_copy(update={"rows": rows})
+                else:
+                    frame = _render_frame(shape_model.text_frame, entry, values, strict)
+                    shapes[shi] = shape_model.model_copy(update={"text_frame": frame})
+            slides[si] = slide_model.model_copy(update={"shapes": shapes})
+        return self.model.model_copy(update={"slides": slides})
+
+
+def compile_template(model: PresentationModel) -> ModelTemplate:
+    """Index the placeholders of `model`; do not edit `model` afterwards."""
+    return ModelTemplate(model)
+
+
+# ---------- Over a .pptx package ----------
+
+
+def _content_types(zf: zipfile.ZipFile) -> Tuple[Dict[str, str], Dict[str, str]]:
+    # (member name -> override, extension -> default) from [Content_Types].xml
+    types = etree.fromstring(zf.read("[Content_Types].xml"), parser=_parser)
+    overrides = {
+        el.get("PartName").lstrip("/"): el.get("ContentType")
+        for el in types.iter(_CT + "Override")
+    }
+    defaults = {
+        el.get("Extension").lower(): el.get("ContentType")
+        for el in types.iter(_CT + "Default")
+    }
+    return overrides, defaults
+
+
+class PptxTemplate:
+    """The placeholders of a `.pptx` file, compiled against its slide XML.
+
+    Holds the source package in memory together with the parsed slides that
+    contain placeholders. `render` writes a copy of the package with the
+    placeholder runs' `a:t` text replaced: only those slides are serialized,
+    every other member is copied with its compressed bytes as-is. Tokens are
+    matched within each stretch of consecutive `a:r` runs of a paragraph (a line
+    break or field ends one). Not safe to render from several threads at once.
+    """
+
+    def __init__(self, file: str | os.PathLike | IO[bytes]):
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as fh:
+                self._data = fh.read()
+        else:
+            self._data = file.read()
+        # slide member name -> (root element, [(a:t element, pieces)])
+        self._slides: Dict[str, Tuple[object, List[Tuple[object, _Pieces]]]] = {}
+        names = set()
+        with PackageReader(BytesIO(self._data)) as reader:
+            for partname in reader.slide_partnames:
+                root = reader.parse(partname)
+                found = []
+                for p in root.iter(_A_P):
+                    for group in _run_groups(p):
+                        texts = [t.text or "" for t in group]
+                        runs = _compile_runs(texts)
+                        if runs:
+                            names.update(_names(runs))
+                            found.extend((group[ri], pieces) for ri, pieces in runs)
+                if found:
+                    self._slides[partname] = (root, found)
+        self.names: FrozenSet[str] = frozenset(names)
+
+    def render(
+        self,
+        values: Mapping[str, object],
+        file: str | IO[bytes],
+        strict: bool = True,
+        compression: Compression = "default",
+    ) -> SaveReport:
+        """Write the package to `file` with placeholders filled from `values`.
+
+        `strict` is as in `ModelTemplate.render`; `compression` applies to the
+        rewritten slides, as in `save_presentation`.
+        """
+        # resolve every text first, so a missing value leaves no partial file
+        texts = [
+            [_render(pieces, values, strict) for _, pieces in found]
+            for _, found in self._slides.values()
+        ]
+        for (_, found), slide_texts in zip(self._slides.values(), texts):
+            for (t, _), text in zip(found, slide_texts):
+                t.text = text
+        src_fp = BytesIO(self._data)
+        with (
+            zipfile.ZipFile(src_fp) as src,
+            _PackageZip(file, CompressionPolicy.resolve(compression)) as dst,
+        ):
+            overrides, defaults = _content_types(src)
+            for info in src.infolist():
+                name = info.filename
+                content_type = overrides.get(name) or defaults.get(
+                    name.rsplit(".", 1)[-1].lower(), "application/octet-stream"
+                )
+                slide = self._slides.get(name)
+                if slide is None:
+                    dst.copy_raw(src, src_fp, name, name, content_type)
+                else:
+                    root = slide[0]
+                    dst.write(name, content_type, lambda: serialize_part_xml(root))
+        return dst.report
+
+
+def _run_groups(p) -> List[list]:
+    # the `a:t` of each stretch of consecutive `a:r` children of paragraph `p`
+    groups = []
+    current = []
+    for child in p:
+        if child.tag == _A_R:
+            t = child.find(_A_T)
+            if t is not None:
+                current.append(t)
+                continue
+        if current:
+            groups.append(current)
+            current = []
+    if current:
+        groups.append(current)
+    return groups
+
+
+def compile_pptx_template(file: str | os.PathLike | IO[bytes]) -> PptxTemplate:
+    """Index the placeholders in the slides of a `.pptx` file."""
+    return PptxTemplate(file)
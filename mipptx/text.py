@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import functools
+from typing import Callable, Dict, Iterator, List, Optional
 
 from pptx.dml.color import RGBColor
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_UNDERLINE
-from pptx.util import Pt
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Centipoints, Pt
 from pydantic import ConfigDict, Field, field_validator
 
 from .base import JsonModel
@@ -14,18 +17,104 @@ from .enums import (
     ParagraphAlignment,
     Underline,
     VerticalAnchor,
+    alignment_to_xml,
+    auto_size_to_xml,
     from_alignment_enum,
     from_auto_size,
     from_vertical_anchor,
     to_alignment_enum,
     to_auto_size,
     to_vertical_anchor,
+    vertical_anchor_to_xml,
+    xml_to_alignment,
+    xml_to_auto_size,
+    xml_to_vertical_anchor,
 )
-from .utils import emu_to_pt, hex_color, pt_to_emu
+from .package import _mark_owner_dirty
+from .utils import emu_to_pt, hex_color, pt_to_emu, xml_attr, xml_text
+
+# tags used by the `from_xml` readers, which work on raw lxml elements
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_A_P = qn("a:p")
+_A_RPR = qn("a:rPr")
+_A_PPR = qn("a:pPr")
+_A_BODYPR = qn("a:bodyPr")
+_A_LATIN = qn("a:latin")
+_A_SOLIDFILL = qn("a:solidFill")
+_A_SRGBCLR = qn("a:srgbClr")
+_A_LNSPC = qn("a:lnSpc")
+_A_SPCBEF = qn("a:spcBef")
+_A_SPCAFT = qn("a:spcAft")
+_A_SPCPTS = qn("a:spcPts")
+_A_SPCPCT = qn("a:spcPct")
+_FILL_TAGS = frozenset(
+    qn(t)
+    for t in (
+        "a:noFill",
+        "a:solidFill",
+        "a:gradFill",
+        "a:blipFill",
+        "a:pattFill",
+        "a:grpFill",
+    )
+)
+_COLOR_TAGS = frozenset(
+    qn(t)
+    for t in (
+        "a:scrgbClr",
+        "a:srgbClr",
+        "a:hslClr",
+        "a:sysClr",
+        "a:schemeClr",
+        "a:prstClr",
+    )
+)
+_AUTOFIT_TAGS = {
+    qn("a:noAutofit"): "noAutofit",
+    qn("a:normAutofit"): "normAutofit",
+    qn("a:spAutoFit"): "spAutoFit",
+}
+_XSD_BOOLEAN = {"1": True, "0": False, "true": True, "false": False}
+
+
+def _xml_bool(value: str | None) -> bool | None:
+    if value is None:
+        return None
+    return _XSD_BOOLEAN[value]
+
+
+def _xml_spacing_pts(spacing) -> int | None:
+    # `a:spcBef`/`a:spcAft`/`a:lnSpc` -> EMU of `a:spcPts/@val` (centipoints)
+    if spacing is None:
+        return None
+    spcPts = spacing.find(_A_SPCPTS)
+    if spcPts is None:
+        return None
+    return Centipoints(int(spcPts.get("val")))
+
+
+def _is_pptx_obj(obj) -> bool:
+    try:
+        mod = obj.__class__.__module__
+        return isinstance(mod, str) and mod.startswith("pptx.")
+    except Exception:
+        return False
+
+
+def _xml_run_text(r) -> str:
+    t = r.find(_A_T)
+    return (t.text or "") if t is not None else ""
+
+
+# Fonts and colors are frozen so that equal ones can be one shared instance:
+# `FontModel.from_xml` hands out cached instances, and
+# `PresentationModel.intern_styles` collects them into a style table that runs
+# point at by `style_id` when the deck is serialized.
 
 
 class Color(JsonModel):
-    model_config = ConfigDict(extra="forbid", frozen=False)
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     hex: str = Field(..., description="Hex color like #rrggbb")
 
@@ -36,7 +125,7 @@ class Color(JsonModel):
 
 
 class FontModel(JsonModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     name: Optional[str] = Field(None, description="Font family name")
     size_pt: Optional[float] = Field(
@@ -83,6 +172,9 @@ class FontModel(JsonModel):
                     and len(rgb) >= 3
                 ):
                     hexstr = rgb[:3].hex()
+                if hexstr is None and isinstance(rgb, tuple) and len(rgb) == 3:
+                    # python-pptx RGBColor is a (r, g, b) tuple
+                    hexstr = "%02x%02x%02x" % rgb
                 if hexstr:
                     color = Color(hex="#" + hexstr)
         except Exception:
@@ -97,6 +189,89 @@ class FontModel(JsonModel):
             color=color,
         )
 
+    @classmethod
+    def from_xml(cls, rPr) -> "FontModel":
+        """Build from a raw `a:rPr` element (or None), mirroring `from_pptx_font`.
+
+        Run properties with the same attributes give the same instance, which is
+        built and validated once.
+        """
+        if rPr is None:
+            return _xml_font(None, None, None, None, None, None)
+        srgb = None
+        fill = next((c for c in rPr if c.tag in _FILL_TAGS), None)
+        if fill is not None and fill.tag == _A_SOLIDFILL:
+            clr = next((c for c in fill if c.tag in _COLOR_TAGS), None)
+            if clr is not None and clr.tag == _A_SRGBCLR:
+                srgb = clr.get("val", "")
+        latin = rPr.find(_A_LATIN)
+        return _xml_font(
+            latin.attrib["typeface"] if latin is not None else None,
+            rPr.get("sz"),
+            rPr.get("b"),
+            rPr.get("i"),
+            rPr.get("u"),
+            srgb,
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _xml_font(
+    name: str | None,
+    sz: str | None,
+    b: str | None,
+    i: str | None,
+    u: str | None,
+    srgb: str | None,
+) -> FontModel:
+    # `FontModel.from_xml` from the raw attribute values; a deck has a few dozen
+    # distinct run styles, so nearly every call is a cache hit
+    size_pt = None
+    if sz is not None:
+        try:
+            if 100 <= int(sz) <= 400000:
+                size_pt = emu_to_pt(Centipoints(int(sz)))
+        except Exception:
+            size_pt = None
+
+    underline = None
+    if u is not None:
+        try:
+            if MSO_UNDERLINE.from_xml(u) != MSO_UNDERLINE.NONE:
+                underline = Underline.single
+        except Exception:
+            pass
+
+    color = None
+    if srgb is not None:
+        try:
+            color = Color(hex="#" + srgb[:6])
+        except Exception:
+            color = None
+
+    return FontModel(
+        name=name,
+        size_pt=size_pt,
+        bold=_xml_bool(b),
+        italic=_xml_bool(i),
+        underline=underline,
+        color=color,
+    )
+
+
+class RunNormalizationReport(JsonModel):
+    """Run counts before and after `normalize_runs`."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    runs_before: int = 0
+    runs_after: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """How many runs went in per run kept (1.0 when nothing was merged)."""
+        return self.runs_before / self.runs_after if self.runs_after else 1.0
+
 
 class RunModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
@@ -104,6 +279,11 @@ class RunModel(JsonModel):
     text: str = Field("", description="Run text")
     font: Optional[FontModel] = None
     hyperlink: Optional[str] = Field(None, description="URL for click hyperlink")
+    style_id: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Index of `font` in `PresentationModel.styles`, set by `intern_styles`",
+    )
 
     @classmethod
     def from_pptx_run(cls, run) -> "RunModel":
@@ -114,6 +294,16 @@ class RunModel(JsonModel):
             font_model = None
         return cls(text=getattr(run, "text", ""), font=font_model)
 
+    @classmethod
+    def from_xml(cls, r) -> "RunModel":
+        """Build from a raw `a:r` element, mirroring `from_pptx_run`."""
+        font_model = None
+        try:
+            font_model = FontModel.from_xml(r.find(_A_RPR))
+        except Exception:
+            font_model = None
+        return cls(text=r.find(_A_T).text or "", font=font_model)
+
 
 class ParagraphModel(JsonModel):
     model_config = ConfigDict(extra="forbid")
@@ -129,6 +319,45 @@ class ParagraphModel(JsonModel):
     def text(self) -> str:
         return "".join(r.text for r in self.runs)
 
+    def normalize_runs(
+        self, report: RunNormalizationReport | None = None
+    ) -> RunNormalizationReport:
+        """Merge adjacent runs with equal font and hyperlink and drop empty runs, in place.
+
+        A paragraph whose runs are all empty keeps its first one: it carries the
+        font the empty line is laid out with.
+        """
+        report = report if report is not None else RunNormalizationReport()
+        runs = self.runs
+        report.runs_before += len(runs)
+        merged: List[RunModel] = []
+        texts: List[List[str]] = []
+        for run in runs:
+            if not run.text:
+                continue
+            last = merged[-1] if merged else None
+            if (
+                last is not None
+                and last.hyperlink == run.hyperlink
+                and last.font == run.font
+            ):
+                texts[-1].append(run.text)
+            else:
+                merged.append(run)
+                texts.append([run.text])
+        if not merged and runs:
+            merged.append(runs[0])
+            texts.append([runs[0].text])
+        if len(merged) != len(runs):
+            self.runs = [
+                run
+                if len(parts) == 1
+                else run.model_copy(update={"text": "".join(parts)})
+                for run, parts in zip(merged, texts)
+            ]
+        report.runs_after += len(self.runs)
+        return report
+
     # -- conversions to/from python-pptx
     @classmethod
     def from_pptx(cls, p) -> "ParagraphModel":
@@ -157,14 +386,45 @@ class ParagraphModel(JsonModel):
             space_after_pt=emu_to_pt(space_after) if space_after is not None else None,
         )
 
-    def to_pptx(self, p) -> None:
-        def _is_pptx_obj(obj) -> bool:
+    @classmethod
+    def from_xml(cls, p) -> "ParagraphModel":
+        """Build from a raw `a:p` element, mirroring `from_pptx`."""
+        runs = []
+        for r in p.iterchildren(_A_R):
             try:
-                mod = obj.__class__.__module__
-                return isinstance(mod, str) and mod.startswith("pptx.")
+                runs.append(RunModel.from_xml(r))
             except Exception:
-                return False
+                runs.append(RunModel(text=_xml_run_text(r)))
+
+        pPr = p.find(_A_PPR)
+        if pPr is None:
+            return cls(runs=runs)
+        line_spacing = None
+        lnSpc = pPr.find(_A_LNSPC)
+        if lnSpc is not None:
+            line_spacing = _xml_spacing_pts(lnSpc)
+            if line_spacing is None:
+                val = lnSpc.find(_A_SPCPCT).get("val")
+                if val.endswith("%"):
+                    line_spacing = float(val[:-1]) / 100.0
+                else:
+                    line_spacing = int(val) / 100000.0
+        space_before = _xml_spacing_pts(pPr.find(_A_SPCBEF))
+        space_after = _xml_spacing_pts(pPr.find(_A_SPCAFT))
+
+        return cls(
+            runs=runs,
+            alignment=xml_to_alignment(pPr.get("algn")),
+            level=int(pPr.get("lvl", 0)),
+            line_spacing=float(line_spacing) if line_spacing is not None else None,
+            space_before_pt=emu_to_pt(space_before)
+            if space_before is not None
+            else None,
+            space_after_pt=emu_to_pt(space_after) if space_after is not None else None,
+        )
 
+    def to_pptx(self, p) -> None:
+        _mark_owner_dirty(p)
         # clear and rebuild runs
         try:
             p.clear()
@@ -297,6 +557,19 @@ class TextFrameModel(JsonModel):
     def text(self) -> str:
         return "\n".join(p.text for p in self.paragraphs)
 
+    def iter_runs(self) -> Iterator[RunModel]:
+        for para in self.paragraphs:
+            yield from para.runs
+
+    def normalize_runs(
+        self, report: RunNormalizationReport | None = None
+    ) -> RunNormalizationReport:
+        """`ParagraphModel.normalize_runs` on every paragraph, in place."""
+        report = report if report is not None else RunNormalizationReport()
+        for para in self.paragraphs:
+            para.normalize_runs(report)
+        return report
+
     @classmethod
     def from_pptx(cls, tf) -> "TextFrameModel":
         # Support minimal stubs: if no paragraphs, fall back to single paragraph from `.text`.
@@ -325,14 +598,37 @@ class TextFrameModel(JsonModel):
             word_wrap=getattr(tf, "word_wrap", None),
         )
 
-    def to_pptx(self, tf) -> None:
-        def _is_pptx_obj(obj) -> bool:
-            try:
-                mod = obj.__class__.__module__
-                return isinstance(mod, str) and mod.startswith("pptx.")
-            except Exception:
-                return False
+    @classmethod
+    def from_xml(cls, txBody) -> "TextFrameModel":
+        """Build from a raw `p:txBody`/`a:txBody` element, mirroring `from_pptx`.
+
+        A missing body reads like the default one python-pptx would add: a single
+        empty paragraph.
+        """
+        if txBody is None:
+            return cls(paragraphs=[ParagraphModel()], auto_size=AutoSize.none)
+        paragraphs = [ParagraphModel.from_xml(p) for p in txBody.iterchildren(_A_P)]
+        bodyPr = txBody.find(_A_BODYPR)
+        autofit = anchor = wrap = None
+        if bodyPr is not None:
+            autofit = next(
+                (_AUTOFIT_TAGS[c.tag] for c in bodyPr if c.tag in _AUTOFIT_TAGS), None
+            )
+            anchor = bodyPr.get("anchor")
+            wrap = bodyPr.get("wrap")
+        return cls(
+            paragraphs=paragraphs,
+            auto_size=xml_to_auto_size(autofit),
+            vertical_anchor=xml_to_vertical_anchor(anchor),
+            margin_left_pt=7.2,
+            margin_right_pt=7.2,
+            margin_top_pt=7.2,
+            margin_bottom_pt=7.2,
+            word_wrap={"square": True, "none": False}.get(wrap),
+        )
 
+    def to_pptx(self, tf) -> None:
+        _mark_owner_dirty(tf)
         # Avoid clearing the entire text-frame to preserve first paragraph object identity in tests
         # We'll clear at paragraph level instead.
         # apply text content
@@ -351,10 +647,10 @@ class TextFrameModel(JsonModel):
                     # nothing else to do
                     pass
                 else:
-                    ParagraphModel(**self.paragraphs[0].model_dump()).to_pptx(p)
+                    # the paragraphs are already validated models; write them as they are
+                    self.paragraphs[0].to_pptx(p)
                     for para in self.paragraphs[1:]:
-                        np = tf.add_paragraph()
-                        ParagraphModel(**para.model_dump()).to_pptx(np)
+                        para.to_pptx(tf.add_paragraph())
             except Exception:
                 pass
         else:
@@ -396,6 +692,153 @@ class TextFrameModel(JsonModel):
         if self.word_wrap is not None and hasattr(tf, "word_wrap"):
             tf.word_wrap = self.word_wrap
 
+    def to_xml(
+        self,
+        relate: Optional[Callable[[str], str]] = None,
+        cell: bool = False,
+        nsdecls: bool = True,
+    ) -> str:
+        """Serialize to the text body `to_pptx` leaves in a new text box, in one pass.
+
+        `cell=True` gives the `a:txBody` of a new table cell instead. `relate(url)`
+        returns the relationship id of a run hyperlink (see `hyperlink_relater`);
+        without it hyperlinks are left out. `nsdecls=False` omits the namespace
+        declarations, for embedding in a larger string that declares a, p and r.
+        """
+        out: List[str] = []
+        _write_txbody(out, self, relate, cell, nsdecls)
+        return "".join(out)
+
     # Back-compat alias
     def apply_to_pptx(self, tf) -> None:  # pragma: no cover - thin alias
         self.to_pptx(tf)
+
+
+def hyperlink_relater(part) -> Callable[[str], str]:
+    """`relate` for `TextFrameModel.to_xml`: external hyperlink rIds from `part`."""
+
+    def relate(url: str) -> str:
+        return part.relate_to(url, RT.HYPERLINK, is_external=True)
+
+    return relate
+
+
+# -- XML writer. It reproduces what the python-pptx calls in the `to_pptx`
+# methods write into a new text box or table cell, including their quirks: an
+# empty `a:pPr` on every written paragraph, `a:rPr` whenever a run has a font or
+# hyperlink, sizes truncated to EMU as `Pt` does, defaults left out as
+# python-pptx's optional attributes do, and no `lvl`.
+_TXBODY_NSDECLS = {False: nsdecls("a", "p", "r"), True: nsdecls("a", "r")}
+# bodyPr insets python-pptx leaves out at their default value
+_INSET_DEFAULTS = (("lIns", 91440), ("tIns", 45720), ("rIns", 91440), ("bIns", 45720))
+
+
+def _pt(pt: float) -> int:
+    # `Pt(pt)`: truncated, unlike `pt_to_emu`
+    return int(pt * 12700)
+
+
+def _write_txbody(out: List[str], tfm, relate, cell: bool, with_nsdecls: bool):
+    tag = "a:txBody" if cell else "p:txBody"
+    out.append(f"<{tag} {_TXBODY_NSDECLS[cell]}>" if with_nsdecls else f"<{tag}>")
+
+    # a new text box starts as `<a:bodyPr wrap="none"><a:spAutoFit/>`; a cell bare
+    wrap = None if cell else "none"
+    if tfm.word_wrap is not None:
+        wrap = "square" if tfm.word_wrap else "none"
+    attrs = [f' wrap="{wrap}"'] if wrap else []
+    margins = (
+        tfm.margin_left_pt,
+        tfm.margin_top_pt,
+        tfm.margin_right_pt,
+        tfm.margin_bottom_pt,
+    )
+    for (name, default), margin in zip(_INSET_DEFAULTS, margins):
+        emu = _pt(margin)
+        if emu != default:
+            attrs.append(f' {name}="{emu}"')
+    anchor = vertical_anchor_to_xml(tfm.vertical_anchor)
+    if anchor:
+        attrs.append(f' anchor="{anchor}"')
+    autofit = auto_size_to_xml(tfm.auto_size)
+    body_pr = "".join(attrs)
+    if autofit:
+        out.append(f"<a:bodyPr{body_pr}><a:{autofit}/></a:bodyPr><a:lstStyle/>")
+    else:
+        out.append(f"<a:bodyPr{body_pr}/><a:lstStyle/>")
+
+    if not tfm.paragraphs:
+        out.append("<a:p/>")
+    # rPr without hyperlink per distinct font; runs mostly repeat a few fonts
+    fonts: Dict[tuple, str] = {}
+    for para in tfm.paragraphs:
+        _write_paragraph(out, para, relate, fonts)
+    out.append(f"</{tag}>")
+
+
+def _write_paragraph(out: List[str], para, relate, fonts: Dict[tuple, str]) -> None:
+    algn = alignment_to_xml(para.alignment)
+    spacing = []
+    if para.line_spacing is not None:
+        lines = int(round(para.line_spacing * 100000.0))
+        spacing.append(f'<a:lnSpc><a:spcPct val="{lines}"/></a:lnSpc>')
+    if para.space_before_pt is not None:
+        val = _pt(para.space_before_pt) // 127
+        spacing.append(f'<a:spcBef><a:spcPts val="{val}"/></a:spcBef>')
+    if para.space_after_pt is not None:
+        val = _pt(para.space_after_pt) // 127
+        spacing.append(f'<a:spcAft><a:spcPts val="{val}"/></a:spcAft>')
+    p_pr = f'<a:pPr algn="{algn}"' if algn else "<a:pPr"
+    out.append(
+        f"<a:p>{p_pr}>{''.join(spacing)}</a:pPr>" if spacing else f"<a:p>{p_pr}/>"
+    )
+    for run in para.runs:
+        out.append("<a:r>")
+        font = run.font
+        if font is not None or run.hyperlink:
+            if font is None:
+                r_pr = "<a:rPr/>"
+            else:
+                color = font.color
+                key = (
+                    font.name,
+                    font.size_pt,
+                    font.bold,
+                    font.italic,
+                    font.underline,
+                    color.hex if color else None,
+                )
+                r_pr = fonts.get(key)
+                if r_pr is None:
+                    r_pr = fonts[key] = _rpr_xml(font)
+            if run.hyperlink and relate is not None:
+                link = f'<a:hlinkClick r:id="{relate(run.hyperlink)}"/>'
+                if r_pr.endswith("/>"):
+                    r_pr = f"{r_pr[:-2]}>{link}</a:rPr>"
+                else:
+                    r_pr = f"{r_pr[: -len('</a:rPr>')]}{link}</a:rPr>"
+            out.append(r_pr)
+        out.append(f"<a:t>{xml_text(run.text)}</a:t></a:r>")
+    out.append("</a:p>")
+
+
+def _rpr_xml(font: FontModel) -> str:
+    attrs = []
+    if font.size_pt is not None:
+        attrs.append(f' sz="{_pt(font.size_pt) // 127}"')
+    if font.bold is not None:
+        attrs.append(' b="1"' if font.bold else ' b="0"')
+    if font.italic is not None:
+        attrs.append(' i="1"' if font.italic else ' i="0"')
+    if font.underline == Underline.single:
+        attrs.append(' u="sng"')
+    children = []
+    # children in schema order: fill, then latin (hlinkClick goes last)
+    if font.color and font.color.hex:
+        rgb = font.color.hex[1:].upper()
+        children.append(f'<a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>')
+    if font.name is not None:
+        children.append(f'<a:latin typeface="{xml_attr(font.name)}"/>')
+    if children:
+        return f"<a:rPr{''.join(attrs)}>{''.join(children)}</a:rPr>"
+    return f"<a:rPr{''.join(attrs)}/>"
@@ -49,6 +49,24 @@ def hex_color(color: str | None) -> str | None:
     return c.lower()
 
 
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_CONTROL_RE = re.compile(r"[\x00-\x08\x0b-\x1f]")
+
+
+def xml_text(s: str) -> str:
+    """Escape `s` for XML character data."""
+    s = s.translate(_XML_ESCAPES)
+    if _CONTROL_RE.search(s):
+        # not allowed in XML 1.0; the Office escape for them (as python-pptx does)
+        s = _CONTROL_RE.sub(lambda m: f"_x{ord(m.group()):04X}_", s)
+    return s
+
+
+def xml_attr(s: str) -> str:
+    """Escape `s` for a double-quoted XML attribute value."""
+    return xml_text(s).replace('"', "&quot;")
+
+
 def unique(seq: Iterable) -> list:
     seen = set()
     out = []
@@ -0,0 +1,581 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import functools
+import math
+import posixpath
+import re
+import zipfile
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+import openpyxl
+from lxml import etree
+from pptx.chart import xlsx as _pptx_xlsx
+
+from .package import CompressionPolicy, _PackageZip
+from .utils import xml_attr, xml_text
+
+# Cell edits for the workbooks embedded in chart parts. `patch_cells` rewrites
+# only the sheetData of the touched worksheets, straight in the xlsx zip; every
+# other member is copied without recompression. Workbooks it cannot edit safely
+# (touched cells holding formulas, rows or cells without references) go through
+# openpyxl instead, which loads and re-saves the whole workbook.
+
+# sheet name -> {(row, col): value}; a None value clears the cell
+CellUpdates = Dict[str, Dict[Tuple[int, int], Any]]
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_RT_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+_CT_WORKSHEET = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+)
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+_SHEET = f"{{{_NS_MAIN}}}sheet"
+_SHEET_DATA = f"{{{_NS_MAIN}}}sheetData"
+_DIMENSION = f"{{{_NS_MAIN}}}dimension"
+_ROW = f"{{{_NS_MAIN}}}row"
+_C = f"{{{_NS_MAIN}}}c"
+_F = f"{{{_NS_MAIN}}}f"
+_V = f"{{{_NS_MAIN}}}v"
+_IS = f"{{{_NS_MAIN}}}is"
+_T = f"{{{_NS_MAIN}}}t"
+_R_ID = f"{{{_NS_R}}}id"
+
+_CELL_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?(\d+)")
+
+# the sheet XML is regenerated, the rest of the archive is not
+_POLICY = CompressionPolicy.resolve("default")
+
+
+class _Unsupported(Exception):
+    """The workbook needs an edit `patch_cells` does not make; use openpyxl."""
+
+
+def col_to_idx(col: str) -> int:
+    n = 0
+    for ch in col:
+        if ch != "$":
+            n = n * 26 + (ord(ch.upper()) - 64)
+    return n
+
+
+@functools.lru_cache(maxsize=None)
+def idx_to_col(n: int) -> str:
+    s = ""
+    while n > 0:
+        n, r = divmod(n - 1, 26)
+        s = chr(65 + r) + s
+    return s
+
+
+def _parse_cell(ref: str) -> Tuple[int, int]:
+    m = _CELL_RE.fullmatch(ref.strip())
+    if m is None:
+        raise ValueError(f"bad cell reference {ref!r}")
+    return int(m.group(2)), col_to_idx(m.group(1))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_range(formula: str) -> Optional[Tuple[str, Tuple[Tuple[int, int], ...]]]:
+    """Parse `Sheet1!$B$2:$B$5` into the sheet name and (row, col) cells, row-major.
+
+    Results are cached: a deck's charts refer to the same few ranges over and over.
+    Returns None for anything that is not a single-sheet cell or range reference.
+    """
+    txt = (formula or "").strip()
+    if "!" not in txt:
+        return None
+    sheet, rng = txt.rsplit("!", 1)
+    if len(sheet) > 1 and sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    try:
+        ends = [_parse_cell(c) for c in rng.split(":")]
+    except ValueError:
+        return None
+    if len(ends) == 1:
+        return sheet, (ends[0],)
+    if len(ends) != 2:
+        return None
+    (r1, c1), (r2, c2) = ends
+    cells = tuple(
+        (r, c)
+        for r in range(min(r1, r2), max(r1, r2) + 1)
+        for c in range(min(c1, c2), max(c1, c2) + 1)
+    )
+    return sheet, cells
+
+
+def patch_cells(blob: bytes, updates: CellUpdates) -> bytes:
+    """Return xlsx `blob` with the cells in `updates` set; unknown sheets are skipped.
+
+    Only the worksheets named in `updates` are re-serialized; if the direct edit
+    is not possible the whole workbook is round-tripped through openpyxl.
+    """
+    try:
+        return _patch_xml(blob, updates)
+    except _Unsupported:
+        return _patch_openpyxl(blob, updates)
+
+
+def _patch_openpyxl(blob: bytes, updates: CellUpdates) -> bytes:
+    wb = openpyxl.load_workbook(BytesIO(blob))
+    for sheet, cells in updates.items():
+        if sheet not in wb.sheetnames:
+            continue
+        ws = wb[sheet]
+        for (row, col), value in cells.items():
+            ws.cell(row=row, column=col).value = value
+    out = BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def _patch_xml(blob: bytes, updates: CellUpdates) -> bytes:
+    with zipfile.ZipFile(BytesIO(blob)) as src:
+        members = _sheet_members(src)
+        patched = {}
+        for sheet, cells in updates.items():
+            member = members.get(sheet)
+            if member is None or not cells:
+                continue
+            root = etree.fromstring(src.read(member))
+            _set_cells(root, cells)
+            patched[member] = etree.tostring(
+                root, xml_declaration=True, encoding="UTF-8", standalone=True
+            )
+        if not patched:
+            return blob
+        out = BytesIO()
+        src_fp = src.fp
+        with _PackageZip(out, _POLICY) as dst:
+            for info in src.infolist():
+                name = info.filename
+                if name in patched:
+                    dst.write(name, _CT_WORKSHEET, lambda b=patched[name]: b)
+                else:
+                    dst.copy_raw(src, src_fp, name, name, "")
+    return out.getvalue()
+
+
+def _sheet_members(src: zipfile.ZipFile) -> Dict[str, str]:
+    """Map sheet names to their worksheet members in the archive."""
+    rels = etree.fromstring(src.read("_rels/.rels"))
+    wb_member = None
+    for rel in rels.iter(f"{{{_NS_PKG_RELS}}}Relationship"):
+        if rel.get("Type") == _RT_OFFICE_DOCUMENT:
+            wb_member = _resolve("", rel.get("Target"))
+            break
+    if wb_member is None:
+        raise _Unsupported("no workbook part")
+    base = posixpath.dirname(wb_member)
+    wb_rels_member = posixpath.join(
+        base, "_rels", posixpath.basename(wb_member) + ".rels"
+    )
+    targets = {
+        rel.get("Id"): _resolve(base, rel.get("Target"))
+        for rel in etree.fromstring(src.read(wb_rels_member)).iter(
+            f"{{{_NS_PKG_RELS}}}Relationship"
+        )
+    }
+    workbook = etree.fromstring(src.read(wb_member))
+    return {
+        sheet.get("name"): targets[sheet.get(_R_ID)]
+        for sheet in workbook.iter(_SHEET)
+        if sheet.get(_R_ID) in targets
+    }
+
+
+def _resolve(base: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def _set_cells(root, cells: Dict[Tuple[int, int], Any]) -> None:
+    sheet_data = root.find(_SHEET_DATA)
+    if sheet_data is None:
+        raise _Unsupported("worksheet without sheetData")
+    rows = {}
+    for row_el in sheet_data.iterchildren(_ROW):
+        r = row_el.get("r")
+        if r is None:
+            raise _Unsupported("row without a reference")
+        rows[int(r)] = row_el
+    row_keys = sorted(rows)
+
+    by_row: Dict[int, Dict[int, Any]] = {}
+    for (row, col), value in cells.items():
+        by_row.setdefault(row, {})[col] = value
+
+    for row in sorted(by_row):
+        row_el = rows.get(row)
+        if row_el is None:
+            row_el = etree.Element(_ROW, r=str(row))
+            _insert_ordered(sheet_data, row_el, row, rows, row_keys)
+        else:
+            # `spans` is an optional load hint that new cells could make wrong
+            row_el.attrib.pop("spans", None)
+        existing = {}
+        for c_el in row_el.iterchildren(_C):
+            ref = c_el.get("r")
+            if ref is None:
+                raise _Unsupported("cell without a reference")
+            existing[_parse_cell(ref)[1]] = c_el
+        col_keys = sorted(existing)
+        for col in sorted(by_row[row]):
+            c_el = existing.get(col)
+            if c_el is None:
+                c_el = etree.Element(_C, r=f"{idx_to_col(col)}{row}")
+                _insert_ordered(row_el, c_el, col, existing, col_keys)
+            elif c_el.find(_F) is not None:
+                # dropping a formula also means fixing up calcChain and shared formulas
+                raise _Unsupported("touched cell holds a formula")
+            _set_value(c_el, by_row[row][col])
+
+    _grow_dimension(root, cells)
+
+
+def _insert_ordered(parent, el, key: int, siblings: Dict[int, Any], keys: list) -> None:
+    # `keys` is the sorted list of `siblings`' keys
+    i = bisect.bisect(keys, key)
+    if i < len(keys):
+        siblings[keys[i]].addprevious(el)
+    else:
+        parent.append(el)
+    keys.insert(i, key)
+    siblings[key] = el
+
+
+def _set_value(c_el, value) -> None:
+    for child in list(c_el):
+        c_el.remove(child)
+    c_el.attrib.pop("t", None)
+    if value is None:
+        return
+    if isinstance(value, bool):
+        c_el.set("t", "b")
+        etree.SubElement(c_el, _V).text = "1" if value else "0"
+    elif isinstance(value, (int, float)):
+        if isinstance(value, float) and not math.isfinite(value):
+            return
+        etree.SubElement(c_el, _V).text = repr(value)
+    else:
+        text = str(value)
+        c_el.set("t", "inlineStr")
+        t = etree.SubElement(etree.SubElement(c_el, _IS), _T)
+        t.text = text
+        if text != text.strip():
+            t.set(_XML_SPACE, "preserve")
+
+
+def _grow_dimension(root, cells) -> None:
+    dim = root.find(_DIMENSION)
+    if dim is None:
+        return
+    refs = list(cells)
+    try:
+        refs += [_parse_cell(c) for c in dim.get("ref", "").split(":")]
+    except ValueError:
+        pass
+    rows = [r for r, _ in refs]
+    cols = [c for _, c in refs]
+    dim.set(
+        "ref",
+        f"{idx_to_col(min(cols))}{min(rows)}:{idx_to_col(max(cols))}{max(rows)}",
+    )
+
+
+# Streaming writer for the one-sheet workbook behind a chart. It keeps
+# python-pptx's worksheet layout (the writer subclasses below inherit every
+# range reference the chart XML uses) but writes rows of cell XML straight into
+# the zip member instead of building xlsxwriter's cell table: memory is one
+# buffered chunk of rows plus the shared-string and number-format tables.
+
+_ROWS_PER_CHUNK = 512
+# number formats Excel knows without a numFmt entry
+_BUILTIN_FORMATS = {
+    "General": 0,
+    "0": 1,
+    "0.00": 2,
+    "#,##0": 3,
+    "#,##0.00": 4,
+    "0%": 9,
+    "0.00%": 10,
+    "0.00E+00": 11,
+    "mm-dd-yy": 14,
+    "d-mmm-yy": 15,
+    "h:mm": 20,
+}
+_EPOCH = datetime.datetime(1899, 12, 30)
+
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_STATIC_MEMBERS = {
+    "_rels/.rels": (
+        f'<Relationships xmlns="{_NS_PKG_RELS}">'
+        f'<Relationship Id="rId1" Type="{_RT_OFFICE_DOCUMENT}" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_R}">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+}
+_CT_PREFIX = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+_RT_PREFIX = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _member(name: str) -> zipfile.ZipInfo:
+    # a fixed timestamp, as xlsxwriter does: equal data gives equal bytes
+    info = zipfile.ZipInfo(name, (1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+class _WorkbookStream:
+    """Write `Sheet1` of a new workbook row by row into `file`."""
+
+    def __init__(self, file):
+        self._zf = zipfile.ZipFile(file, "w", compression=zipfile.ZIP_DEFLATED)
+        self._strings: Dict[str, int] = {}
+        self._formats: Dict[str, int] = {}  # custom format code -> numFmtId
+        self._styles: Dict[int, int] = {0: 0}  # numFmtId -> cellXfs index
+
+    def style(self, number_format: str | None) -> int:
+        """The cell style index for `number_format`."""
+        code = number_format or "General"
+        fmt_id = _BUILTIN_FORMATS.get(code)
+        if fmt_id is None:
+            fmt_id = self._formats.get(code)
+            if fmt_id is None:
+                fmt_id = self._formats[code] = 164 + len(self._formats)
+        style = self._styles.get(fmt_id)
+        if style is None:
+            style = self._styles[fmt_id] = len(self._styles)
+        return style
+
+    def write_sheet(self, rows, cols: str = "") -> None:
+        """Stream `rows` of (1-based row, [(1-based col, value, style)]) into the sheet.
+
+        Rows must come in ascending order and cells in ascending column order;
+        None and non-finite values write a blank cell that keeps its style (as
+        xlsxwriter does), or leave the cell out when it has none.
+        """
+        strings = self._strings
+        with self._zf.open(_member("xl/worksheets/sheet1.xml"), "w") as fp:
+            fp.write(
+                f'{_XML_DECL}<worksheet xmlns="{_NS_MAIN}" xmlns:r="{_NS_R}">'
+                f"{cols}<sheetData>".encode()
+            )
+            chunk = []
+            for r, cells in rows:
+                out = [f'<row r="{r}">']
+                for c, value, style in cells:
+                    if value is None:
+                        if style:
+                            out.append(f'<c r="{idx_to_col(c)}{r}" s="{style}"/>')
+                        continue
+                    ref = f"{idx_to_col(c)}{r}"
+                    s = f' s="{style}"' if style else ""
+                    if type(value) is float or type(value) is int:
+                        if value != value or value in (math.inf, -math.inf):
+                            if style:
+                                out.append(f'<c r="{ref}"{s}/>')
+                            continue
+                        out.append(f'<c r="{ref}"{s}><v>{value!r}</v></c>')
+                    elif isinstance(value, str):
+                        idx = strings.get(value)
+                        if idx is None:
+                            idx = strings[value] = len(strings)
+                        out.append(f'<c r="{ref}"{s} t="s"><v>{idx}</v></c>')
+                    elif isinstance(value, bool):
+                        out.append(f'<c r="{ref}"{s} t="b"><v>{int(value)}</v></c>')
+                    elif isinstance(value, (datetime.date, datetime.datetime)):
+                        if not isinstance(value, datetime.datetime):
+                            value = datetime.datetime(
+                                value.year, value.month, value.day
+                            )
+                        serial = (value.replace(tzinfo=None) - _EPOCH).total_seconds()
+                        out.append(f'<c r="{ref}"{s}><v>{serial / 86400!r}</v></c>')
+                    else:
+                        # Decimal, NumPy scalars and other numbers
+                        value = float(value)
+                        if math.isfinite(value):
+                            out.append(f'<c r="{ref}"{s}><v>{value!r}</v></c>')
+                        elif style:
+                            out.append(f'<c r="{ref}"{s}/>')
+                out.append("</row>")
+                chunk.append("".join(out))
+                if len(chunk) >= _ROWS_PER_CHUNK:
+                    fp.write("".join(chunk).encode())
+                    chunk.clear()
+            chunk.append("</sheetData></worksheet>")
+            fp.write("".join(chunk).encode())
+
+    def close(self) -> None:
+        zf = self._zf
+        overrides = [
+            ("/xl/workbook.xml", f"{_CT_PREFIX}.sheet.main+xml"),
+            ("/xl/worksheets/sheet1.xml", f"{_CT_PREFIX}.worksheet+xml"),
+            ("/xl/styles.xml", f"{_CT_PREFIX}.styles+xml"),
+        ]
+        rels = [("worksheet", "worksheets/sheet1.xml"), ("styles", "styles.xml")]
+        if self._strings:
+            overrides.append(
+                ("/xl/sharedStrings.xml", f"{_CT_PREFIX}.sharedStrings+xml")
+            )
+            rels.append(("sharedStrings", "sharedStrings.xml"))
+            zf.writestr(_member("xl/sharedStrings.xml"), self._shared_strings_xml())
+        zf.writestr(_member("xl/styles.xml"), self._styles_xml())
+        for name, xml in _STATIC_MEMBERS.items():
+            zf.writestr(_member(name), _XML_DECL + xml)
+        zf.writestr(
+            _member("xl/_rels/workbook.xml.rels"),
+            f'{_XML_DECL}<Relationships xmlns="{_NS_PKG_RELS}">'
+            + "".join(
+                f'<Relationship Id="rId{i}" Type="{_RT_PREFIX}/{kind}" Target="{target}"/>'
+                for i, (kind, target) in enumerate(rels, 1)
+            )
+            + "</Relationships>",
+        )
+        zf.writestr(
+            _member("[Content_Types].xml"),
+            f"{_XML_DECL}<Types "
+            'xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" '
+            'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            + "".join(
+                f'<Override PartName="{name}" ContentType="{ct}"/>'
+                for name, ct in overrides
+            )
+            + "</Types>",
+        )
+        zf.close()
+
+    def _shared_strings_xml(self) -> str:
+        items = []
+        for s in self._strings:
+            space = ' xml:space="preserve"' if s != s.strip() else ""
+            items.append(f"<si><t{space}>{xml_text(s)}</t></si>")
+        n = len(items)
+        return (
+            f'{_XML_DECL}<sst xmlns="{_NS_MAIN}" count="{n}" uniqueCount="{n}">'
+            + "".join(items)
+            + "</sst>"
+        )
+
+    def _styles_xml(self) -> str:
+        fmts = "".join(
+            f'<numFmt numFmtId="{fmt_id}" formatCode="{xml_attr(code)}"/>'
+            for code, fmt_id in self._formats.items()
+        )
+        fmts = f'<numFmts count="{len(self._formats)}">{fmts}</numFmts>' if fmts else ""
+        xfs = "".join(
+            f'<xf numFmtId="{fmt_id}" fontId="0" fillId="0" borderId="0" xfId="0"'
+            + (' applyNumberFormat="1"/>' if fmt_id else "/>")
+            for fmt_id in self._styles
+        )
+        return (
+            f'{_XML_DECL}<styleSheet xmlns="{_NS_MAIN}">{fmts}'
+            '<fonts count="1"><font><sz val="11"/><name val="Calibri"/>'
+            '<family val="2"/><scheme val="minor"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+            "</border></borders>"
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" '
+            'borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(self._styles)}">{xfs}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+            "</cellStyles></styleSheet>"
+        )
+
+
+class CategoryWorkbookWriter(_pptx_xlsx.CategoryWorkbookWriter):
+    """python-pptx's category layout, written by `_WorkbookStream`."""
+
+    @property
+    def xlsx_blob(self) -> bytes:
+        out = BytesIO()
+        book = _WorkbookStream(out)
+        cd = self._chart_data
+        categories = cd.categories
+        depth = categories.depth
+        cat_style = book.style(categories.number_format)
+        # bottom level first, as python-pptx lists them; column depth - i
+        levels = [dict(level) for level in categories.levels]
+        series = list(cd)
+        values = [s.values for s in series]
+        styles = [book.style(s.number_format) for s in series]
+        n_rows = max([categories.leaf_count] + [len(v) for v in values])
+
+        def rows():
+            yield 1, [(depth + i + 1, s.name, 0) for i, s in enumerate(series)]
+            for r in range(n_rows):
+                # only the cells python-pptx writes: a styled None is a blank
+                # cell, a position past a level or series is no cell at all
+                cells = [
+                    (depth - i, levels[i][r], cat_style)
+                    for i in range(len(levels) - 1, -1, -1)
+                    if r in levels[i]
+                ]
+                cells += [
+                    (depth + i + 1, v[r], styles[i])
+                    for i, v in enumerate(values)
+                    if r < len(v)
+                ]
+                yield r + 2, cells
+
+        cols = (
+            f'<cols><col min="1" max="{depth}" width="10.7109375" customWidth="1"/></cols>'
+            if depth
+            else ""
+        )
+        book.write_sheet(rows(), cols)
+        book.close()
+        return out.getvalue()
+
+
+class XyWorkbookWriter(_pptx_xlsx.XyWorkbookWriter):
+    """python-pptx's XY layout, written by `_WorkbookStream`."""
+
+    def _columns(self, series) -> list:
+        return [series.x_values, series.y_values]
+
+    @property
+    def xlsx_blob(self) -> bytes:
+        out = BytesIO()
+        book = _WorkbookStream(out)
+        chart_style = book.style(self._chart_data.number_format)
+
+        def rows():
+            for series in self._chart_data:
+                series_style = book.style(series.number_format)
+                offset = self.series_table_row_offset(series)
+                columns = self._columns(series)
+                header = [(2, series.name, 0)]
+                if len(columns) == 3:
+                    header.append((3, "Size", 0))
+                yield offset + 1, header
+                col_styles = (chart_style, series_style, chart_style)
+                for r, point in enumerate(zip(*columns), offset + 2):
+                    yield r, [(c, v, col_styles[c - 1]) for c, v in enumerate(point, 1)]
+
+        book.write_sheet(rows())
+        book.close()
+        return out.getvalue()
+
+
+class BubbleWorkbookWriter(XyWorkbookWriter, _pptx_xlsx.BubbleWorkbookWriter):
+    """python-pptx's bubble layout, written by `_WorkbookStream`."""
+
+    def _columns(self, series) -> list:
+        return [series.x_values, series.y_values, series.bubble_sizes]
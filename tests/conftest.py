@@ -0,0 +1,88 @@
+import io
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE as XL
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.util import Inches, Pt
+
+
+def make_deck(path, n: int = 6) -> None:
+    """A deck with placeholders, formatted text with placeholders split over
+    runs, hyperlinks, category/XY/bubble charts, tables and a picture."""
+    prs = Presentation()
+    img = io.BytesIO()
+    Image.new("RGB", (16, 16), (200, 10, 10)).save(img, "PNG")
+    for i in range(n):
+        slide = prs.slides.add_slide(prs.slide_layouts[i % 6])
+        for ph in slide.placeholders:
+            if ph.has_text_frame:
+                ph.text_frame.text = f"Placeholder {ph.placeholder_format.idx} on {i}"
+        tb = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+        tb.name = f"tb{i}"
+        tf = tb.text_frame
+        tf.word_wrap = True
+        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+        p = tf.paragraphs[0]
+        p.alignment = PP_ALIGN.CENTER
+        p.space_before = Pt(6)
+        r = p.add_run()
+        r.text = "Hello {{customer}} "
+        r.font.bold = True
+        r.font.size = Pt(18)
+        r.font.name = "Arial"
+        r.font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+        r2 = p.add_run()
+        r2.text = "world"
+        r2.font.italic = True
+        r2.hyperlink.address = "https://example.com"
+        p2 = tf.add_paragraph()
+        p2.level = 1
+        for text in ("{{per", "iod}}", " tail"):
+            p2.add_run().text = text
+        if i % 3 == 0:
+            cd = CategoryChartData()
+            cd.categories = ["a", "b", "c"]
+            cd.add_series("S1", (1.0, 2.0, 3.0 + i))
+            cd.add_series("S2", (4.0, None, 6.0))
+            g = slide.shapes.add_chart(
+                XL.COLUMN_CLUSTERED, Inches(1), Inches(3), Inches(4), Inches(3), cd
+            )
+            g.name = f"chart{i}"
+            g.chart.has_title = True
+            g.chart.chart_title.text_frame.text = "T"
+        elif i % 3 == 1:
+            cd = XyChartData()
+            series = cd.add_series("XY")
+            for k in range(20):
+                series.add_data_point(k * 0.5, k * k)
+            slide.shapes.add_chart(
+                XL.XY_SCATTER, Inches(1), Inches(3), Inches(4), Inches(3), cd
+            )
+            bd = BubbleChartData()
+            series = bd.add_series("B")
+            for k in range(10):
+                series.add_data_point(k, k * 2, k + 1)
+            slide.shapes.add_chart(
+                XL.BUBBLE, Inches(5), Inches(3), Inches(4), Inches(3), bd
+            )
+        else:
+            table = slide.shapes.add_table(
+                3, 4, Inches(1), Inches(3), Inches(6), Inches(2)
+            )
+            for row in range(3):
+                for col in range(4):
+                    table.table.cell(row, col).text = f"r{row}c{col} {{{{cell}}}}"
+            img.seek(0)
+            slide.shapes.add_picture(img, Inches(7), Inches(1))
+    prs.save(path)
+
+
+@pytest.fixture(scope="session")
+def deck_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("decks") / "deck.pptx"
+    make_deck(path)
+    return path
@@ -0,0 +1,165 @@
+import io
+import multiprocessing
+import os
+
+import openpyxl
+import pytest
+
+import mipptx.presentation
+from mipptx.batch import render_many
+from mipptx.charts import CategoryChartDataModel, CategorySeriesModel, ChartModel
+from mipptx.presentation import PresentationModel
+from mipptx.slide import SlideModel
+
+# patched functions reach the workers only when they are forked from this process
+forked = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="needs fork-started worker processes",
+)
+MAIN = os.getpid()
+
+
+def _decks(n: int):
+    return [
+        PresentationModel(slide_width_in=7.5 if i == 3 else 10, slide_height_in=7.5)
+        for i in range(n)
+    ]
+
+
+def test_render_many_workers_match_serial(tmp_path):
+    serial = render_many(_decks(5), None, str(tmp_path / "a"))
+    pooled = render_many(iter(_decks(5)), None, str(tmp_path / "b"), workers=2)
+    assert [r.index for r in pooled] == list(range(5))
+    assert all(r.ok for r in serial + pooled)
+    for a, b in zip(serial, pooled):
+        assert PresentationModel.from_file(a.path) == PresentationModel.from_file(
+            b.path
+        )
+    assert sorted(os.listdir(tmp_path / "b")) == [
+        f"deck_{i:05d}.pptx" for i in range(5)
+    ]
+
+
+def test_render_many_reports_a_failing_deck(tmp_path, monkeypatch):
+    save = PresentationModel.save
+
+    def failing_save(self, path, template=None, **kwargs):
+        if self.slide_width_in == 7.5:
+            raise RuntimeError("bad deck")
+        return save(self, path, template=template, **kwargs)
+
+    monkeypatch.setattr(PresentationModel, "save", failing_save)
+    results = render_many(_decks(6), None, str(tmp_path), filename="d{index}.pptx")
+    assert [r.ok for r in results] == [True, True, True, False, True, True]
+    assert results[3].error == "RuntimeError: bad deck"
+    assert not (tmp_path / "d3.pptx").exists()
+
+
+@forked
+def test_render_many_survives_a_dead_worker(tmp_path, monkeypatch):
+    save = PresentationModel.save
+
+    def crashing_save(self, path, template=None, **kwargs):
+        if self.slide_width_in == 7.5 and os.getpid() != MAIN:
+            os._exit(3)
+        return save(self, path, template=template, **kwargs)
+
+    monkeypatch.setattr(PresentationModel, "save", crashing_save)
+    consumed = []
+
+    def models():
+        for i, model in enumerate(_decks(12)):
+            consumed.append(i)
+            yield model
+
+    results = render_many(models(), None, str(tmp_path), workers=2)
+    assert consumed == list(range(12))
+    assert [r.index for r in results] == list(range(12))
+    assert [r.index for r in results if not r.ok] == [3]
+    assert len(os.listdir(tmp_path)) == 11
+
+
+# ---------- refresh_charts ----------
+
+
+def _chart_deck(value: float, title: str = "t") -> PresentationModel:
+    def chart(s: int, k: int) -> ChartModel:
+        return ChartModel(
+            name=f"c{k}",
+            title=f"{title}{s}{k}",
+            chart_type="line",
+            left_pt=0,
+            top_pt=0,
+            width_pt=300,
+            height_pt=200,
+            category_data=CategoryChartDataModel(
+                categories=["a", "b", "c"],
+                series=[
+                    CategorySeriesModel(
+                        name="s", values=[value + s, value + k, value + 2.0]
+                    )
+                ],
+            ),
+        )
+
+    return PresentationModel(
+        slides=[SlideModel(shapes=[chart(s, k) for k in range(3)]) for s in range(5)]
+    )
+
+
+def _charts(prs) -> list:
+    # the point caches and workbook cells of every chart
+    out = []
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if shape.has_chart:
+                chart = shape.chart
+                blob = chart.part.chart_workbook.xlsx_part.blob
+                ws = openpyxl.load_workbook(io.BytesIO(blob)).active
+                out.append(
+                    (
+                        chart.chart_title.text_frame.text,
+                        ChartModel.from_pptx(shape).data_digest(),
+                        [[c.value for c in row] for row in ws.iter_rows()],
+                    )
+                )
+    return out
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_refresh_charts_workers_match_serial(strict):
+    serial = _chart_deck(1.0).build_presentation()
+    pooled = _chart_deck(1.0).build_presentation()
+    update = _chart_deck(5.0, title="u")
+    # one slide unchanged, so some charts are skipped
+    update.slides[1] = _chart_deck(1.0).slides[1]
+    # charts read before the refresh must show the refreshed data after it
+    _charts(pooled)
+    a = update.refresh_charts(serial, strict=strict)
+    b = update.refresh_charts(pooled, strict=strict, workers=2)
+    assert a == b
+    assert (a.updated, a.skipped, a.failed) == (12, 3, 0)
+    assert _charts(pooled) == _charts(serial)
+
+
+@forked
+def test_refresh_charts_survives_a_dead_worker(monkeypatch):
+    refresh = mipptx.presentation._refresh_chart
+
+    def crashing_refresh(cm, chart, strict, skip_unchanged):
+        if cm.title == "u21" and os.getpid() != MAIN:
+            os._exit(3)
+        return refresh(cm, chart, strict, skip_unchanged)
+
+    monkeypatch.setattr(mipptx.presentation, "_refresh_chart", crashing_refresh)
+    prs = _chart_deck(1.0).build_presentation()
+    before = _charts(prs)
+    report = _chart_deck(5.0, title="u").refresh_charts(prs, workers=2)
+    assert (report.updated, report.skipped, report.failed) == (12, 0, 3)
+    after = _charts(prs)
+    serial = _chart_deck(1.0).build_presentation()
+    _chart_deck(5.0, title="u").refresh_charts(serial)
+    want = _charts(serial)
+    # the slide whose worker died is left exactly as it was
+    assert after[6:9] == before[6:9]
+    assert after[:6] + after[9:] == want[:6] + want[9:]
@@ -0,0 +1,159 @@
+import math
+from array import array
+
+import pytest
+
+from mipptx import binary
+from mipptx.binary import BinaryFormatError, Columns, decode, encode
+from mipptx.charts import (
+    BubbleChartDataModel,
+    BubblePoint,
+    BubbleSeriesModel,
+    CategoryChartDataModel,
+    CategorySeriesModel,
+    ChartModel,
+    XyChartDataModel,
+    XyPoint,
+    XySeriesModel,
+)
+from mipptx.presentation import PresentationModel
+from mipptx.slide import SlideModel
+
+VALUES = {
+    "scalar": 1.5,
+    "empty": {},
+    "short lists stay JSON": {"a": [1.0, 2.0], "b": [{"x": 1.0}]},
+    "floats": [float(i) / 3 for i in range(20)],
+    "floats with nulls": {"v": [None if i % 3 else i * 0.5 for i in range(17)]},
+    "ints stay JSON": {"v": list(range(20))},
+    "mixed": {"v": [1.0] * 9 + ["x"]},
+    "records": {
+        "s": [
+            {"points": [{"x": float(i), "y": None if i == 4 else -i * 1e300}]}
+            for i in range(3)
+        ]
+        + [{"points": [{"x": float(i), "y": i / 7} for i in range(30)]}]
+    },
+    "ragged records": [{"x": 1.0}] * 8 + [{"y": 1.0}],
+    "nested": {"ü": [[{"k": "é", "v": [0.25] * 12}], None, True, "text"]},
+}
+
+
+@pytest.mark.parametrize("value", VALUES.values(), ids=VALUES.keys())
+def test_round_trip(value):
+    assert decode(encode(value)) == value
+
+
+def test_encode_leaves_the_value_as_it_was():
+    value = {"a": {"b": [float(i) for i in range(10)]}, "c": [[0.5] * 9]}
+    series = value["a"]["b"]
+    encode(value)
+    assert value == {"a": {"b": [float(i) for i in range(10)]}, "c": [[0.5] * 9]}
+    assert value["a"]["b"] is series
+
+
+def test_decode_columns():
+    points = [{"x": float(i), "y": None if i % 4 == 0 else i * 0.5} for i in range(20)]
+    data = encode({"points": points, "other": [1.0] * 8})
+    out = decode(data, columns=True)
+    cols = out["points"]
+    assert type(cols) is Columns
+    assert list(cols) == ["x", "y"]
+    assert all(type(c) is array and c.typecode == "d" for c in cols.values())
+    assert list(cols["x"]) == [p["x"] for p in points]
+    assert [math.isnan(v) for v in cols["y"]] == [p["y"] is None for p in points]
+    assert cols.records() == points
+    # plain float lists are not affected
+    assert out["other"] == [1.0] * 8
+
+
+def test_encode_accepts_memoryviews_and_bytearrays():
+    data = encode(VALUES["records"])
+    assert decode(bytearray(data)) == decode(memoryview(data)) == VALUES["records"]
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"XYZ\x01\x00\x02{}", "not an mipptx"),
+        (binary.MAGIC + b"\x09\x00\x02{}", "unsupported"),
+        (encode(VALUES["floats"])[:-5], "truncated"),
+        (encode({"a": 1}) + b"\x00", "trailing"),
+        (binary.MAGIC + b"\x01\x00\x02[]"[:3] + b"x]", "corrupt"),
+        (binary.MAGIC + b"\x01\x01\x00\x7f\x00\x02{}", "unknown frame kind"),
+    ],
+)
+def test_bad_payloads(data, message):
+    with pytest.raises(BinaryFormatError, match=message):
+        decode(data)
+
+
+def _chart_deck() -> PresentationModel:
+    xy = XyChartDataModel(
+        series=[
+            XySeriesModel(
+                name="pts",
+                points=[
+                    XyPoint(x=i * 0.1, y=None if i == 3 else i**0.5) for i in range(50)
+                ],
+            ),
+            XySeriesModel.from_columns(
+                array("d", range(40)), array("d", [i / 9 for i in range(40)]), name="c"
+            ),
+        ]
+    )
+    bubble = BubbleChartDataModel(
+        series=[
+            BubbleSeriesModel(
+                name="b",
+                points=[BubblePoint(x=i, y=i * 2.0, size=i + 1.0) for i in range(12)],
+            )
+        ]
+    )
+    category = CategoryChartDataModel(
+        categories=[f"c{i}" for i in range(10)],
+        series=[CategorySeriesModel(name="s", values=[i * 1.5 for i in range(10)])],
+    )
+    geometry = {"left_pt": 0, "top_pt": 0, "width_pt": 300, "height_pt": 200}
+    charts = [
+        ChartModel(chart_type="scatter", xy_data=xy, **geometry),
+        ChartModel(chart_type="bubble", bubble_data=bubble, **geometry),
+        ChartModel(title="cat", category_data=category, **geometry),
+    ]
+    return PresentationModel(slides=[SlideModel(shapes=charts)])
+
+
+def _digests(model: PresentationModel):
+    # charts by the data they write, other shapes as they are
+    return [
+        [s.data_digest() if isinstance(s, ChartModel) else s for s in slide.shapes]
+        for slide in model.slides
+    ]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_bytes_matches_the_model(trusted):
+    model = _chart_deck()
+    back = PresentationModel.from_bytes(model.to_bytes(), trusted=trusted)
+    # point lists come back as columns; the data written is the same
+    assert _digests(back) == _digests(model)
+    assert back.slides[0].shapes[2] == model.slides[0].shapes[2]
+    again = PresentationModel.from_bytes(back.to_bytes(), trusted=trusted)
+    assert _digests(again) == _digests(model)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_trusted_json_matches_validated(trusted):
+    model = _chart_deck()
+    js = model.to_json()
+    back = PresentationModel.from_json(js, trusted=trusted)
+    assert back == PresentationModel.model_validate_json(js)
+    assert _digests(back) == _digests(model)
+
+
+def test_deck_round_trip(deck_path):
+    model = PresentationModel.from_file(deck_path)
+    for trusted in (False, True):
+        back = PresentationModel.from_bytes(model.to_bytes(), trusted=trusted)
+        assert _digests(back) == _digests(model)
+        assert PresentationModel.from_json(model.to_json(), trusted=trusted) == model
@@ -0,0 +1,135 @@
+import math
+import random
+from array import array
+
+import pytest
+
+from mipptx import downsample
+from mipptx.charts import (
+    CategoryChartDataModel,
+    CategorySeriesModel,
+    XyChartDataModel,
+    XyPoint,
+    XySeriesModel,
+)
+from mipptx.downsample import Downsample, select, take
+
+METHODS = ["lttb", "minmax"]
+
+
+def _series(n: int, seed: int = 3, gaps: bool = False):
+    rng = random.Random(seed)
+    x = sorted(rng.uniform(0, 100) for _ in range(n))
+    y = [math.sin(v / 5) * 10 + rng.gauss(0, 1) for v in x]
+    if gaps:
+        for i in range(5, n, 17):
+            y[i] = None
+        for i in range(40, 60):
+            y[i] = None
+    return x, y
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(downsample, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_select_keeps_the_ends_in_order(backend, method):
+    x, y = _series(1000)
+    keep = select(method, x, y, 50)
+    assert keep[0] == 0 and keep[-1] == 999
+    assert keep == sorted(set(keep))
+    assert len(keep) <= 50
+    if method == "lttb":
+        assert len(keep) == 50
+
+
+def test_minmax_keeps_every_extreme(backend):
+    x, y = _series(1000)
+    y[500] = 1e6
+    y[700] = -1e6
+    keep = select("minmax", x, y, 40)
+    assert {500, 700} <= set(keep)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_short_series_are_kept_whole(backend, method):
+    assert select(method, None, [1.0, None, 3.0], 3) == [0, 1, 2]
+
+
+def test_lttb_skips_missing_values(backend):
+    x, y = _series(500, gaps=True)
+    keep = select("lttb", x, y, 30)
+    assert all(y[i] is not None for i in keep)
+
+
+def test_minmax_keeps_gaps_visible(backend):
+    x, y = _series(500, gaps=True)
+    keep = select("minmax", x, y, 100)
+    assert any(40 <= i < 60 for i in keep)
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("gaps", [False, True])
+def test_numpy_matches_python(monkeypatch, method, gaps):
+    pytest.importorskip("numpy")
+    x, y = _series(2000, seed=11, gaps=gaps)
+    with_numpy = select(method, x, y, 101)
+    monkeypatch.setattr(downsample, "np", None)
+    assert select(method, x, y, 101) == with_numpy
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError, match="unknown downsample method"):
+        select("median", None, list(range(10)), 4)
+
+
+def test_take_keeps_the_column_type():
+    assert take([1, 2, 3, 4], [0, 3]) == [1, 4]
+    col = take(array("d", [1.0, 2.0, 3.0]), [1, 2])
+    assert col == array("d", [2.0, 3.0])
+    np = pytest.importorskip("numpy")
+    out = take(np.arange(5.0), [0, 4])
+    assert isinstance(out, np.ndarray) and out.tolist() == [0.0, 4.0]
+
+
+def test_xy_points_and_columns_downsample_alike(backend):
+    x, y = _series(300)
+    spec = Downsample(points=20)
+    points = XyChartDataModel(
+        series=[
+            XySeriesModel(name="s", points=[XyPoint(x=a, y=b) for a, b in zip(x, y)])
+        ],
+        downsample=spec,
+    ).downsampled()
+    columns = XyChartDataModel(
+        series=[XySeriesModel.from_columns(array("d", x), array("d", y), name="s")],
+        downsample=spec,
+    ).downsampled()
+    assert points.downsample is None
+    assert len(points.series[0].points) == 20
+    assert list(columns.series[0].x_values()) == list(points.series[0].x_values())
+    assert points.data_digest() == columns.data_digest()
+
+
+def test_category_series_share_the_kept_points(backend):
+    _, y = _series(200)
+    data = CategoryChartDataModel(
+        categories=[f"c{i}" for i in range(200)],
+        series=[
+            CategorySeriesModel(name="a", values=y),
+            CategorySeriesModel(name="b", values=[-v for v in y]),
+        ],
+        downsample=Downsample(method="minmax", points=20),
+    )
+    out = data.downsampled()
+    kept = [int(c[1:]) for c in out.categories]
+    assert kept[0] == 0 and kept[-1] == 199
+    for s, full in zip(out.series, data.series):
+        assert s.values == [full.values[i] for i in kept]
+    assert data.data_digest() == out.data_digest()
@@ -0,0 +1,127 @@
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from mipptx import package
+from mipptx.charts import CategoryChartDataModel, CategorySeriesModel, ChartModel
+from mipptx.package import open_presentation, save_incremental, save_presentation
+from mipptx.presentation import PresentationModel
+from mipptx.shapes import TableModel, TextBoxModel
+from mipptx.slide import SlideModel
+from mipptx.text import ParagraphModel, RunModel, TextFrameModel
+
+BOX = {"left_pt": 0, "top_pt": 0, "width_pt": 100, "height_pt": 50}
+
+
+def frame(text):
+    return TextFrameModel(paragraphs=[ParagraphModel(runs=[RunModel(text=text)])])
+
+
+def category(*values):
+    return CategoryChartDataModel(
+        categories=["a", "b"], series=[CategorySeriesModel(name="s", values=values)]
+    )
+
+
+@pytest.fixture
+def deck(tmp_path):
+    path = tmp_path / "deck.pptx"
+    model = PresentationModel(
+        slides=[
+            SlideModel(shapes=[TextBoxModel(text_frame=frame("old"), **BOX)]),
+            SlideModel(
+                shapes=[
+                    TextBoxModel(text_frame=frame(f"s{i}"), **BOX) for i in range(5)
+                ]
+            ),
+            SlideModel(
+                shapes=[
+                    ChartModel(chart_type="line", category_data=category(1, 2), **BOX)
+                ]
+            ),
+        ]
+    )
+    model.build_presentation().save(path)
+    return path
+
+
+def edit(prs):
+    # one edit through each kind of mipptx writer
+    frame("new").to_pptx(prs.slides[0].shapes[-1].text_frame)
+    SlideModel(
+        shapes=[
+            TextBoxModel(text_frame=frame("x"), **BOX),
+            TableModel(rows=[["t"]], **BOX),
+        ]
+    ).apply_to_pptx(prs.slides[1])
+    chart = next(s for s in prs.slides[2].shapes if s.has_chart).chart
+    ChartModel(
+        chart_type="line", category_data=category(7, 8), **BOX
+    ).apply_to_existing_chart(chart)
+
+
+def members(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def test_save_incremental_matches_save(deck, tmp_path):
+    prs = open_presentation(deck)
+    edit(prs)
+    save_incremental(prs, tmp_path / "inc.pptx")
+    prs.save(tmp_path / "full.pptx")
+    assert members(tmp_path / "inc.pptx") == members(tmp_path / "full.pptx")
+
+    out = Presentation(tmp_path / "inc.pptx")
+    assert out.slides[0].shapes[-1].text_frame.text == "new"
+    assert len(out.slides[1].shapes) == len(Presentation(deck).slides[1].shapes) + 2
+    chart = next(s for s in out.slides[2].shapes if s.has_chart).chart
+    assert list(chart.plots[0].series[0].values) == [7.0, 8.0]
+
+
+def test_save_incremental_copies_clean_parts_as_is(deck, tmp_path):
+    prs = open_presentation(deck)
+    frame("new").to_pptx(prs.slides[0].shapes[-1].text_frame)
+    save_incremental(prs, tmp_path / "inc.pptx")
+    with zipfile.ZipFile(deck) as src, zipfile.ZipFile(tmp_path / "inc.pptx") as dst:
+        for name in ("ppt/slides/slide2.xml", "ppt/slides/slide3.xml"):
+            a, b = src.getinfo(name), dst.getinfo(name)
+            assert (a.CRC, a.compress_size, a.compress_type) == (
+                b.CRC,
+                b.compress_size,
+                b.compress_type,
+            )
+        assert dst.testzip() is None
+
+
+def test_save_incremental_without_zip_internals(deck, tmp_path, monkeypatch):
+    monkeypatch.setattr(package, "_RAW_COPY", False)
+    prs = open_presentation(deck)
+    edit(prs)
+    save_incremental(prs, tmp_path / "inc.pptx")
+    prs.save(tmp_path / "full.pptx")
+    assert members(tmp_path / "inc.pptx") == members(tmp_path / "full.pptx")
+
+
+def test_save_incremental_over_source(deck):
+    prs = open_presentation(deck)
+    edit(prs)
+    save_incremental(prs, deck)
+    frame("again").to_pptx(prs.slides[0].shapes[-1].text_frame)
+    save_incremental(prs, deck)
+    out = Presentation(deck)
+    assert out.slides[0].shapes[-1].text_frame.text == "again"
+
+
+def test_save_incremental_needs_tracking(deck, tmp_path):
+    with pytest.raises(ValueError):
+        save_incremental(Presentation(deck), tmp_path / "out.pptx")
+
+
+def test_save_presentation_matches_save(deck, tmp_path):
+    prs = Presentation(deck)
+    report = save_presentation(prs, tmp_path / "a.pptx", "stored")
+    prs.save(tmp_path / "b.pptx")
+    assert members(tmp_path / "a.pptx") == members(tmp_path / "b.pptx")
+    assert report.bytes_written == (tmp_path / "a.pptx").stat().st_size
@@ -0,0 +1,63 @@
+import pytest
+
+from mipptx.enums import ShapeKind
+from mipptx.presentation import PresentationModel
+
+
+@pytest.fixture(scope="module")
+def model(deck_path):
+    return PresentationModel.from_file(deck_path)
+
+
+def test_lxml_engine_matches_pptx(deck_path, model):
+    assert PresentationModel.from_file(deck_path, engine="lxml") == model
+
+
+@pytest.mark.parametrize("engine", ["pptx", "lxml"])
+def test_workers_match_serial(deck_path, model, engine):
+    assert PresentationModel.from_file(deck_path, workers=2, engine=engine) == model
+
+
+@pytest.mark.parametrize("engine", ["pptx", "lxml"])
+def test_slides_from_a_generator(deck_path, model, engine):
+    # the indices are consumed once to count them; extraction must not see them empty
+    slides = (i for i in (4, 1))
+    out = PresentationModel.from_file(deck_path, engine=engine, slides=slides)
+    assert out.slides == [model.slides[4], model.slides[1]]
+
+
+@pytest.mark.parametrize("engine", ["pptx", "lxml"])
+def test_kinds_filter(deck_path, model, engine):
+    out = PresentationModel.from_file(deck_path, engine=engine, kinds={ShapeKind.chart})
+    for got, full in zip(out.slides, model.slides):
+        assert got.shapes == [s for s in full.shapes if s.type == ShapeKind.chart]
+
+
+def test_normalize_runs_on_read(deck_path, model):
+    normalized = model.model_copy(deep=True)
+    normalized.normalize_runs()
+    for engine in ("pptx", "lxml"):
+        out = PresentationModel.from_file(deck_path, engine=engine, normalize_runs=True)
+        assert out == normalized
+
+
+def test_iter_slides_streams_lxml_slides(deck_path):
+    lxml = PresentationModel.from_file(deck_path, engine="lxml")
+    assert list(PresentationModel.iter_slides(deck_path)) == lxml.slides
+
+
+def test_build_and_read_back(tmp_path, model):
+    path = tmp_path / "rebuilt.pptx"
+    model.save(path)
+    again = PresentationModel.from_file(path)
+    assert len(again.slides) == len(model.slides)
+    for got, want in zip(again.slides, model.slides):
+        built = {s.name: s for s in got.shapes}
+        for shape in want.shapes:
+            if shape.type in (ShapeKind.chart, ShapeKind.table):
+                assert built[shape.name] == shape
+            elif shape.name.startswith("tb"):
+                # paragraph levels are not written back
+                assert [p.runs for p in built[shape.name].text_frame.paragraphs] == [
+                    p.runs for p in shape.text_frame.paragraphs
+                ]
@@ -0,0 +1,184 @@
+import math
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Pt
+
+from mipptx.shapes import TableModel, TextBoxModel
+from mipptx.text import FontModel, ParagraphModel, RunModel, TextFrameModel
+
+RICH = TextFrameModel(
+    paragraphs=[
+        ParagraphModel(
+            runs=[
+                RunModel(text="rich ", font=FontModel(bold=True, size_pt=9)),
+                RunModel(text="link", hyperlink="https://example.com"),
+            ],
+            alignment="right",
+        )
+    ],
+    vertical_anchor="bottom",
+)
+
+TABLES = {
+    "even": TableModel(
+        left_pt=10,
+        top_pt=20,
+        width_pt=301,
+        height_pt=97,
+        rows=[["a", "b & c", ""], ["multi\nline", "tab\vbreak", RICH]],
+    ),
+    "sized": TableModel(
+        name="sized",
+        left_pt=0,
+        top_pt=0,
+        width_pt=0,
+        height_pt=0,
+        rows=[["h1", "h2"], ["x"], [RICH, "-"]],
+        col_widths_pt=[100.5, 50],
+        row_heights_pt=[20, 20, 30.25],
+        first_row=False,
+        last_row=True,
+        vert_banding=True,
+        rotation=90,
+    ),
+}
+
+
+def _slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _reference_table(model: TableModel, slide):
+    # the table as python-pptx's own API builds it
+    n_cols = max(len(r) for r in model.rows)
+    frame = slide.shapes.add_table(
+        len(model.rows),
+        n_cols,
+        Pt(model.left_pt),
+        Pt(model.top_pt),
+        Pt(model.width_pt),
+        Pt(model.height_pt),
+    )
+    if model.name:
+        frame.name = model.name
+    table = frame.table
+    if model.col_widths_pt:
+        for col, w in zip(table.columns, model.col_widths_pt):
+            col.width = Pt(w)
+    if model.row_heights_pt:
+        for row, h in zip(table.rows, model.row_heights_pt):
+            row.height = Pt(h)
+    for attr in (
+        "first_row",
+        "last_row",
+        "first_col",
+        "last_col",
+        "horz_banding",
+        "vert_banding",
+    ):
+        if getattr(model, attr) is not None:
+            setattr(table, attr, getattr(model, attr))
+    for r, row in enumerate(model.rows):
+        for c, content in enumerate(row):
+            cell = table.cell(r, c)
+            if isinstance(content, str):
+                cell.text = content
+            else:
+                content.to_pptx(cell.text_frame)
+    if model.rotation:
+        frame.rotation = model.rotation
+    return frame
+
+
+def _c14n(element) -> bytes:
+    return etree.tostring(element, method="c14n", exclusive=True)
+
+
+@pytest.mark.parametrize("model", TABLES.values(), ids=TABLES.keys())
+def test_table_xml_matches_python_pptx(model):
+    slide = _slide()
+    model.apply_to_slide(slide)
+    built = slide.shapes[-1]
+    want = _reference_table(model, slide)
+    assert built.shape_id + 1 == want.shape_id
+    assert built.name == (model.name or f"Table {built.shape_id - 1}")
+    assert (built.left, built.top, built.width, built.height) == (
+        want.left,
+        want.top,
+        want.width,
+        want.height,
+    )
+    assert built.rotation == want.rotation
+    assert _c14n(built._element.graphic) == _c14n(want._element.graphic)
+
+
+@pytest.mark.parametrize("model", TABLES.values(), ids=TABLES.keys())
+def test_table_round_trip(model):
+    slide = _slide()
+    model.apply_to_slide(slide)
+    frame = slide.shapes[-1]
+    from_pptx = TableModel.from_pptx(frame.table)
+    assert TableModel.from_xml(frame._element.graphic.graphicData[0]) == from_pptx
+    for got, want in zip(from_pptx.rows, model.rows):
+        # the readers take text from runs; line breaks between them are dropped
+        texts = [(c if isinstance(c, str) else c.text).replace("\v", "") for c in want]
+        texts += [""] * (len(got) - len(want))
+        assert [c.text for c in got] == texts
+
+
+def test_text_box_round_trip():
+    box = TextBoxModel(
+        name="box", left_pt=10, top_pt=5, width_pt=200, height_pt=40, text_frame=RICH
+    )
+    slide = _slide()
+    box.apply_to_slide(slide)
+    shape = slide.shapes[-1]
+    assert shape.name == "box"
+    back = TextFrameModel.from_pptx(shape.text_frame)
+    assert [[r.text for r in p.runs] for p in back.paragraphs] == [["rich ", "link"]]
+    assert back.paragraphs[0].runs[0].font == FontModel(bold=True, size_pt=9)
+    assert back == TextFrameModel.from_xml(shape._element.txBody)
+    assert shape.text_frame.paragraphs[0].runs[1].hyperlink.address == (
+        "https://example.com"
+    )
+
+
+def test_arrow_and_dataframe_cells_agree():
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    data = {
+        "name": ["a", None, "c"],
+        "value": [1.0, 0.1, math.nan],
+        "big": [1e20, None, -2.5],
+        "count": [1, 2, 3],
+    }
+    table = pa.table(data)
+    df = pd.DataFrame(data)
+    rows = [
+        ["name", "value", "big", "count"],
+        ["a", "1.0", "1e+20", "1"],
+        ["", "0.1", "", "2"],
+        ["c", "", "-2.5", "3"],
+    ]
+    assert (
+        TableModel.from_arrow(table, left_pt=0, top_pt=0, width_pt=0, height_pt=0).rows
+        == rows
+    )
+    assert (
+        TableModel.from_dataframe(df, left_pt=0, top_pt=0, width_pt=0, height_pt=0).rows
+        == rows
+    )
+
+
+def test_to_arrow_round_trip():
+    pytest.importorskip("pyarrow")
+    model = TABLES["even"]
+    table = model.to_arrow()
+    assert table.column_names == ["a", "b & c", ""]
+    back = TableModel.from_arrow(table, left_pt=0, top_pt=0, width_pt=0, height_pt=0)
+    assert back.rows == [
+        [c if isinstance(c, str) else c.text for c in row] for row in model.rows
+    ]
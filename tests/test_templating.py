@@ -0,0 +1,129 @@
+import io
+import zipfile
+
+import pytest
+
+from mipptx.presentation import PresentationModel
+from mipptx.shapes import TableModel, TextBoxModel
+from mipptx.slide import SlideModel
+from mipptx.templating import compile_pptx_template, compile_template
+from mipptx.text import FontModel, ParagraphModel, RunModel, TextFrameModel
+
+VALUES = {"customer": "ACME & Co", "period": "Q3", "cell": 42}
+
+
+@pytest.fixture(scope="module")
+def model(deck_path):
+    return PresentationModel.from_file(deck_path)
+
+
+def _box(slide: SlideModel) -> TextBoxModel:
+    return next(s for s in slide.shapes if s.name and s.name.startswith("tb"))
+
+
+def test_names(deck_path, model):
+    assert compile_template(model).names == {"customer", "period", "cell"}
+    assert compile_pptx_template(deck_path).names == {"customer", "period", "cell"}
+
+
+def test_model_render(model):
+    before = model.model_copy(deep=True)
+    out = compile_template(model).render(VALUES)
+    assert model == before
+    first, second = _box(out.slides[0]).text_frame.paragraphs
+    assert [r.text for r in first.runs] == ["Hello ACME & Co ", "world"]
+    assert (
+        first.runs[0].font
+        == _box(model.slides[0]).text_frame.paragraphs[0].runs[0].font
+    )
+    # a token split over runs is rendered into the run it starts in
+    assert [r.text for r in second.runs] == ["Q3", "", " tail"]
+    table = next(s for s in out.slides[2].shapes if isinstance(s, TableModel))
+    assert table.rows[1][2].text == "r1c2 42"
+
+
+def test_model_render_shares_untouched_parts(model):
+    out = compile_template(model).render(VALUES)
+    for got, want in zip(out.slides, model.slides):
+        for shape, original in zip(got.shapes, want.shapes):
+            if not isinstance(shape, (TextBoxModel, TableModel)) or (
+                shape.name or ""
+            ).startswith("Title"):
+                assert shape is original
+
+
+def test_model_render_strict(model):
+    template = compile_template(model)
+    with pytest.raises(KeyError, match="customer"):
+        template.render({"period": "Q3", "cell": 1})
+    out = template.render({"period": "Q3", "cell": 1}, strict=False)
+    assert _box(out.slides[0]).text_frame.paragraphs[0].runs[0].text == (
+        "Hello {{customer}} "
+    )
+
+
+def test_plain_table_cells_and_spacing():
+    frame = TextFrameModel(
+        paragraphs=[
+            ParagraphModel(
+                runs=[
+                    RunModel(text="{{ a }}{", font=FontModel(bold=True)),
+                    RunModel(text="{b}} {{a}}"),
+                ]
+            )
+        ]
+    )
+    geometry = {"left_pt": 0, "top_pt": 0, "width_pt": 10, "height_pt": 10}
+    model = PresentationModel(
+        slides=[
+            SlideModel(
+                shapes=[
+                    TextBoxModel(text_frame=frame, **geometry),
+                    TableModel(rows=[["{{a}}/{{b}}", "{{ nope"]], **geometry),
+                ]
+            )
+        ]
+    )
+    out = compile_template(model).render({"a": 1, "b": "two"})
+    box, table = out.slides[0].shapes
+    assert [r.text for r in box.text_frame.paragraphs[0].runs] == ["1two", " 1"]
+    assert table.rows == [["1/two", "{{ nope"]]
+
+
+def test_pptx_render_matches_model_render(deck_path, model, tmp_path):
+    path = tmp_path / "out.pptx"
+    report = compile_pptx_template(deck_path).render(VALUES, str(path))
+    assert report.bytes_written == path.stat().st_size
+    assert PresentationModel.from_file(path) == compile_template(model).render(VALUES)
+
+
+def test_pptx_render_copies_other_members(deck_path, tmp_path):
+    path = tmp_path / "out.pptx"
+    compile_pptx_template(deck_path).render(VALUES, str(path))
+    with zipfile.ZipFile(deck_path) as a, zipfile.ZipFile(path) as b:
+        assert a.namelist() == b.namelist()
+        for info in a.infolist():
+            if not info.filename.startswith("ppt/slides/slide"):
+                other = b.getinfo(info.filename)
+                assert (other.CRC, other.compress_size) == (
+                    info.CRC,
+                    info.compress_size,
+                )
+
+
+def test_pptx_render_again_with_other_values(deck_path, model, tmp_path):
+    template = compile_pptx_template(deck_path)
+    for i, values in enumerate((VALUES, {"customer": "x", "period": "y", "cell": ""})):
+        out = io.BytesIO()
+        template.render(values, out)
+        path = tmp_path / f"out{i}.pptx"
+        path.write_bytes(out.getvalue())
+        rendered = PresentationModel.from_file(path)
+        assert rendered == compile_template(model).render(values)
+
+
+def test_pptx_render_strict_writes_nothing(deck_path):
+    out = io.BytesIO()
+    with pytest.raises(KeyError, match="cell"):
+        compile_pptx_template(deck_path).render({"customer": 1, "period": 2}, out)
+    assert out.getvalue() == b""
@@ -0,0 +1,154 @@
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.util import Inches
+
+from mipptx.presentation import PresentationModel
+from mipptx.shapes import TextBoxModel
+from mipptx.slide import SlideModel
+from mipptx.text import (
+    Color,
+    FontModel,
+    ParagraphModel,
+    RunModel,
+    TextFrameModel,
+    hyperlink_relater,
+)
+
+BOLD = FontModel(name="Arial", size_pt=18.5, bold=True, color=Color(hex="#123456"))
+ITALIC = FontModel(italic=True, underline="single")
+
+FRAMES = {
+    "empty": TextFrameModel(),
+    "empty paragraph": TextFrameModel(paragraphs=[ParagraphModel()]),
+    "plain": TextFrameModel(
+        paragraphs=[ParagraphModel(runs=[RunModel(text="a < b & c")])]
+    ),
+    "formatted": TextFrameModel(
+        paragraphs=[
+            ParagraphModel(
+                runs=[
+                    RunModel(text="Hello ", font=BOLD),
+                    RunModel(text="world", font=ITALIC, hyperlink="https://e.com/?a&b"),
+                    RunModel(text="!", hyperlink="https://e.com/?a&b"),
+                ],
+                alignment="center",
+                line_spacing=1.5,
+                space_before_pt=6,
+                space_after_pt=3.3,
+            ),
+            ParagraphModel(runs=[RunModel(text="next", font=BOLD)], alignment="right"),
+        ],
+        auto_size="text_to_fit_shape",
+        vertical_anchor="middle",
+        margin_left_pt=0,
+        margin_top_pt=12.5,
+        word_wrap=True,
+    ),
+    "no wrap": TextFrameModel(
+        paragraphs=[ParagraphModel(runs=[RunModel(text="x", font=FontModel())])],
+        auto_size="none",
+        vertical_anchor="bottom",
+        word_wrap=False,
+    ),
+}
+
+
+def _c14n(element) -> bytes:
+    return etree.tostring(element, method="c14n", exclusive=True)
+
+
+@pytest.mark.parametrize("frame", FRAMES.values(), ids=FRAMES.keys())
+def test_to_xml_matches_to_pptx_in_a_text_box(frame):
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    tb = slide.shapes.add_textbox(0, 0, Inches(2), Inches(1))
+    frame.to_pptx(tb.text_frame)
+    xml = frame.to_xml(hyperlink_relater(slide.part))
+    assert _c14n(parse_xml(xml)) == _c14n(tb._element.txBody)
+
+
+@pytest.mark.parametrize("frame", FRAMES.values(), ids=FRAMES.keys())
+def test_to_xml_matches_to_pptx_in_a_table_cell(frame):
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    table = slide.shapes.add_table(1, 1, 0, 0, Inches(2), Inches(1)).table
+    frame.to_pptx(table.cell(0, 0).text_frame)
+    xml = frame.to_xml(hyperlink_relater(slide.part), cell=True)
+    assert _c14n(parse_xml(xml)) == _c14n(table.cell(0, 0)._tc.txBody)
+
+
+@pytest.mark.parametrize("frame", FRAMES.values(), ids=FRAMES.keys())
+def test_from_xml_matches_from_pptx(frame):
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    tb = slide.shapes.add_textbox(0, 0, Inches(2), Inches(1))
+    frame.to_pptx(tb.text_frame)
+    assert TextFrameModel.from_xml(tb._element.txBody) == TextFrameModel.from_pptx(
+        tb.text_frame
+    )
+
+
+def test_normalize_runs():
+    para = ParagraphModel(
+        runs=[
+            RunModel(text="{{per", font=BOLD),
+            RunModel(text="", font=ITALIC),
+            RunModel(text="iod}}", font=BOLD),
+            RunModel(text=" x", font=ITALIC),
+            RunModel(text=" y", font=ITALIC, hyperlink="https://e.com"),
+        ]
+    )
+    report = para.normalize_runs()
+    assert [(r.text, r.font, r.hyperlink) for r in para.runs] == [
+        ("{{period}}", BOLD, None),
+        (" x", ITALIC, None),
+        (" y", ITALIC, "https://e.com"),
+    ]
+    assert (report.runs_before, report.runs_after) == (5, 3)
+
+
+def test_normalize_runs_keeps_the_font_of_an_empty_line():
+    para = ParagraphModel(runs=[RunModel(text="", font=BOLD), RunModel(text="")])
+    para.normalize_runs()
+    assert para.runs == [RunModel(text="", font=BOLD)]
+
+
+def _styled_deck() -> PresentationModel:
+    frame = FRAMES["formatted"].model_copy(deep=True)
+    box = TextBoxModel(
+        left_pt=0, top_pt=0, width_pt=100, height_pt=50, text_frame=frame
+    )
+    model = PresentationModel(slides=[SlideModel(shapes=[box])])
+    model.intern_styles()
+    return model
+
+
+def test_interned_styles_round_trip():
+    model = _styled_deck()
+    assert model.styles == [BOLD, ITALIC]
+    for load in (
+        lambda: PresentationModel.from_json(model.to_json()),
+        lambda: PresentationModel.from_json(model.to_json(), trusted=True),
+        lambda: PresentationModel.from_bytes(model.to_bytes()),
+        lambda: PresentationModel.from_bytes(model.to_bytes(), trusted=True),
+    ):
+        assert load() == model
+
+
+def test_to_json_writes_fonts_edited_after_interning():
+    model = _styled_deck()
+    runs = list(model.iter_runs())
+    runs[2].font = ITALIC
+    runs[0].font = FontModel(size_pt=40)
+    before = model.model_copy(deep=True)
+    back = PresentationModel.from_json(model.to_json())
+    assert model == before
+    assert [r.font for r in back.iter_runs()] == [r.font for r in runs]
+
+
+def test_a_run_font_is_kept_over_its_style_id():
+    model = _styled_deck()
+    data = model.model_dump(mode="json")
+    run = data["slides"][0]["shapes"][0]["text_frame"]["paragraphs"][0]["runs"][0]
+    run["font"] = {"size_pt": 9}
+    back = PresentationModel.model_validate(data)
+    assert next(back.iter_runs()).font == FontModel(size_pt=9)
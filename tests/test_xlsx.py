@@ -0,0 +1,276 @@
+import datetime
+import io
+import math
+import random
+import zipfile
+
+import openpyxl
+import pytest
+from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
+
+from mipptx import xlsx
+from mipptx.charts import (
+    BubbleChartDataModel,
+    BubblePoint,
+    BubbleSeriesModel,
+    CategoryChartDataModel,
+    CategorySeriesModel,
+    ChartModel,
+    XyChartDataModel,
+    XyPoint,
+    XySeriesModel,
+    _BubbleChartData,
+    _CategoryChartData,
+    _XyChartData,
+)
+from mipptx.downsample import Downsample
+from mipptx.presentation import PresentationModel
+from mipptx.slide import SlideModel
+
+
+def _cells(blob: bytes) -> list:
+    ws = openpyxl.load_workbook(io.BytesIO(blob))["Sheet1"]
+    return [
+        [
+            (
+                round(c.value, 12) if isinstance(c.value, float) else c.value,
+                c.number_format,
+            )
+            for c in row
+        ]
+        for row in ws.iter_rows()
+    ]
+
+
+def _category(cls):
+    cd = cls(number_format="0.0")
+    cd.categories = [f"c&<{i}>" for i in range(30)] + [" pad "]
+    for k in range(3):
+        cd.add_series(
+            f"s{k}",
+            [random.random() if i % 7 else None for i in range(31 - k)],
+            number_format="0.00%" if k == 1 else None,
+        )
+    return cd
+
+
+def _multi_level(cls):
+    cd = cls()
+    for g in range(3):
+        group = cd.add_category(f"G{g}")
+        for i in range(g + 2):
+            group.add_sub_category(f"g{g}-{i}")
+    cd.add_series("s", list(range(9)))
+    return cd
+
+
+def _dates(cls):
+    cd = cls()
+    cd.categories = [datetime.date(2024, 1, i + 1) for i in range(10)]
+    cd.add_series("s", [float(i) for i in range(10)])
+    return cd
+
+
+def _xy(cls):
+    cd = cls(number_format="0.000")
+    for k in range(3):
+        s = cd.add_series(f"x{k}", number_format="#,##0.0" if k else None)
+        for i in range(50):
+            s.add_data_point(random.random(), None if i == 3 else random.random())
+    return cd
+
+
+def _bubble(cls):
+    cd = cls()
+    for k in range(2):
+        s = cd.add_series(f"b{k}")
+        for i in range(20):
+            s.add_data_point(i, i * 2.5, None if i == 5 else i + 1)
+    return cd
+
+
+WORKBOOKS = {
+    "category": (_category, CategoryChartData, _CategoryChartData),
+    "multi-level": (_multi_level, CategoryChartData, _CategoryChartData),
+    "dates": (_dates, CategoryChartData, _CategoryChartData),
+    "xy": (_xy, XyChartData, _XyChartData),
+    "bubble": (_bubble, BubbleChartData, _BubbleChartData),
+}
+
+
+@pytest.mark.parametrize("case", WORKBOOKS.values(), ids=WORKBOOKS.keys())
+def test_streamed_workbook_matches_xlsxwriter(case):
+    build, reference, streamed = case
+    random.seed(5)
+    want = build(reference).xlsx_blob
+    random.seed(5)
+    got = build(streamed).xlsx_blob
+    assert _cells(got) == _cells(want)
+
+
+def _sheet_xml(blob: bytes) -> str:
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        return zf.read("xl/worksheets/sheet1.xml").decode()
+
+
+def test_blank_values_are_styled_cells():
+    cd = _CategoryChartData(number_format="0.0")
+    cd.categories = ["a", "b", "c"]
+    cd.add_series("s", [1.0, None, math.nan])
+    sheet = _sheet_xml(cd.xlsx_blob)
+    assert '<c r="B3" s="1"/>' in sheet
+    assert '<c r="B4" s="1"/>' in sheet
+
+
+def _workbook() -> bytes:
+    cd = _CategoryChartData()
+    cd.categories = ["a", "b", "c"]
+    cd.add_series("s", [1.0, 2.0, 3.0])
+    return cd.xlsx_blob
+
+
+UPDATES = {
+    "Sheet1": {
+        (2, 2): 10.5,
+        (3, 1): " padded ",
+        (4, 2): None,
+        (2, 5): True,
+        (9, 1): "new row",
+        (3, 2): math.nan,
+        (1, 3): 7,
+    },
+    "Missing": {(1, 1): "skipped"},
+}
+
+
+def _values(blob: bytes) -> list:
+    ws = openpyxl.load_workbook(io.BytesIO(blob))["Sheet1"]
+    return [[c.value for c in row] for row in ws.iter_rows()]
+
+
+def test_patch_cells_matches_openpyxl():
+    blob = _workbook()
+    patched = xlsx.patch_cells(blob, UPDATES)
+    reference = xlsx._patch_openpyxl(blob, UPDATES)
+    assert _values(patched) == _values(reference)
+    ws = openpyxl.load_workbook(io.BytesIO(patched))["Sheet1"]
+    assert ws.dimensions == "A1:E9"
+
+
+def test_patch_cells_copies_other_members_as_they_are():
+    blob = _workbook()
+    patched = xlsx.patch_cells(blob, {"Sheet1": {(2, 2): 5.0}})
+    with (
+        zipfile.ZipFile(io.BytesIO(blob)) as a,
+        zipfile.ZipFile(io.BytesIO(patched)) as b,
+    ):
+        assert a.namelist() == b.namelist()
+        for info in a.infolist():
+            if info.filename != "xl/worksheets/sheet1.xml":
+                other = b.getinfo(info.filename)
+                assert (other.CRC, other.compress_size) == (
+                    info.CRC,
+                    info.compress_size,
+                )
+
+
+def test_patch_cells_without_known_sheets_returns_the_blob():
+    blob = _workbook()
+    assert xlsx.patch_cells(blob, {"Missing": {(1, 1): 1}}) is blob
+
+
+def test_patch_cells_falls_back_for_formulas():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = 1
+    ws["A2"] = "=A1*2"
+    out = io.BytesIO()
+    wb.save(out)
+    patched = xlsx.patch_cells(out.getvalue(), {"Sheet1": {(2, 1): 4.0, (3, 1): "x"}})
+    assert _values(patched) == [[1], [4.0], ["x"]]
+
+
+@pytest.mark.parametrize(
+    "formula, cells",
+    [
+        ("Sheet1!$B$2:$B$4", ("Sheet1", ((2, 2), (3, 2), (4, 2)))),
+        ("'My sheet'!A1:B1", ("My sheet", ((1, 1), (1, 2)))),
+        ("Sheet1!$AA$10", ("Sheet1", ((10, 27),))),
+        ("nonsense", None),
+    ],
+)
+def test_parse_range(formula, cells):
+    assert xlsx.parse_range(formula) == cells
+
+
+# ---------- update_workbook_only ----------
+
+N = 10
+_GEOMETRY = {"left_pt": 0, "top_pt": 0, "width_pt": 300, "height_pt": 200}
+_MODELS = {
+    "xy": ChartModel(
+        chart_type="scatter",
+        xy_data=XyChartDataModel(
+            series=[
+                XySeriesModel(
+                    name="s", points=[XyPoint(x=i, y=i * i) for i in range(N)]
+                )
+            ]
+        ),
+        **_GEOMETRY,
+    ),
+    "bubble": ChartModel(
+        chart_type="bubble",
+        bubble_data=BubbleChartDataModel(
+            series=[
+                BubbleSeriesModel(
+                    name="b",
+                    points=[BubblePoint(x=i, y=i * i, size=i + 1) for i in range(N)],
+                )
+            ]
+        ),
+        **_GEOMETRY,
+    ),
+    "category": ChartModel(
+        chart_type="line",
+        category_data=CategoryChartDataModel(
+            categories=[f"c{i}" for i in range(N)],
+            series=[CategorySeriesModel(name="v", values=[float(i) for i in range(N)])],
+        ),
+        **_GEOMETRY,
+    ),
+}
+_DATA_FIELDS = ("xy_data", "bubble_data", "category_data")
+
+
+def _with_data(model: ChartModel, **update) -> ChartModel:
+    field = next(f for f in _DATA_FIELDS if getattr(model, f) is not None)
+    data = getattr(model, field)
+    return model.model_copy(update={field: data.model_copy(update=update)})
+
+
+def _chart(model: ChartModel):
+    prs = PresentationModel(slides=[SlideModel(shapes=[model])]).build_presentation()
+    return next(shape for shape in prs.slides[0].shapes if shape.has_chart).chart
+
+
+@pytest.mark.parametrize("model", _MODELS.values(), ids=_MODELS.keys())
+def test_update_workbook_only_writes_what_a_rebuild_would(model):
+    chart = _chart(model)
+    downsampled = _with_data(model, downsample=Downsample(points=4))
+    assert downsampled.update_workbook_only(chart)
+    rows = _values(chart.part.chart_workbook.xlsx_part.blob)
+    want = _values(_chart(downsampled).part.chart_workbook.xlsx_part.blob)
+    assert len(want) == 5
+    # the rows past the four points written are blanked, not left stale
+    assert rows == want + [[None] * len(want[0])] * (N - 4)
+    assert chart.part.chart_workbook.xlsx_part.partname in {
+        p.partname for p in chart.part.package.iter_parts()
+    }
+
+
+def test_update_workbook_only_without_a_workbook():
+    chart = _chart(_MODELS["xy"])
+    chart.part.chart_workbook._chartSpace._remove_externalData()
+    assert not _MODELS["xy"].update_workbook_only(chart)